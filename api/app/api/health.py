@@ -1,4 +1,9 @@
-from fastapi import APIRouter
+from typing import Any
+
+from fastapi import APIRouter, Depends
+
+from app.api.deps import require_app_password
+from app.services.extraction_cache import get_extraction_cache
 
 router = APIRouter(tags=["health"])
 
@@ -6,3 +11,8 @@ router = APIRouter(tags=["health"])
 @router.get("/health")
 def health() -> dict[str, str]:
     return {"status": "ok"}
+
+
+@router.get("/health/extraction-cache", dependencies=[Depends(require_app_password)])
+def extraction_cache_stats() -> dict[str, Any]:
+    return get_extraction_cache().stats()
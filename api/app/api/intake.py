@@ -1,17 +1,33 @@
+import json
+from collections.abc import AsyncIterable, AsyncIterator, Iterable
+from typing import Any, Literal
 from uuid import uuid4
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
 from sqlalchemy import select
 from sqlalchemy.orm import Session
+from starlette.requests import ClientDisconnect
+from starlette.types import Receive, Scope, Send
 
+from app.adapters.base import IntakeAdapter
 from app.adapters.internal import InternalIntakeAdapter
 from app.adapters.vapi import VapiIntakeAdapter
-from app.api.deps import require_webhook_secret
+from app.api.deps import require_app_password, require_webhook_secret
 from app.config import get_settings
-from app.db import get_session
+from app.db import SessionLocal, get_session
 from app.models.respondent import Respondent
-from app.schemas.intake import IntakeResponse, SessionRequest, SessionResponse
+from app.schemas.intake import (
+    BatchIntakeItemResult,
+    BatchIntakeResponse,
+    CanonicalIntake,
+    IntakeResponse,
+    SessionRequest,
+    SessionResponse,
+)
 from app.schemas.payloads import InternalIntakePayload, VapiIntakePayload
+from app.services.aggregates import move_respondent_team
 from app.services.ingestion import IntakeIngestionService
 
 router = APIRouter(prefix="/intake", tags=["intake"])
@@ -36,6 +52,216 @@ async def intake_internal(payload: InternalIntakePayload, session: Session = Dep
     return IntakeResponse(interview_id=interview_id, respondent_id=respondent_id, pain_point_ids=pain_point_ids)
 
 
+INTAKE_CHANNELS: dict[str, tuple[type[BaseModel], IntakeAdapter]] = {
+    "vapi": (VapiIntakePayload, VapiIntakeAdapter()),
+    "internal": (InternalIntakePayload, InternalIntakeAdapter()),
+}
+
+
+def _parse_batch_body(body: bytes, content_type: str) -> list[Any]:
+    """Split a batch body into raw records; NDJSON lines that fail to parse become exceptions."""
+    if "ndjson" in content_type or "jsonl" in content_type:
+        return [record for record in map(_decode_ndjson_line, body.splitlines()) if record is not None]
+
+    try:
+        data = json.loads(body or b"[]")
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail="Body must be a JSON array or NDJSON") from exc
+    if not isinstance(data, list):
+        raise HTTPException(status_code=400, detail="Body must be a JSON array or NDJSON")
+    return data
+
+
+def _decode_ndjson_line(line: bytes) -> Any:
+    """Decode one NDJSON line; blank lines give None and bad JSON gives the exception."""
+    if not line.strip():
+        return None
+    try:
+        return json.loads(line)
+    except ValueError as exc:
+        return exc
+
+
+async def _iter_ndjson_records(chunks: AsyncIterable[bytes], max_line_bytes: int) -> AsyncIterator[tuple[int, Any]]:
+    """Split a streamed NDJSON body into indexed records, holding at most one line in memory.
+
+    A line longer than ``max_line_bytes`` is reported as a single failed record and
+    the rest of it is discarded up to the next newline.
+    """
+    buffer = bytearray()
+    index = 0
+    skipping = False
+    async for chunk in chunks:
+        buffer += chunk
+        while (newline := buffer.find(b"\n")) != -1:
+            line = bytes(buffer[:newline])
+            del buffer[: newline + 1]
+            if skipping:
+                skipping = False
+                continue
+            record = _decode_ndjson_line(line)
+            if record is not None:
+                yield index, record
+                index += 1
+        if len(buffer) > max_line_bytes:
+            if not skipping:
+                yield index, ValueError(f"Line exceeds {max_line_bytes} bytes")
+                index += 1
+            skipping = True
+            buffer.clear()
+
+    record = None if skipping else _decode_ndjson_line(bytes(buffer))
+    if record is not None:
+        yield index, record
+
+
+async def _iter_async(items: Iterable[Any]) -> AsyncIterator[Any]:
+    for item in items:
+        yield item
+
+
+def _to_canonical(record: Any, channel: str) -> CanonicalIntake:
+    if isinstance(record, Exception):
+        raise record
+    payload_model, adapter = INTAKE_CHANNELS[channel]
+    return adapter.to_canonical(payload_model.model_validate(record).model_dump())
+
+
+def _chunk_results(
+    pending: list[tuple[int, CanonicalIntake]],
+    outcomes: list[tuple[int, int, list[int]] | Exception],
+) -> list[BatchIntakeItemResult]:
+    results: list[BatchIntakeItemResult] = []
+    for (index, _), outcome in zip(pending, outcomes):
+        if isinstance(outcome, Exception):
+            results.append(BatchIntakeItemResult(index=index, ok=False, error=str(outcome) or type(outcome).__name__))
+        else:
+            interview_id, respondent_id, pain_point_ids = outcome
+            results.append(
+                BatchIntakeItemResult(
+                    index=index,
+                    ok=True,
+                    interview_id=interview_id,
+                    respondent_id=respondent_id,
+                    pain_point_ids=pain_point_ids,
+                )
+            )
+    return results
+
+
+async def _ingest_record_chunks(
+    session: Session,
+    records: AsyncIterable[tuple[int, Any]],
+    channel: str,
+) -> AsyncIterator[list[BatchIntakeItemResult]]:
+    """Ingest records in chunks of ``INTAKE_BATCH_CHUNK_SIZE``, yielding each chunk's results.
+
+    The next record is only pulled once the current chunk is committed, so a
+    streamed body is read no faster than it can be written.
+    """
+    chunk_size = max(1, get_settings().intake_batch_chunk_size)
+    results: list[BatchIntakeItemResult] = []
+    pending: list[tuple[int, CanonicalIntake]] = []
+
+    async for index, record in records:
+        try:
+            pending.append((index, _to_canonical(record, channel)))
+        except (ValueError, TypeError) as exc:
+            results.append(BatchIntakeItemResult(index=index, ok=False, error=str(exc)))
+        if len(pending) + len(results) >= chunk_size:
+            if pending:
+                outcomes = await ingestion_service.ingest_chunk(session, [canonical for _, canonical in pending])
+                results.extend(_chunk_results(pending, outcomes))
+                pending = []
+            yield sorted(results, key=lambda result: result.index)
+            results = []
+
+    if pending:
+        outcomes = await ingestion_service.ingest_chunk(session, [canonical for _, canonical in pending])
+        results.extend(_chunk_results(pending, outcomes))
+    if results:
+        yield sorted(results, key=lambda result: result.index)
+
+
+async def _ingest_records(session: Session, records: Iterable[tuple[int, Any]], channel: str) -> list[BatchIntakeItemResult]:
+    return [result async for chunk in _ingest_record_chunks(session, _iter_async(records), channel) for result in chunk]
+
+
+async def _stream_progress(session: Session, chunks: AsyncIterable[bytes], channel: str) -> AsyncIterator[bytes]:
+    """Yield one NDJSON progress line per ingested chunk, then a summary line."""
+    settings = get_settings()
+    received = ingested = 0
+    records = _iter_ndjson_records(chunks, settings.intake_stream_max_line_bytes)
+    async for results in _ingest_record_chunks(session, records, channel):
+        received += len(results)
+        ingested += sum(1 for result in results if result.ok)
+        progress = {
+            "type": "progress",
+            "received": received,
+            "ingested": ingested,
+            "failed": received - ingested,
+            "results": [result.model_dump() for result in results],
+        }
+        yield (json.dumps(progress) + "\n").encode()
+    summary = {"type": "summary", "received": received, "ingested": ingested, "failed": received - ingested}
+    yield (json.dumps(summary) + "\n").encode()
+
+
+class _RequestStreamingResponse(StreamingResponse):
+    """StreamingResponse whose body is produced while the request body is still being read.
+
+    Starlette normally listens on ``receive`` for disconnects alongside the body
+    iterator, which would swallow request body messages here. The iterator is
+    the only reader instead; a disconnect surfaces as ``ClientDisconnect``.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await self.stream_response(send)
+
+
+@router.post("/batch", response_model=BatchIntakeResponse, dependencies=[Depends(require_app_password)])
+async def intake_batch(
+    request: Request,
+    channel: Literal["vapi", "internal"] = Query(default="internal"),
+    session: Session = Depends(get_session),
+) -> BatchIntakeResponse:
+    """Bulk intake for backfills: accepts a JSON array or NDJSON (one payload per line).
+
+    Items are canonicalised through the channel adapter and written in chunks of
+    ``INTAKE_BATCH_CHUNK_SIZE``; each item gets its own result entry.
+    """
+    records = _parse_batch_body(await request.body(), request.headers.get("content-type", ""))
+    if len(records) > get_settings().intake_batch_max_items:
+        raise HTTPException(status_code=413, detail="Too many items in batch")
+
+    results = await _ingest_records(session, enumerate(records), channel)
+    ingested = sum(1 for result in results if result.ok)
+    return BatchIntakeResponse(received=len(results), ingested=ingested, failed=len(results) - ingested, results=results)
+
+
+@router.post("/stream", dependencies=[Depends(require_app_password)])
+async def intake_stream(
+    request: Request,
+    channel: Literal["vapi", "internal"] = Query(default="internal"),
+) -> StreamingResponse:
+    """Streaming NDJSON intake for exports too large to send as one batch.
+
+    The body is read incrementally and ingested in chunks of
+    ``INTAKE_BATCH_CHUNK_SIZE``; one progress line is written back per chunk.
+    """
+
+    async def body() -> AsyncIterator[bytes]:
+        # The request-scoped session is closed before a streaming body runs.
+        with SessionLocal() as session:
+            try:
+                async for line in _stream_progress(session, request.stream(), channel):
+                    yield line
+            except ClientDisconnect:
+                session.rollback()
+
+    return _RequestStreamingResponse(body(), media_type="application/x-ndjson")
+
+
 @router.post("/session", response_model=SessionResponse)
 def create_session(request: SessionRequest, session: Session = Depends(get_session)) -> SessionResponse:
     """Create a session for voice intake before VAPI call starts.
@@ -63,6 +289,7 @@ def create_session(request: SessionRequest, session: Session = Depends(get_sessi
         # Update existing respondent with new info
         if request.name:
             respondent.name = request.name
+        move_respondent_team(session, respondent.id, respondent.team, request.team)
         respondent.team = request.team
         respondent.role = request.role
         if request.location:
@@ -1,22 +1,30 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, undefer
 
 from app.api.deps import require_app_password
-from app.db import get_session
+from app.db import get_read_session, get_session
 from app.models.interview import Interview
 from app.schemas.interview import InterviewCreate, InterviewRead, InterviewUpdate
+from app.services.aggregates import remove_interview
+from app.services.quotes import sync_quote
 
 router = APIRouter(prefix="/interviews", tags=["interviews"], dependencies=[Depends(require_app_password)])
 
 
 @router.get("", response_model=list[InterviewRead])
-def list_interviews(session: Session = Depends(get_session)) -> list[Interview]:
-    return session.scalars(select(Interview).order_by(Interview.created_at.desc())).all()
+def list_interviews(session: Session = Depends(get_read_session)) -> list[Interview]:
+    # The response includes transcripts, so fetch them with the rows instead of one lazy load per interview.
+    stmt = (
+        select(Interview)
+        .options(undefer(Interview.transcript_raw), undefer(Interview.transcript_redacted))
+        .order_by(Interview.created_at.desc())
+    )
+    return session.scalars(stmt).all()
 
 
 @router.get("/{interview_id}", response_model=InterviewRead)
-def get_interview(interview_id: int, session: Session = Depends(get_session)) -> Interview:
+def get_interview(interview_id: int, session: Session = Depends(get_read_session)) -> Interview:
     interview = session.get(Interview, interview_id)
     if interview is None:
         raise HTTPException(status_code=404, detail="Interview not found")
@@ -26,6 +34,7 @@ def get_interview(interview_id: int, session: Session = Depends(get_session)) ->
 @router.post("", response_model=InterviewRead)
 def create_interview(payload: InterviewCreate, session: Session = Depends(get_session)) -> Interview:
     interview = Interview(**payload.model_dump())
+    sync_quote(interview)
     session.add(interview)
     session.commit()
     session.refresh(interview)
@@ -38,8 +47,11 @@ def update_interview(interview_id: int, payload: InterviewUpdate, session: Sessi
     if interview is None:
         raise HTTPException(status_code=404, detail="Interview not found")
 
-    for field, value in payload.model_dump(exclude_unset=True).items():
+    updates = payload.model_dump(exclude_unset=True)
+    for field, value in updates.items():
         setattr(interview, field, value)
+    if "transcript_redacted" in updates:
+        sync_quote(interview)
 
     session.add(interview)
     session.commit()
@@ -52,6 +64,7 @@ def delete_interview(interview_id: int, session: Session = Depends(get_session))
     interview = session.get(Interview, interview_id)
     if interview is None:
         raise HTTPException(status_code=404, detail="Interview not found")
+    remove_interview(session, interview)
     session.delete(interview)
     session.commit()
     return {"ok": True}
@@ -1,76 +1,118 @@
+import base64
+
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import desc, select
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import and_, desc, func, or_, select
+from sqlalchemy.orm import Session, joinedload, undefer
 
 from app.api.deps import require_app_password
-from app.db import get_session
+from app.db import get_read_session, get_session
+from app.models.enums import PainCategoryEnum
 from app.models.interview import Interview
 from app.models.pain_point import PainPoint
 from app.models.respondent import Respondent
 from app.models.score import Score
 from app.schemas.pain_point import PainPointCreate, PainPointRead, PainPointUpdate
 from app.schemas.pain_point_detail import PainPointDetail
-from app.schemas.views import PainPointListItem
+from app.schemas.views import PainPointListItem, PainPointListPage
+from app.services.aggregates import apply_contribution_change, pain_point_contribution
 from app.services.scoring import upsert_score
 
 router = APIRouter(prefix="/pain-points", tags=["pain-points"], dependencies=[Depends(require_app_password)])
 
 
-@router.get("", response_model=list[PainPointListItem])
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+def _encode_cursor(priority: float, pain_point_id: int) -> str:
+    return base64.urlsafe_b64encode(f"{priority!r}:{pain_point_id}".encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[float, int]:
+    try:
+        priority, pain_point_id = base64.urlsafe_b64decode(cursor.encode()).decode().split(":", 1)
+        return float(priority), int(pain_point_id)
+    except (ValueError, UnicodeDecodeError) as exc:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from exc
+
+
+@router.get("", response_model=PainPointListPage)
 def list_pain_points(
     team: str | None = Query(default=None),
-    category: str | None = Query(default=None),
+    category: PainCategoryEnum | None = Query(default=None),
     priority_min: float | None = Query(default=None),
-    session: Session = Depends(get_session),
-) -> list[PainPointListItem]:
+    cursor: str | None = Query(default=None),
+    limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    session: Session = Depends(get_read_session),
+) -> PainPointListPage:
+    # Unscored pain points rank as priority 0, matching the dashboard backlog ordering.
+    priority = func.coalesce(Score.priority_score, 0.0)
     stmt = (
-        select(PainPoint)
-        .options(
-            joinedload(PainPoint.interview).joinedload(Interview.respondent),
-            joinedload(PainPoint.score),
+        select(
+            PainPoint.id,
+            PainPoint.title,
+            PainPoint.category,
+            PainPoint.sensitive_flag,
+            Respondent.team,
+            Respondent.role,
+            Score.priority_score,
+            Score.impact_hours_per_week,
+            Score.effort_score,
+            Score.confidence_score,
+            Score.quick_win,
+            priority.label("sort_priority"),
         )
-        .order_by(desc(PainPoint.created_at))
+        .select_from(PainPoint)
+        .outerjoin(Interview, Interview.id == PainPoint.interview_id)
+        .outerjoin(Respondent, Respondent.id == Interview.respondent_id)
+        .outerjoin(Score, Score.pain_point_id == PainPoint.id)
     )
 
-    items = session.scalars(stmt).all()
-    results: list[PainPointListItem] = []
-    for item in items:
-        respondent = item.interview.respondent if item.interview else None
-        score = item.score
-
-        if team and (not respondent or respondent.team != team):
-            continue
-        if category and item.category.value != category:
-            continue
-        if priority_min is not None and (not score or score.priority_score < priority_min):
-            continue
-
-        results.append(
-            PainPointListItem(
-                id=item.id,
-                title=item.title,
-                category=item.category,
-                team=respondent.team if respondent else "Unknown",
-                role=respondent.role if respondent else "Unknown",
-                priority_score=score.priority_score if score else None,
-                impact_hours_per_week=score.impact_hours_per_week if score else None,
-                effort_score=score.effort_score if score else None,
-                confidence_score=score.confidence_score if score else None,
-                quick_win=score.quick_win if score else False,
-                sensitive_flag=item.sensitive_flag,
-            )
+    if team:
+        stmt = stmt.where(Respondent.team == team)
+    if category:
+        stmt = stmt.where(PainPoint.category == category)
+    if priority_min is not None:
+        stmt = stmt.where(Score.priority_score >= priority_min)
+    if cursor:
+        after_priority, after_id = _decode_cursor(cursor)
+        stmt = stmt.where(or_(priority < after_priority, and_(priority == after_priority, PainPoint.id < after_id)))
+
+    # Fetch one extra row to learn whether another page exists without a count query.
+    stmt = stmt.order_by(desc(priority), desc(PainPoint.id)).limit(limit + 1)
+    rows = session.execute(stmt).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = _encode_cursor(rows[-1].sort_priority, rows[-1].id)
+
+    items = [
+        PainPointListItem(
+            id=row.id,
+            title=row.title,
+            category=row.category,
+            team=row.team or "Unknown",
+            role=row.role or "Unknown",
+            priority_score=row.priority_score,
+            impact_hours_per_week=row.impact_hours_per_week,
+            effort_score=row.effort_score,
+            confidence_score=row.confidence_score,
+            quick_win=bool(row.quick_win),
+            sensitive_flag=row.sensitive_flag,
         )
-
-    return sorted(results, key=lambda row: row.priority_score or 0, reverse=True)
+        for row in rows
+    ]
+    return PainPointListPage(items=items, next_cursor=next_cursor)
 
 
 @router.get("/{pain_point_id}", response_model=PainPointDetail)
-def get_pain_point(pain_point_id: int, session: Session = Depends(get_session)) -> PainPointDetail:
+def get_pain_point(pain_point_id: int, session: Session = Depends(get_read_session)) -> PainPointDetail:
     stmt = (
         select(PainPoint)
         .where(PainPoint.id == pain_point_id)
         .options(
-            joinedload(PainPoint.interview).joinedload(Interview.respondent),
+            joinedload(PainPoint.interview).options(undefer(Interview.transcript_redacted), joinedload(Interview.respondent)),
             joinedload(PainPoint.score),
         )
     )
@@ -132,12 +174,13 @@ def update_pain_point(pain_point_id: int, payload: PainPointUpdate, session: Ses
     if pain_point is None:
         raise HTTPException(status_code=404, detail="Pain point not found")
 
+    previous = pain_point_contribution(session, pain_point)
     for field, value in payload.model_dump(exclude_unset=True).items():
         setattr(pain_point, field, value)
 
     session.add(pain_point)
     session.flush()
-    upsert_score(session, pain_point)
+    upsert_score(session, pain_point, previous=previous)
     session.commit()
     session.refresh(pain_point)
     return pain_point
@@ -149,6 +192,7 @@ def delete_pain_point(pain_point_id: int, session: Session = Depends(get_session
     if pain_point is None:
         raise HTTPException(status_code=404, detail="Pain point not found")
 
+    apply_contribution_change(session, pain_point_contribution(session, pain_point), None)
     session.delete(pain_point)
     session.commit()
     return {"ok": True}
@@ -1,28 +1,34 @@
 import json
 import logging
+from collections.abc import Callable
+from functools import lru_cache
 from io import BytesIO
 from pathlib import Path
 from typing import Any, Literal
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
-from fastapi.responses import HTMLResponse, Response
-from fastapi.templating import Jinja2Templates
+from fastapi.responses import FileResponse, HTMLResponse, Response
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.api.deps import require_app_password, require_webhook_secret
 from app.config import get_settings
-from app.db import get_session
+from app.db import get_read_session, get_session, read_sessions
 from app.models.report_run import ReportRun
-from app.schemas.report import AttachReportRequest, ReportRunResponse
-from app.services.analytics import report_context
+from app.schemas.report import AttachReportRequest, ReportJobResponse, ReportRunResponse
+from app.services.analytics import report_context, report_data_version
+from app.services.report_assets import ReportAssets
+from app.services.report_cache import ReportRenderCache, build_report_etag, etag_matches
+from app.services.report_jobs import JOB_COMPLETED, JOB_SOURCE, ReportJobService
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["report"], dependencies=[Depends(require_app_password)])
-templates = Jinja2Templates(directory=str(Path(__file__).resolve().parents[1] / "templates"))
 TEMPLATE_DIR = Path(__file__).resolve().parents[1] / "templates"
 REPORT_CSS_PATH = TEMPLATE_DIR / "report.css"
+report_cache = ReportRenderCache(max_entries=get_settings().report_cache_max_entries)
+report_assets = ReportAssets(TEMPLATE_DIR, REPORT_CSS_PATH, auto_reload=get_settings().report_assets_auto_reload)
+report_jobs = ReportJobService(read_session_factory=read_sessions.session)
 
 CURRENCY_SYMBOLS: dict[str, str] = {"GBP": "\u00a3", "USD": "$", "EUR": "\u20ac"}
 DEFAULT_CURRENCY = "GBP"
@@ -38,55 +44,137 @@ def _report_query_params(
     return hourly_rate, currency
 
 
+def _report_view_model(session: Session, hourly_rate: float, currency: Literal["GBP", "USD", "EUR"]) -> dict[str, Any]:
+    return _build_report_view_model(
+        report_context(session),
+        hourly_rate=hourly_rate,
+        currency=currency,
+        quick_win_threshold=get_settings().report_quickwin_impact_threshold_hours,
+    )
+
+
+@lru_cache(maxsize=1)
+def _weasyprint() -> Any | None:
+    """Import WeasyPrint once. A failed import (e.g. missing Pango) is remembered instead of retried per request."""
+    try:
+        import weasyprint  # type: ignore
+    except Exception:
+        logger.exception("PDF engine status: weasyprint unavailable; using reportlab fallback")
+        return None
+    logger.info("PDF engine status: weasyprint available")
+    return weasyprint
+
+
+def prewarm_pdf_engines() -> None:
+    """Load the template, stylesheet and PDF engine and render a tiny document before the first export."""
+    try:
+        report_assets.template("report.html")
+        weasyprint = _weasyprint()
+        if weasyprint is not None:
+            weasyprint.HTML(string="<p>warm-up</p>").write_pdf(stylesheets=[report_assets.weasyprint_css(weasyprint.CSS)])
+        else:
+            import reportlab.platypus  # noqa: F401
+    except Exception:
+        logger.exception("PDF engine pre-warm failed")
+
+
+def _render_report_pdf(context: dict[str, Any]) -> bytes:
+    try:
+        weasyprint = _weasyprint()
+        if weasyprint is not None:
+            # The stylesheet is passed pre-parsed instead of inlined, so WeasyPrint does not re-parse it per export.
+            html = report_assets.template("report.html").render(**{**context, "report_css": ""})
+            stylesheet = report_assets.weasyprint_css(weasyprint.CSS)
+            return weasyprint.HTML(string=html, base_url=str(TEMPLATE_DIR)).write_pdf(stylesheets=[stylesheet])
+    except Exception:
+        logger.exception("PDF engine status: weasyprint failed; attempting reportlab fallback")
+
+    try:
+        return _build_reportlab_pdf(context)
+    except Exception as fallback_exc:
+        logger.exception("PDF engine status: reportlab fallback failed")
+        raise HTTPException(
+            status_code=500,
+            detail="PDF export is currently unavailable. HTML report remains available at /report.html.",
+        ) from fallback_exc
+
+
+def _report_etag(kind: str, session: Session, hourly_rate: float, currency: Literal["GBP", "USD", "EUR"]) -> str:
+    quick_win_threshold = get_settings().report_quickwin_impact_threshold_hours
+    return build_report_etag(kind, report_data_version(session), hourly_rate, currency, quick_win_threshold)
+
+
+def _render_cached(
+    etag: str,
+    session: Session,
+    hourly_rate: float,
+    currency: Literal["GBP", "USD", "EUR"],
+    render: Callable[[dict[str, Any]], bytes],
+) -> bytes:
+    content = report_cache.get(etag)
+    if content is None:
+        content = render(_report_view_model(session, hourly_rate, currency))
+        report_cache.put(etag, content)
+    return content
+
+
+def _cached_report(
+    kind: str,
+    request: Request,
+    session: Session,
+    hourly_rate: float,
+    currency: Literal["GBP", "USD", "EUR"],
+    render: Callable[[dict[str, Any]], bytes],
+    media_type: str,
+    headers: dict[str, str] | None = None,
+) -> Response:
+    """Serve a rendered report, reusing cached bytes while the underlying data is unchanged."""
+    etag = _report_etag(kind, session, hourly_rate, currency)
+    response_headers = {"ETag": etag, "Cache-Control": "private, no-cache", **(headers or {})}
+
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=response_headers)
+
+    content = _render_cached(etag, session, hourly_rate, currency, render)
+    return Response(content=content, media_type=media_type, headers=response_headers)
+
+
 @router.get("/report", response_class=HTMLResponse)
 @router.get("/report.html", response_class=HTMLResponse)
 def get_report(
     request: Request,
     params: tuple[float, Literal["GBP", "USD", "EUR"]] = Depends(_report_query_params),
-    session: Session = Depends(get_session),
-) -> HTMLResponse:
+    session: Session = Depends(get_read_session),
+) -> Response:
     hourly_rate, currency = params
-    context = _build_report_view_model(
-        report_context(session),
-        hourly_rate=hourly_rate,
-        currency=currency,
-        quick_win_threshold=get_settings().report_quickwin_impact_threshold_hours,
+    return _cached_report(
+        "html",
+        request,
+        session,
+        hourly_rate,
+        currency,
+        render=lambda context: report_assets.template("report.html").render(**context).encode("utf-8"),
+        media_type="text/html; charset=utf-8",
     )
-    return templates.TemplateResponse(name="report.html", context={"request": request, **context})
 
 
 @router.get("/report.pdf")
 def get_report_pdf(
+    request: Request,
     params: tuple[float, Literal["GBP", "USD", "EUR"]] = Depends(_report_query_params),
-    session: Session = Depends(get_session),
+    session: Session = Depends(get_read_session),
 ) -> Response:
     hourly_rate, currency = params
-    context = _build_report_view_model(
-        report_context(session),
-        hourly_rate=hourly_rate,
-        currency=currency,
-        quick_win_threshold=get_settings().report_quickwin_impact_threshold_hours,
+    return _cached_report(
+        "pdf",
+        request,
+        session,
+        hourly_rate,
+        currency,
+        render=_render_report_pdf,
+        media_type="application/pdf",
+        headers={"Content-Disposition": "attachment; filename=friction-finder-report.pdf"},
     )
-    html = templates.get_template("report.html").render(**context)
-
-    try:
-        from weasyprint import HTML  # type: ignore
-
-        logger.info("PDF engine status: weasyprint available")
-        pdf = HTML(string=html, base_url=str(TEMPLATE_DIR)).write_pdf()
-    except Exception:
-        logger.exception("PDF engine status: weasyprint unavailable or failed; attempting reportlab fallback")
-        try:
-            pdf = _build_reportlab_pdf(context)
-        except Exception as fallback_exc:
-            logger.exception("PDF engine status: reportlab fallback failed")
-            raise HTTPException(
-                status_code=500,
-                detail="PDF export is currently unavailable. HTML report remains available at /report.html.",
-            ) from fallback_exc
-
-    headers = {"Content-Disposition": "attachment; filename=friction-finder-report.pdf"}
-    return Response(content=pdf, media_type="application/pdf", headers=headers)
 
 
 def _build_reportlab_pdf(context: dict[str, Any]) -> bytes:
@@ -479,13 +567,9 @@ def _build_report_view_model(
         width = (count / max_category_total * 100) if max_category_total else 0
         category_rows.append({**row, "count_fmt": str(count), "bar_width_pct": _fmt_number(width, 0)})
 
-    css_text = ""
-    if REPORT_CSS_PATH.exists():
-        css_text = REPORT_CSS_PATH.read_text(encoding="utf-8")
-
     return {
         **context,
-        "report_css": css_text,
+        "report_css": report_assets.css_text(),
         "hourly_rate": _fmt_number(hourly_rate, 0),
         "currency_code": currency,
         "currency_symbol": CURRENCY_SYMBOLS.get(currency, currency),
@@ -509,9 +593,62 @@ def _build_report_view_model(
     }
 
 
+def _report_job_response(report_run: ReportRun) -> ReportJobResponse:
+    download_url = f"/report/jobs/{report_run.id}/pdf" if report_run.status == JOB_COMPLETED else None
+    return ReportJobResponse(
+        id=report_run.id,
+        status=report_run.status,
+        created_at=report_run.created_at,
+        session_id=report_run.session_id,
+        download_url=download_url,
+        error=report_run.error,
+    )
+
+
+@router.post("/report/jobs", response_model=ReportJobResponse, status_code=202)
+def create_report_job(
+    params: tuple[float, Literal["GBP", "USD", "EUR"]] = Depends(_report_query_params),
+    session_id: str | None = Query(default=None),
+    session: Session = Depends(get_session),
+) -> ReportJobResponse:
+    hourly_rate, currency = params
+
+    def render(job_session: Session) -> bytes:
+        etag = _report_etag("pdf", job_session, hourly_rate, currency)
+        return _render_cached(etag, job_session, hourly_rate, currency, _render_report_pdf)
+
+    report_run = report_jobs.submit(session, render, session_id=session_id)
+    return _report_job_response(report_run)
+
+
+@router.get("/report/jobs/{job_id}", response_model=ReportJobResponse)
+def get_report_job(job_id: int, session: Session = Depends(get_session)) -> ReportJobResponse:
+    report_run = session.get(ReportRun, job_id)
+    if report_run is None or report_run.source != JOB_SOURCE:
+        raise HTTPException(status_code=404, detail="Report job not found")
+    return _report_job_response(report_run)
+
+
+@router.get("/report/jobs/{job_id}/pdf")
+def get_report_job_pdf(job_id: int, session: Session = Depends(get_session)) -> FileResponse:
+    report_run = session.get(ReportRun, job_id)
+    if report_run is None or report_run.source != JOB_SOURCE:
+        raise HTTPException(status_code=404, detail="Report job not found")
+    if report_run.status != JOB_COMPLETED or not report_run.pdf_path_or_url:
+        raise HTTPException(status_code=409, detail=f"Report job is {report_run.status}")
+
+    # Only files the job service wrote under REPORT_OUTPUT_DIR are ever served.
+    path = report_jobs.output_file(report_run)
+    if path is None:
+        raise HTTPException(status_code=404, detail="Report job not found")
+    if not path.is_file():
+        raise HTTPException(status_code=410, detail="Report file is no longer available")
+    return FileResponse(path, media_type="application/pdf", filename="friction-finder-report.pdf")
+
+
 @router.get("/report/latest", response_model=ReportRunResponse, dependencies=[Depends(require_app_password)])
 def get_latest_report(session_id: str | None = None, session: Session = Depends(get_session)) -> ReportRunResponse:
-    query = select(ReportRun)
+    query = select(ReportRun).where(ReportRun.status == JOB_COMPLETED)
     if session_id:
         query = query.where(ReportRun.session_id == session_id)
     query = query.order_by(ReportRun.created_at.desc())
@@ -529,6 +666,7 @@ def get_latest_report(session_id: str | None = None, session: Session = Depends(
         pdf_path_or_url=report_run.pdf_path_or_url,
         summary=report_run.summary,
         recommendations_json=report_run.recommendations_json,
+        status=report_run.status,
     )
 
 
@@ -563,4 +701,5 @@ def attach_report(
         pdf_path_or_url=report_run.pdf_path_or_url,
         summary=report_run.summary,
         recommendations_json=report_run.recommendations_json,
+        status=report_run.status,
     )
@@ -6,6 +6,7 @@ from app.api.deps import require_app_password
 from app.db import get_session
 from app.models.respondent import Respondent
 from app.schemas.respondent import RespondentCreate, RespondentRead, RespondentUpdate
+from app.services.aggregates import move_respondent_team, remove_respondent
 
 router = APIRouter(prefix="/respondents", tags=["respondents"], dependencies=[Depends(require_app_password)])
 
@@ -38,10 +39,12 @@ def update_respondent(respondent_id: int, payload: RespondentUpdate, session: Se
     if respondent is None:
         raise HTTPException(status_code=404, detail="Respondent not found")
 
+    old_team = respondent.team
     for field, value in payload.model_dump(exclude_unset=True).items():
         setattr(respondent, field, value)
 
     session.add(respondent)
+    move_respondent_team(session, respondent.id, old_team, respondent.team)
     session.commit()
     session.refresh(respondent)
     return respondent
@@ -52,6 +55,7 @@ def delete_respondent(respondent_id: int, session: Session = Depends(get_session
     respondent = session.get(Respondent, respondent_id)
     if respondent is None:
         raise HTTPException(status_code=404, detail="Respondent not found")
+    remove_respondent(session, respondent)
     session.delete(respondent)
     session.commit()
     return {"ok": True}
@@ -9,6 +9,21 @@ class Settings(BaseSettings):
     app_name: str = "Friction Finder API"
     environment: str = "dev"
     database_url: str = "sqlite:///./friction_finder.db"
+    # Optional read replica for read-only endpoints; reads fall back to the primary when it is down or lagging.
+    database_read_url: str | None = None
+    database_read_max_lag_seconds: float = 30.0
+    database_read_check_seconds: float = 5.0
+    # Pool sizing applies to server databases; SQLite gets the pragmas below instead.
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout_seconds: float = 30.0
+    db_pool_recycle_seconds: int = 1800
+    db_pool_pre_ping: bool = True
+    db_statement_timeout_ms: int = 30000
+    sqlite_journal_mode: Literal["delete", "truncate", "persist", "memory", "wal", "off"] = "wal"
+    sqlite_synchronous: Literal["off", "normal", "full", "extra"] = "normal"
+    sqlite_busy_timeout_ms: int = 5000
+    sqlite_mmap_size_bytes: int = 256 * 1024 * 1024
     app_password: str = "changeme"
 
     ai_provider: Literal["none", "openai", "ollama"] = "none"
@@ -18,13 +33,49 @@ class Settings(BaseSettings):
 
     ollama_base_url: str = "http://localhost:11434"
     ollama_model: str = "llama3.1"
+    llm_timeout_seconds: float = 30.0
+    extraction_chunk_chars: int = 12000
+    extraction_chunk_overlap_chars: int = 500
+    extraction_max_concurrent_chunks: int = 4
+    extraction_cache_backend: Literal["none", "memory", "sqlite"] = "memory"
+    extraction_cache_max_entries: int = 1024
+    extraction_cache_ttl_seconds: float = 7 * 24 * 3600
+    extraction_cache_path: str = "./extraction_cache.db"
+
+    http_client_http2: bool = True
+    http_client_max_connections_per_host: int = 20
+    http_client_max_keepalive_per_host: int = 10
+    http_client_keepalive_seconds: float = 30.0
+    http_client_connect_timeout_seconds: float = 5.0
 
     report_quickwin_impact_threshold_hours: float = 5.0
+    report_cache_max_entries: int = 32
+    report_output_dir: str = "./reports"
+    report_max_concurrent_renders: int = 2
+    report_job_heartbeat_seconds: float = 15.0
+    report_job_stale_seconds: float = 120.0
+    report_job_retention_days: float = 7.0
+    report_prewarm_pdf: bool = False
+    report_assets_auto_reload: bool = False
+
+    blocking_max_workers: int = 8
+
+    intake_batch_chunk_size: int = 200
+    intake_extraction_max_concurrency: int = 4
+    intake_batch_max_items: int = 10000
+    intake_stream_max_line_bytes: int = 1_000_000
 
     # Webhook security
     vapi_webhook_secret: str | None = None
     n8n_webhook_secret: str | None = None
     n8n_webhook_url: str | None = None
+    n8n_timeout_seconds: float = 5.0
+    n8n_outbox_batch_size: int = 50
+    n8n_outbox_max_attempts: int = 8
+    n8n_outbox_backoff_seconds: float = 5.0
+    n8n_outbox_max_backoff_seconds: float = 600.0
+    n8n_outbox_poll_seconds: float = 5.0
+    n8n_outbox_lease_seconds: float = 60.0
 
     cors_origins: list[str] = Field(default_factory=lambda: ["http://localhost:3000"])
 
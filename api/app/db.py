@@ -1,19 +1,158 @@
+import logging
+import threading
+import time
 from collections.abc import Generator
+from typing import Any
 
-from sqlalchemy import create_engine
+from sqlalchemy import Connection, Engine, create_engine, event, text
 from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
 
-from app.config import get_settings
+from app.config import Settings, get_settings
+
+logger = logging.getLogger(__name__)
 
 
 class Base(DeclarativeBase):
     pass
 
 
+def build_engine(settings: Settings) -> Engine:
+    """Create the engine for ``settings.database_url`` with pooling and per-connection tuning.
+
+    Server databases get a sized, pre-pinged, recycled pool and a statement
+    timeout. SQLite connections get WAL journaling, ``synchronous``, a busy
+    timeout and memory-mapped reads, so concurrent writers wait for the lock
+    instead of failing with "database is locked".
+    """
+    url = settings.database_url
+    if url.startswith("sqlite"):
+        engine = create_engine(
+            url,
+            future=True,
+            pool_pre_ping=settings.db_pool_pre_ping,
+            connect_args={"check_same_thread": False, "timeout": settings.sqlite_busy_timeout_ms / 1000},
+        )
+        event.listen(engine, "connect", _sqlite_pragmas(settings))
+        return engine
+
+    connect_args: dict[str, Any] = {}
+    if url.startswith("postgresql") and settings.db_statement_timeout_ms:
+        connect_args["options"] = f"-c statement_timeout={settings.db_statement_timeout_ms}"
+    return create_engine(
+        url,
+        future=True,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout_seconds,
+        pool_recycle=settings.db_pool_recycle_seconds,
+        pool_pre_ping=settings.db_pool_pre_ping,
+        connect_args=connect_args,
+    )
+
+
+def _sqlite_pragmas(settings: Settings) -> Any:
+    pragmas = [
+        f"PRAGMA journal_mode={settings.sqlite_journal_mode}",
+        f"PRAGMA synchronous={settings.sqlite_synchronous}",
+        f"PRAGMA busy_timeout={int(settings.sqlite_busy_timeout_ms)}",
+        f"PRAGMA mmap_size={int(settings.sqlite_mmap_size_bytes)}",
+    ]
+
+    def apply(dbapi_connection: Any, _connection_record: Any) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in pragmas:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+    return apply
+
+
+def replica_lag_seconds(connection: Connection) -> float:
+    """How far a replica's replayed data trails its primary. Only Postgres reports this; other backends return 0."""
+    if connection.dialect.name != "postgresql":
+        return 0.0
+    lag = connection.scalar(
+        text("SELECT COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) WHERE pg_is_in_recovery()")
+    )
+    return float(lag or 0.0)
+
+
+class ReadSessionRouter:
+    """Opens sessions for read-only work on the replica while it is reachable and fresh enough.
+
+    The replica is probed at most every ``check_seconds``. When it cannot be
+    reached, or trails the primary by more than ``max_lag_seconds``, sessions
+    are opened on the primary until a later probe succeeds. One caller runs
+    each probe, outside the lock; the others use the last known status
+    meanwhile, so a hung replica delays only the probing request. Without a
+    replica every session comes from the primary.
+    """
+
+    def __init__(
+        self,
+        primary: sessionmaker[Session],
+        replica: sessionmaker[Session] | None = None,
+        max_lag_seconds: float = 30.0,
+        check_seconds: float = 5.0,
+    ) -> None:
+        self.primary = primary
+        self.replica = replica
+        self.max_lag_seconds = max_lag_seconds
+        self.check_seconds = check_seconds
+        self._available = False
+        self._checked_at: float | None = None
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def session(self) -> Session:
+        if self.replica is not None and self.replica_available():
+            return self.replica()
+        return self.primary()
+
+    def replica_available(self) -> bool:
+        with self._lock:
+            now = time.monotonic()
+            due = self._checked_at is None or now - self._checked_at >= self.check_seconds
+            if not due or self._probing:
+                return self._available
+            self._probing = True
+
+        available = False
+        try:
+            available = self._probe()
+        finally:
+            with self._lock:
+                self._available = available
+                self._checked_at = time.monotonic()
+                self._probing = False
+        return available
+
+    def _probe(self) -> bool:
+        try:
+            with self.replica() as session:
+                lag = replica_lag_seconds(session.connection())
+        except Exception as exc:
+            logger.warning("Read replica unavailable, using primary: %s", exc)
+            return False
+        if lag > self.max_lag_seconds:
+            logger.warning("Read replica is %.1fs behind, using primary", lag)
+            return False
+        return True
+
+
 settings = get_settings()
-connect_args = {"check_same_thread": False} if settings.database_url.startswith("sqlite") else {}
-engine = create_engine(settings.database_url, future=True, connect_args=connect_args)
+engine = build_engine(settings)
 SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False, class_=Session)
+read_engine = build_engine(settings.model_copy(update={"database_url": settings.database_read_url})) if settings.database_read_url else None
+ReadSessionLocal = sessionmaker(bind=read_engine, autocommit=False, autoflush=False, class_=Session) if read_engine else None
+read_sessions = ReadSessionRouter(
+    SessionLocal,
+    ReadSessionLocal,
+    max_lag_seconds=settings.database_read_max_lag_seconds,
+    check_seconds=settings.database_read_check_seconds,
+)
 
 
 def get_session() -> Generator[Session, None, None]:
@@ -24,7 +163,16 @@ def get_session() -> Generator[Session, None, None]:
         session.close()
 
 
+def get_read_session() -> Generator[Session, None, None]:
+    """Session for read-only endpoints; may trail recent writes by up to DATABASE_READ_MAX_LAG_SECONDS."""
+    session = read_sessions.session()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
 def init_db() -> None:
-    from app.models import interview, pain_point, report_run, respondent, score  # noqa: F401
+    from app.migrations import run_migrations
 
-    Base.metadata.create_all(bind=engine)
+    run_migrations(engine)
@@ -1,13 +1,18 @@
+import threading
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.api import chatbot, dashboard, demo, health, intake, interviews, pain_points, report, respondents, scores
 from app.config import get_settings
-from app.db import init_db
+from app.db import SessionLocal, init_db
+from app.services.aggregates import ensure_dashboard_aggregates
+from app.services.http_client import http_clients
+from app.services.n8n_outbox import n8n_dispatcher
+from app.services.offload import shutdown_blocking_executor
 
 settings = get_settings()
 app = FastAPI(title=settings.app_name)
-init_db()
 origins = settings.cors_origins
 
 app.add_middleware(
@@ -22,6 +27,22 @@ app.add_middleware(
 @app.on_event("startup")
 def on_startup() -> None:
     init_db()
+    with SessionLocal() as session:
+        ensure_dashboard_aggregates(session)
+        report.report_jobs.fail_interrupted(session)
+        report.report_jobs.purge_expired(session)
+    n8n_dispatcher.start()
+    if settings.report_prewarm_pdf:
+        # Off the startup path, so the API accepts requests while the PDF engine loads.
+        threading.Thread(target=report.prewarm_pdf_engines, name="pdf-prewarm", daemon=True).start()
+
+
+@app.on_event("shutdown")
+async def on_shutdown() -> None:
+    report.report_jobs.shutdown()
+    await n8n_dispatcher.stop()
+    await http_clients.aclose()
+    shutdown_blocking_executor()
 
 
 @app.get("/")
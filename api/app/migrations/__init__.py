@@ -0,0 +1,113 @@
+import importlib
+import logging
+import pkgutil
+import re
+import time
+from collections.abc import Callable
+from typing import NamedTuple
+
+from sqlalchemy import Connection, Engine, text
+from sqlalchemy.exc import DBAPIError, OperationalError
+
+from app.migrations import versions
+
+logger = logging.getLogger(__name__)
+
+_VERSION_MODULE_RE = re.compile(r"^v(\d{4})_(\w+)$")
+# Arbitrary key for the Postgres advisory lock that serialises concurrent migrators.
+_POSTGRES_LOCK_KEY = 8_271_531
+# How long a migrator waits for SQLite's write lock while another process migrates.
+LOCK_WAIT_SECONDS = 600.0
+
+
+class Migration(NamedTuple):
+    version: int
+    name: str
+    upgrade: Callable[[Connection], None]
+
+
+def load_migrations() -> list[Migration]:
+    migrations: list[Migration] = []
+    for module_info in pkgutil.iter_modules(versions.__path__):
+        match = _VERSION_MODULE_RE.match(module_info.name)
+        if not match:
+            continue
+        module = importlib.import_module(f"{versions.__name__}.{module_info.name}")
+        migrations.append(Migration(int(match.group(1)), match.group(2), module.upgrade))
+    migrations.sort(key=lambda migration: migration.version)
+    if len({migration.version for migration in migrations}) != len(migrations):
+        raise RuntimeError("Duplicate migration version numbers")
+    return migrations
+
+
+def applied_versions(engine: Engine) -> set[int] | None:
+    """Versions recorded in ``schema_migrations``, or None when the table does not exist yet."""
+    try:
+        with engine.connect() as connection:
+            return set(connection.scalars(text("SELECT version FROM schema_migrations")))
+    except DBAPIError:
+        return None
+
+
+def run_migrations(engine: Engine) -> list[int]:
+    """Apply pending migrations in order, each in its own transaction. Returns the versions applied.
+
+    Each module in ``app.migrations.versions`` named ``v<NNNN>_<name>.py``
+    defines ``upgrade(connection)`` and spells out the tables it touches
+    instead of importing the models, so what a version does never changes
+    after it ships. Applied versions are recorded in ``schema_migrations``,
+    so a boot with nothing pending costs one SELECT. Each transaction first
+    takes a database-wide lock (an advisory lock on Postgres, ``BEGIN
+    IMMEDIATE`` on SQLite) and re-checks the version, so workers booting
+    together apply each migration once. Databases created before migrations
+    existed may already have some of a version's columns, so versions use the
+    idempotent helpers in ``app.migrations.ops``.
+    """
+    applied = applied_versions(engine)
+    migrations = load_migrations()
+    if applied is not None and all(migration.version in applied for migration in migrations):
+        return []
+
+    done: list[int] = []
+    for migration in migrations:
+        with engine.connect() as connection:
+            _lock(connection)
+            connection.execute(
+                text(
+                    "CREATE TABLE IF NOT EXISTS schema_migrations "
+                    "(version INTEGER PRIMARY KEY, name VARCHAR(255) NOT NULL, applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP)"
+                )
+            )
+            already = connection.scalar(
+                text("SELECT 1 FROM schema_migrations WHERE version = :version"), {"version": migration.version}
+            )
+            if already:
+                connection.rollback()
+                continue
+            logger.info("Applying migration %04d_%s", migration.version, migration.name)
+            migration.upgrade(connection)
+            connection.execute(
+                text("INSERT INTO schema_migrations (version, name) VALUES (:version, :name)"),
+                {"version": migration.version, "name": migration.name},
+            )
+            connection.commit()
+        done.append(migration.version)
+    return done
+
+
+def _lock(connection: Connection) -> None:
+    """Start the migration transaction holding a lock that excludes other migrators until it ends."""
+    if connection.dialect.name == "postgresql":
+        connection.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": _POSTGRES_LOCK_KEY})
+    elif connection.dialect.name == "sqlite":
+        # BEGIN IMMEDIATE takes SQLite's write lock up front. The driver gives up after its busy
+        # timeout, which a long migration in another process can outlast, so keep retrying.
+        deadline = time.monotonic() + LOCK_WAIT_SECONDS
+        while True:
+            try:
+                connection.exec_driver_sql("BEGIN IMMEDIATE")
+                return
+            except OperationalError as exc:
+                connection.rollback()
+                if "locked" not in str(exc) or time.monotonic() >= deadline:
+                    raise
@@ -0,0 +1,41 @@
+from sqlalchemy import Connection, inspect, text
+from sqlalchemy.types import TypeEngine
+
+
+def column_names(connection: Connection, table: str) -> set[str]:
+    return {column["name"] for column in inspect(connection).get_columns(table)}
+
+
+def index_names(connection: Connection, table: str) -> set[str]:
+    return {index["name"] for index in inspect(connection).get_indexes(table)}
+
+
+def add_column(
+    connection: Connection,
+    table: str,
+    name: str,
+    type_: TypeEngine,
+    *,
+    nullable: bool = True,
+    server_default: str | None = None,
+) -> bool:
+    """Add a column unless it already exists. ``server_default`` is a SQL literal. Returns whether it was added."""
+    if name in column_names(connection, table):
+        return False
+    quote = connection.dialect.identifier_preparer.quote
+    ddl = f"ALTER TABLE {quote(table)} ADD COLUMN {quote(name)} {type_.compile(dialect=connection.dialect)}"
+    if server_default is not None:
+        ddl += f" DEFAULT {server_default}"
+    if not nullable:
+        ddl += " NOT NULL"
+    connection.execute(text(ddl))
+    return True
+
+
+def create_index(connection: Connection, name: str, table: str, *columns: str) -> bool:
+    """Create an index unless one with this name already exists on the table. Returns whether it was created."""
+    if name in index_names(connection, table):
+        return False
+    quote = connection.dialect.identifier_preparer.quote
+    connection.execute(text(f"CREATE INDEX {quote(name)} ON {quote(table)} ({', '.join(quote(column) for column in columns)})"))
+    return True
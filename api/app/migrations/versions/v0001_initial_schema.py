@@ -0,0 +1,157 @@
+from sqlalchemy import (
+    JSON,
+    Boolean,
+    Column,
+    Connection,
+    DateTime,
+    Enum,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    LargeBinary,
+    MetaData,
+    String,
+    Table,
+    Text,
+    UniqueConstraint,
+)
+
+# The schema as of this version, written out rather than taken from the models so that
+# later model changes do not alter what this migration creates; those land in later versions.
+metadata = MetaData()
+
+CATEGORIES = ("onboarding", "approvals", "reporting", "comms", "finance_ops", "sales_ops", "client_ops", "access_mgmt", "other")
+
+Table(
+    "respondents",
+    metadata,
+    Column("id", Integer, primary_key=True, index=True),
+    Column("name", String(255)),
+    Column("email", String(255), index=True),
+    Column("team", String(120), nullable=False, index=True),
+    Column("role", String(120), nullable=False),
+    Column("location", String(120)),
+    Column("consent", Boolean, nullable=False),
+    Column("created_at", DateTime(timezone=True), nullable=False),
+    Index("ix_respondents_id_team", "id", "team"),
+)
+
+Table(
+    "interviews",
+    metadata,
+    Column("id", Integer, primary_key=True, index=True),
+    Column("respondent_id", ForeignKey("respondents.id", ondelete="CASCADE"), nullable=False, index=True),
+    Column("channel", Enum("vapi", "internal", "webform", name="channelenum"), nullable=False, index=True),
+    Column("started_at", DateTime(timezone=True)),
+    Column("ended_at", DateTime(timezone=True)),
+    Column("transcript_raw", LargeBinary),
+    Column("transcript_redacted", LargeBinary),
+    Column("quote_snippet", Text),
+    Column("quote_rank", Float, nullable=False),
+    Column("summary_text", Text, nullable=False),
+    Column("metadata_json", JSON, nullable=False),
+    Column("created_at", DateTime(timezone=True), nullable=False),
+)
+
+Table(
+    "pain_points",
+    metadata,
+    Column("id", Integer, primary_key=True, index=True),
+    Column("interview_id", ForeignKey("interviews.id", ondelete="CASCADE"), nullable=False, index=True),
+    Column("title", Text, nullable=False),
+    Column("title_key", Text, nullable=False, index=True),
+    Column("description", Text, nullable=False),
+    Column("category", Enum(*CATEGORIES, name="paincategoryenum"), nullable=False, index=True),
+    Column("frequency_per_week", Float, nullable=False),
+    Column("minutes_per_occurrence", Float, nullable=False),
+    Column("people_affected", Integer, nullable=False),
+    Column("systems_involved", JSON, nullable=False),
+    Column("current_workaround", Text),
+    Column("failure_modes", Text),
+    Column("success_definition", Text),
+    Column("sensitive_flag", Boolean, nullable=False),
+    Column("redaction_notes", Text),
+    Column("created_at", DateTime(timezone=True), nullable=False),
+    Index("ix_pain_points_created_at", "created_at"),
+    Index("ix_pain_points_category_created_at", "category", "created_at"),
+)
+
+Table(
+    "scores",
+    metadata,
+    Column("id", Integer, primary_key=True, index=True),
+    Column("pain_point_id", ForeignKey("pain_points.id", ondelete="CASCADE"), nullable=False, unique=True, index=True),
+    Column("impact_hours_per_week", Float, nullable=False),
+    Column("effort_score", Integer, nullable=False),
+    Column("confidence_score", Float, nullable=False),
+    Column("priority_score", Float, nullable=False, index=True),
+    Column("rationale", Text, nullable=False),
+    Column(
+        "automation_type",
+        Enum("low_code", "api_integration", "ai_assist", "internal_tool", "process_change", name="automationtypeenum"),
+        nullable=False,
+    ),
+    Column("suggested_solution", Text, nullable=False),
+    Column("dependencies", Text),
+    Column("owner_suggestion", Text),
+    Column("quick_win", Boolean, nullable=False),
+    Column("updated_at", DateTime(timezone=True), nullable=False),
+    Index("ix_scores_priority_score_quick_win", "priority_score", "quick_win"),
+)
+
+Table(
+    "report_runs",
+    metadata,
+    Column("id", Integer, primary_key=True, index=True),
+    Column("created_at", DateTime(timezone=True), nullable=False),
+    Column("source", String(50), nullable=False),
+    Column("interview_id", Integer, index=True),
+    Column("session_id", String(255), index=True),
+    Column("pdf_path_or_url", String(500)),
+    Column("summary", Text),
+    Column("recommendations_json", Text),
+    Column("status", String(20), nullable=False),
+    Column("error", Text),
+    Index("ix_report_runs_session_id_created_at", "session_id", "created_at"),
+)
+
+Table(
+    "dashboard_aggregates",
+    metadata,
+    Column("id", Integer, primary_key=True, index=True),
+    Column("team", String(120), nullable=False),
+    Column("category", Enum(*CATEGORIES, name="paincategoryenum"), nullable=False),
+    Column("pain_point_count", Integer, nullable=False),
+    Column("impact_hours_per_week", Float, nullable=False),
+    UniqueConstraint("team", "category", name="uq_dashboard_aggregates_team_category"),
+)
+
+Table(
+    "title_mentions",
+    metadata,
+    Column("title_key", Text, primary_key=True),
+    Column("mention_count", Integer, nullable=False),
+)
+
+Table(
+    "n8n_outbox",
+    metadata,
+    Column("id", Integer, primary_key=True, index=True),
+    Column("created_at", DateTime(timezone=True), nullable=False),
+    Column("interview_id", Integer, nullable=False),
+    Column("respondent_id", Integer, nullable=False),
+    Column("session_id", String(255)),
+    Column("status", String(20), nullable=False),
+    Column("attempts", Integer, nullable=False),
+    Column("next_attempt_at", DateTime(timezone=True), nullable=False),
+    Column("delivered_at", DateTime(timezone=True)),
+    Column("last_error", Text),
+    Index("ix_n8n_outbox_status_next_attempt", "status", "next_attempt_at"),
+)
+
+
+def upgrade(connection: Connection) -> None:
+    # Creates every table on a fresh database, plus any table missing from a database created
+    # before migrations existed. Tables already present are left alone; later versions patch them.
+    metadata.create_all(bind=connection)
@@ -0,0 +1,191 @@
+import re
+import zlib
+
+from sqlalchemy import Connection, Float, LargeBinary, String, Text, bindparam, column, inspect, select, table, text, update
+
+from app.migrations.ops import add_column, create_index
+
+BATCH_SIZE = 500
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Report quote selection as of this version, copied from app.services.quotes and the keyword
+# lists in app.services.extraction so that later tuning does not change what this backfill writes.
+QUOTE_LENGTH = 220
+QUOTE_SCAN_SENTENCES = 40
+_SENTENCE_RE = re.compile(r"[^\n\r.!?]*(?:[.!?]+|$)")
+_REDACTED_RE = re.compile(r"\[REDACTED_[A-Z]+\]")
+FRICTION_HINTS = (
+    "manual",
+    "approval",
+    "wait",
+    "delay",
+    "copy",
+    "paste",
+    "reconcile",
+    "error",
+    "chase",
+    "follow up",
+    "spreadsheet",
+    "excel",
+    "onboarding",
+    "invoice",
+    "quote",
+    "status",
+    "handoff",
+)
+CATEGORY_KEYWORDS = {
+    "onboarding": ("onboard", "new joiner", "provision", "training"),
+    "approvals": ("approval", "sign off", "authorise", "authorize"),
+    "reporting": ("report", "dashboard", "kpi", "status update"),
+    "comms": ("slack", "email thread", "handoff", "communication"),
+    "finance_ops": ("invoice", "expense", "purchase order", "budget", "finance"),
+    "sales_ops": ("crm", "pipeline", "quote", "proposal", "salesforce", "hubspot"),
+    "client_ops": ("client", "account", "delivery", "qbr", "project status"),
+    "access_mgmt": ("access", "permission", "sso", "jira admin", "okta"),
+}
+# Matched as whole words; all other keywords are plain substrings.
+SYSTEM_KEYWORDS = {
+    "Jira": ("jira",),
+    "Salesforce": ("salesforce",),
+    "HubSpot": ("hubspot",),
+    "SAP": ("sap",),
+    "NetSuite": ("netsuite",),
+    "Workday": ("workday",),
+    "Slack": ("slack",),
+    "Teams": ("teams",),
+    "Excel": ("excel", "spreadsheet"),
+    "Google Sheets": ("sheets",),
+    "ServiceNow": ("servicenow",),
+    "Notion": ("notion",),
+}
+_SYSTEM_RES = {
+    system: re.compile("|".join(rf"\b{re.escape(keyword)}\b" for keyword in keywords)) for system, keywords in SYSTEM_KEYWORDS.items()
+}
+
+# The columns this version touches, as they are once it has run.
+pain_points = table("pain_points", column("id"), column("title", Text), column("title_key", Text))
+interviews = table(
+    "interviews",
+    column("id"),
+    column("transcript_raw", LargeBinary),
+    column("transcript_redacted", LargeBinary),
+    column("quote_snippet", Text),
+    column("quote_rank", Float),
+)
+
+
+def upgrade(connection: Connection) -> None:
+    # Columns added after the original schema; all are no-ops on a database created by version 1.
+    add_column(connection, "pain_points", "title_key", Text(), nullable=False, server_default="''")
+    create_index(connection, "ix_pain_points_title_key", "pain_points", "title_key")
+    add_column(connection, "report_runs", "status", String(20), nullable=False, server_default="'completed'")
+    add_column(connection, "report_runs", "error", Text())
+    add_column(connection, "interviews", "quote_snippet", Text())
+    add_column(connection, "interviews", "quote_rank", Float(), nullable=False, server_default="0")
+
+    _backfill_title_keys(connection)
+    _compress_transcripts(connection)
+
+
+def _backfill_title_keys(connection: Connection) -> None:
+    rows = connection.execute(
+        select(pain_points.c.id, pain_points.c.title).where((pain_points.c.title_key == "") | pain_points.c.title_key.is_(None))
+    ).all()
+    if rows:
+        connection.execute(
+            update(pain_points).where(pain_points.c.id == bindparam("row_id")).values(title_key=bindparam("key")),
+            [{"row_id": row.id, "key": _WHITESPACE_RE.sub(" ", (row.title or "").strip()).lower()} for row in rows],
+        )
+
+
+def _compress_transcripts(connection: Connection) -> None:
+    """Compress transcripts stored as plain text and fill in report quotes for them."""
+    if connection.dialect.name == "postgresql":
+        for column in inspect(connection).get_columns("interviews"):
+            if column["name"] in ("transcript_raw", "transcript_redacted") and isinstance(column["type"], Text):
+                connection.execute(
+                    text(f"ALTER TABLE interviews ALTER COLUMN {column['name']} TYPE bytea USING convert_to({column['name']}, 'UTF8')")
+                )
+
+    last_id = 0
+    while True:
+        # Raw SQL, so values come back exactly as stored rather than through CompressedText.
+        rows = connection.execute(
+            text(
+                "SELECT id, transcript_raw, transcript_redacted, quote_snippet FROM interviews "
+                "WHERE id > :last_id ORDER BY id LIMIT :limit"
+            ),
+            {"last_id": last_id, "limit": BATCH_SIZE},
+        ).all()
+        if not rows:
+            return
+        updates = []
+        for row in rows:
+            raw, raw_legacy = _stored_text(row.transcript_raw)
+            redacted, redacted_legacy = _stored_text(row.transcript_redacted)
+            if raw_legacy or redacted_legacy or (redacted and row.quote_snippet is None):
+                snippet, rank = quote_snippet(redacted)
+                updates.append(
+                    {"row_id": row.id, "raw": _compress(raw), "redacted": _compress(redacted), "snippet": snippet, "rank": rank}
+                )
+        if updates:
+            connection.execute(
+                update(interviews)
+                .where(interviews.c.id == bindparam("row_id"))
+                .values(
+                    transcript_raw=bindparam("raw"),
+                    transcript_redacted=bindparam("redacted"),
+                    quote_snippet=bindparam("snippet"),
+                    quote_rank=bindparam("rank"),
+                ),
+                updates,
+            )
+        last_id = rows[-1].id
+
+
+def _stored_text(value: bytes | memoryview | str | None) -> tuple[str | None, bool]:
+    """Decode a stored transcript; the flag says whether it still needs compressing."""
+    if value is None:
+        return None, False
+    if isinstance(value, str):
+        return value, True
+    value = bytes(value)
+    try:
+        return zlib.decompress(value).decode("utf-8"), False
+    except zlib.error:
+        return value.decode("utf-8"), True
+
+
+def _compress(value: str | None) -> bytes | None:
+    return None if value is None else zlib.compress(value.encode("utf-8"), 6)
+
+
+def _quote_rank(sentence: str) -> float:
+    lowered = sentence.lower()
+    hints = sum(1 for hint in FRICTION_HINTS if hint in lowered)
+    categories = sum(1 for keywords in CATEGORY_KEYWORDS.values() if any(keyword in lowered for keyword in keywords))
+    systems = sum(1 for pattern in _SYSTEM_RES.values() if pattern.search(lowered))
+    return 2.0 * hints + systems + categories - len(_REDACTED_RE.findall(sentence))
+
+
+def quote_snippet(transcript_redacted: str | None) -> tuple[str | None, float]:
+    """The quote starts at the best-ranked of the opening sentences and runs for ``QUOTE_LENGTH`` characters."""
+    text = (transcript_redacted or "").strip()
+    if not text:
+        return None, 0.0
+
+    best_start, best_rank = 0, 0.0
+    sentences = 0
+    for match in _SENTENCE_RE.finditer(text):
+        sentence = match.group().strip()
+        if not sentence:
+            continue
+        sentences += 1
+        if sentences > QUOTE_SCAN_SENTENCES:
+            break
+        rank = _quote_rank(sentence)
+        if rank > best_rank:
+            best_start = match.start() + len(match.group()) - len(match.group().lstrip())
+            best_rank = rank
+
+    return text[best_start : best_start + QUOTE_LENGTH].strip(), best_rank
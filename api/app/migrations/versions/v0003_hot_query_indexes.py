@@ -0,0 +1,16 @@
+from sqlalchemy import Connection
+
+from app.migrations.ops import create_index
+
+INDEXES = [
+    ("ix_pain_points_created_at", "pain_points", ("created_at",)),
+    ("ix_pain_points_category_created_at", "pain_points", ("category", "created_at")),
+    ("ix_scores_priority_score_quick_win", "scores", ("priority_score", "quick_win")),
+    ("ix_respondents_id_team", "respondents", ("id", "team")),
+    ("ix_report_runs_session_id_created_at", "report_runs", ("session_id", "created_at")),
+]
+
+
+def upgrade(connection: Connection) -> None:
+    for name, table, columns in INDEXES:
+        create_index(connection, name, table, *columns)
@@ -0,0 +1,8 @@
+from sqlalchemy import Connection, String
+
+from app.migrations.ops import add_column
+
+
+def upgrade(connection: Connection) -> None:
+    # Existing rows cannot be attributed, so they are marked "unknown" and re-extraction leaves them alone.
+    add_column(connection, "pain_points", "extraction_source", String(20), nullable=False, server_default="'unknown'")
@@ -0,0 +1,7 @@
+from sqlalchemy import Connection, DateTime
+
+from app.migrations.ops import add_column
+
+
+def upgrade(connection: Connection) -> None:
+    add_column(connection, "n8n_outbox", "leased_until", DateTime(timezone=True))
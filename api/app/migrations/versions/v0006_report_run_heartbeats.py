@@ -0,0 +1,8 @@
+from sqlalchemy import Connection, DateTime, String
+
+from app.migrations.ops import add_column
+
+
+def upgrade(connection: Connection) -> None:
+    add_column(connection, "report_runs", "owner", String(120))
+    add_column(connection, "report_runs", "heartbeat_at", DateTime(timezone=True))
@@ -0,0 +1,11 @@
+from sqlalchemy import Connection, DateTime, text
+
+from app.migrations.ops import add_column
+
+
+def upgrade(connection: Connection) -> None:
+    # SQLite cannot add a column with a non-constant default, so add it with a placeholder and backfill.
+    if add_column(
+        connection, "interviews", "updated_at", DateTime(timezone=True), nullable=False, server_default="'1970-01-01 00:00:00'"
+    ):
+        connection.execute(text("UPDATE interviews SET updated_at = created_at"))
@@ -1,6 +1,10 @@
+from app.models.dashboard_aggregate import DashboardAggregate
 from app.models.interview import Interview
+from app.models.n8n_outbox import N8nOutboxMessage
 from app.models.pain_point import PainPoint
+from app.models.report_run import ReportRun
 from app.models.respondent import Respondent
 from app.models.score import Score
+from app.models.title_mention import TitleMention
 
-__all__ = ["Respondent", "Interview", "PainPoint", "Score"]
+__all__ = ["Respondent", "Interview", "PainPoint", "Score", "DashboardAggregate", "TitleMention", "N8nOutboxMessage", "ReportRun"]
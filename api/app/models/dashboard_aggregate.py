@@ -0,0 +1,16 @@
+from sqlalchemy import Enum, Float, Integer, String, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db import Base
+from app.models.enums import PainCategoryEnum
+
+
+class DashboardAggregate(Base):
+    __tablename__ = "dashboard_aggregates"
+    __table_args__ = (UniqueConstraint("team", "category", name="uq_dashboard_aggregates_team_category"),)
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    team: Mapped[str] = mapped_column(String(120), nullable=False)
+    category: Mapped[PainCategoryEnum] = mapped_column(Enum(PainCategoryEnum), nullable=False)
+    pain_point_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    impact_hours_per_week: Mapped[float] = mapped_column(Float, default=0.0, nullable=False)
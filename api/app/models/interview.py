@@ -1,11 +1,12 @@
 from datetime import datetime, timezone
 from typing import Any
 
-from sqlalchemy import DateTime, Enum, ForeignKey, Integer, JSON, Text
+from sqlalchemy import DateTime, Enum, Float, ForeignKey, Integer, JSON, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db import Base
 from app.models.enums import ChannelEnum
+from app.models.types import CompressedText
 
 
 class Interview(Base):
@@ -16,11 +17,24 @@ class Interview(Base):
     channel: Mapped[ChannelEnum] = mapped_column(Enum(ChannelEnum), nullable=False, index=True)
     started_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     ended_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
-    transcript_raw: Mapped[str | None] = mapped_column(Text, nullable=True)
-    transcript_redacted: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # Transcripts are compressed and deferred one by one: loading an Interview (e.g. via a pain
+    # point join) fetches neither until it is read or undeferred, and reading one leaves the other.
+    transcript_raw: Mapped[str | None] = mapped_column(CompressedText, nullable=True, deferred=True)
+    transcript_redacted: Mapped[str | None] = mapped_column(CompressedText, nullable=True, deferred=True)
+    # Report quote cut from transcript_redacted by services.quotes.sync_quote whenever it is written,
+    # so reports never read transcripts.
+    quote_snippet: Mapped[str | None] = mapped_column(Text, nullable=True)
+    quote_rank: Mapped[float] = mapped_column(Float, default=0.0, nullable=False)
     summary_text: Mapped[str] = mapped_column(Text, nullable=False)
     metadata_json: Mapped[dict[str, Any]] = mapped_column(JSON, default=dict, nullable=False)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False)
+    # Bumped on every ORM update, so report versions notice edits that change quotes but no totals.
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+        nullable=False,
+    )
 
     respondent = relationship("Respondent", back_populates="interviews")
     pain_points = relationship("PainPoint", back_populates="interview", cascade="all, delete-orphan")
@@ -1,18 +1,39 @@
+import re
 from datetime import datetime, timezone
 
-from sqlalchemy import Boolean, DateTime, Enum, Float, ForeignKey, Integer, JSON, Text
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import Boolean, DateTime, Enum, Float, ForeignKey, Index, Integer, JSON, String, Text
+from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 
 from app.db import Base
 from app.models.enums import PainCategoryEnum
 
 
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Where a pain point came from. Only deterministic rows can be reproduced by re-extraction;
+# "unknown" marks rows created before the source was recorded.
+SOURCE_DETERMINISTIC = "deterministic"
+SOURCE_AI = "ai"
+SOURCE_PAYLOAD = "payload"
+SOURCE_MANUAL = "manual"
+SOURCE_UNKNOWN = "unknown"
+
+
+def normalize_title(title: str | None) -> str:
+    return _WHITESPACE_RE.sub(" ", (title or "").strip()).lower()
+
+
 class PainPoint(Base):
     __tablename__ = "pain_points"
+    __table_args__ = (
+        Index("ix_pain_points_created_at", "created_at"),
+        Index("ix_pain_points_category_created_at", "category", "created_at"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     interview_id: Mapped[int] = mapped_column(ForeignKey("interviews.id", ondelete="CASCADE"), nullable=False, index=True)
     title: Mapped[str] = mapped_column(Text, nullable=False)
+    title_key: Mapped[str] = mapped_column(Text, nullable=False, index=True)
     description: Mapped[str] = mapped_column(Text, nullable=False)
     category: Mapped[PainCategoryEnum] = mapped_column(Enum(PainCategoryEnum), default=PainCategoryEnum.other, nullable=False, index=True)
     frequency_per_week: Mapped[float] = mapped_column(Float, default=1.0, nullable=False)
@@ -24,7 +45,13 @@ class PainPoint(Base):
     success_definition: Mapped[str | None] = mapped_column(Text, nullable=True)
     sensitive_flag: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     redaction_notes: Mapped[str | None] = mapped_column(Text, nullable=True)
+    extraction_source: Mapped[str] = mapped_column(String(20), nullable=False, default=SOURCE_MANUAL)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False)
 
     interview = relationship("Interview", back_populates="pain_points")
     score = relationship("Score", back_populates="pain_point", uselist=False, cascade="all, delete-orphan")
+
+    @validates("title")
+    def _sync_title_key(self, _key: str, title: str) -> str:
+        self.title_key = normalize_title(title)
+        return title
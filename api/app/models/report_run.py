@@ -1,6 +1,6 @@
 from datetime import datetime, timezone
 
-from sqlalchemy import DateTime, Integer, String, Text
+from sqlalchemy import DateTime, Index, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db import Base
@@ -8,6 +8,7 @@ from app.db import Base
 
 class ReportRun(Base):
     __tablename__ = "report_runs"
+    __table_args__ = (Index("ix_report_runs_session_id_created_at", "session_id", "created_at"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False)
@@ -17,3 +18,8 @@ class ReportRun(Base):
     pdf_path_or_url: Mapped[str | None] = mapped_column(String(500), nullable=True)
     summary: Mapped[str | None] = mapped_column(Text, nullable=True)
     recommendations_json: Mapped[str | None] = mapped_column(Text, nullable=True)  # JSON string
+    status: Mapped[str] = mapped_column(String(20), nullable=False, default="completed")  # "pending", "running", "completed", "failed"
+    error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # Background jobs: the rendering process, and when it last confirmed the job is still in progress.
+    owner: Mapped[str | None] = mapped_column(String(120), nullable=True)
+    heartbeat_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
@@ -1,6 +1,6 @@
 from datetime import datetime, timezone
 
-from sqlalchemy import Boolean, DateTime, Integer, String
+from sqlalchemy import Boolean, DateTime, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db import Base
@@ -8,6 +8,8 @@ from app.db import Base
 
 class Respondent(Base):
     __tablename__ = "respondents"
+    # Covers the interview -> respondent join that reads only the team.
+    __table_args__ = (Index("ix_respondents_id_team", "id", "team"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     name: Mapped[str | None] = mapped_column(String(255), nullable=True)
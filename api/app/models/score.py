@@ -1,6 +1,6 @@
 from datetime import datetime, timezone
 
-from sqlalchemy import DateTime, Enum, Float, ForeignKey, Integer, Text
+from sqlalchemy import DateTime, Enum, Float, ForeignKey, Index, Integer, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db import Base
@@ -9,6 +9,7 @@ from app.models.enums import AutomationTypeEnum
 
 class Score(Base):
     __tablename__ = "scores"
+    __table_args__ = (Index("ix_scores_priority_score_quick_win", "priority_score", "quick_win"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     pain_point_id: Mapped[int] = mapped_column(ForeignKey("pain_points.id", ondelete="CASCADE"), nullable=False, unique=True, index=True)
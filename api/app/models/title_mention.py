@@ -0,0 +1,11 @@
+from sqlalchemy import Integer, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db import Base
+
+
+class TitleMention(Base):
+    __tablename__ = "title_mentions"
+
+    title_key: Mapped[str] = mapped_column(Text, primary_key=True)
+    mention_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
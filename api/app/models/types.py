@@ -0,0 +1,31 @@
+import zlib
+from typing import Any
+
+from sqlalchemy import LargeBinary
+from sqlalchemy.engine import Dialect
+from sqlalchemy.types import TypeDecorator
+
+
+class CompressedText(TypeDecorator[str]):
+    """Text stored zlib-compressed in a binary column.
+
+    Values read back as ``str`` still pass through unchanged, so rows written
+    before a column switched to compressed storage stay readable.
+    """
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def __init__(self, level: int = 6, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.level = level
+
+    def process_bind_param(self, value: str | None, dialect: Dialect) -> bytes | None:
+        if value is None:
+            return None
+        return zlib.compress(value.encode("utf-8"), self.level)
+
+    def process_result_value(self, value: bytes | str | None, dialect: Dialect) -> str | None:
+        if value is None or isinstance(value, str):
+            return value
+        return zlib.decompress(value).decode("utf-8")
@@ -47,6 +47,22 @@ class IntakeResponse(BaseModel):
     pain_point_ids: list[int]
 
 
+class BatchIntakeItemResult(BaseModel):
+    index: int
+    ok: bool
+    interview_id: int | None = None
+    respondent_id: int | None = None
+    pain_point_ids: list[int] = Field(default_factory=list)
+    error: str | None = None
+
+
+class BatchIntakeResponse(BaseModel):
+    received: int
+    ingested: int
+    failed: int
+    results: list[BatchIntakeItemResult]
+
+
 class SessionRequest(BaseModel):
     name: str | None = None
     email: str | None = None
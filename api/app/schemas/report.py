@@ -13,6 +13,16 @@ class ReportRunResponse(BaseModel):
     pdf_path_or_url: str | None
     summary: str | None
     recommendations_json: str | None
+    status: str = "completed"
+
+
+class ReportJobResponse(BaseModel):
+    id: int
+    status: str
+    created_at: datetime
+    session_id: str | None
+    download_url: str | None = None
+    error: str | None = None
 
 
 class AttachReportRequest(BaseModel):
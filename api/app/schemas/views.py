@@ -17,6 +17,11 @@ class PainPointListItem(BaseModel):
     sensitive_flag: bool
 
 
+class PainPointListPage(BaseModel):
+    items: list[PainPointListItem]
+    next_cursor: str | None = None
+
+
 class DashboardMetrics(BaseModel):
     total_pain_points: int
     total_hours_per_week: float
@@ -0,0 +1,221 @@
+from collections import Counter, defaultdict
+from collections.abc import Iterable
+from typing import Any, NamedTuple
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from app.models.dashboard_aggregate import DashboardAggregate
+from app.models.enums import PainCategoryEnum
+from app.models.interview import Interview
+from app.models.pain_point import PainPoint
+from app.models.respondent import Respondent
+from app.models.score import Score
+from app.models.title_mention import TitleMention
+
+
+class AggregateContribution(NamedTuple):
+    team: str
+    category: PainCategoryEnum
+    impact_hours_per_week: float
+    title_key: str
+
+
+def pain_point_team(session: Session, pain_point: PainPoint) -> str:
+    stmt = (
+        select(Respondent.team)
+        .join(Interview, Interview.respondent_id == Respondent.id)
+        .where(Interview.id == pain_point.interview_id)
+    )
+    return session.scalar(stmt) or "Unknown"
+
+
+def pain_point_contribution(session: Session, pain_point: PainPoint) -> AggregateContribution | None:
+    """Return what a scored pain point currently adds to the dashboard aggregates and title counts."""
+    impact = session.scalar(select(Score.impact_hours_per_week).where(Score.pain_point_id == pain_point.id))
+    if impact is None:
+        return None
+    return AggregateContribution(pain_point_team(session, pain_point), pain_point.category, impact, pain_point.title_key)
+
+
+def apply_contribution_change(
+    session: Session,
+    before: AggregateContribution | None,
+    after: AggregateContribution | None,
+) -> None:
+    if before == after:
+        return
+    if before is None or after is None or before[:3] != after[:3]:
+        if before is not None:
+            _apply_delta(session, before.team, before.category, -1, -before.impact_hours_per_week)
+        if after is not None:
+            _apply_delta(session, after.team, after.category, 1, after.impact_hours_per_week)
+
+    before_key = before.title_key if before is not None else None
+    after_key = after.title_key if after is not None else None
+    if before_key != after_key:
+        if before_key is not None:
+            _adjust_title_mentions(session, before_key, -1)
+        if after_key is not None:
+            _adjust_title_mentions(session, after_key, 1)
+
+
+def add_contributions(session: Session, contributions: Iterable[AggregateContribution]) -> None:
+    """Add many new pain points at once, writing each touched cell and title key once."""
+    cells: dict[tuple[str, PainCategoryEnum], list[float]] = defaultdict(lambda: [0, 0.0])
+    titles: Counter[str] = Counter()
+    for contribution in contributions:
+        cell = cells[(contribution.team, contribution.category)]
+        cell[0] += 1
+        cell[1] += contribution.impact_hours_per_week
+        titles[contribution.title_key] += 1
+
+    for (team, category), (count, hours) in cells.items():
+        _apply_delta(session, team, category, int(count), hours)
+    for title_key, count in titles.items():
+        _adjust_title_mentions(session, title_key, count)
+
+
+def title_mention_counts(session: Session, title_keys: Iterable[str]) -> dict[str, int]:
+    keys = set(title_keys)
+    if not keys:
+        return {}
+    stmt = select(TitleMention.title_key, TitleMention.mention_count).where(TitleMention.title_key.in_(keys))
+    return dict(session.execute(stmt).all())
+
+
+def title_mention_count(session: Session, title_key: str) -> int:
+    return session.scalar(select(TitleMention.mention_count).where(TitleMention.title_key == title_key)) or 0
+
+
+def _increment(session: Session, model: type[Any], keys: dict[str, Any], deltas: dict[str, Any]) -> None:
+    """Add ``deltas`` to the row with ``keys``, creating it from the deltas when missing.
+
+    One INSERT ... ON CONFLICT DO UPDATE, so concurrent writers creating the same
+    row both succeed and neither overwrites the other's increment.
+    """
+    table = model.__table__
+    insert = sqlite_insert if session.get_bind().dialect.name == "sqlite" else postgresql_insert
+    stmt = insert(table).values(**keys, **deltas)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=list(keys),
+        set_={name: table.c[name] + stmt.excluded[name] for name in deltas},
+    )
+    session.execute(stmt)
+
+
+def _adjust_title_mentions(session: Session, title_key: str, delta: int) -> None:
+    _increment(session, TitleMention, {"title_key": title_key}, {"mention_count": delta})
+
+
+def _apply_delta(session: Session, team: str, category: PainCategoryEnum, count_delta: int, hours_delta: float) -> None:
+    _increment(
+        session,
+        DashboardAggregate,
+        {"team": team, "category": category},
+        {"pain_point_count": count_delta, "impact_hours_per_week": hours_delta},
+    )
+
+
+def _respondent_totals(session: Session, respondent_id: int) -> list[tuple[PainCategoryEnum, int, float]]:
+    stmt = (
+        select(PainPoint.category, func.count(PainPoint.id), func.sum(Score.impact_hours_per_week))
+        .join(Score, Score.pain_point_id == PainPoint.id)
+        .join(Interview, Interview.id == PainPoint.interview_id)
+        .where(Interview.respondent_id == respondent_id)
+        .group_by(PainPoint.category)
+    )
+    return [(category, count, hours or 0.0) for category, count, hours in session.execute(stmt).all()]
+
+
+def move_respondent_team(session: Session, respondent_id: int, old_team: str, new_team: str) -> None:
+    """Shift a respondent's pain points between team cells after their team changes."""
+    if old_team == new_team:
+        return
+    for category, count, hours in _respondent_totals(session, respondent_id):
+        _apply_delta(session, old_team, category, -count, -hours)
+        _apply_delta(session, new_team, category, count, hours)
+
+
+def _subtract_title_mentions(session: Session, *criteria: Any) -> None:
+    stmt = (
+        select(PainPoint.title_key, func.count(PainPoint.id))
+        .join(Score, Score.pain_point_id == PainPoint.id)
+        .join(Interview, Interview.id == PainPoint.interview_id)
+        .where(*criteria)
+        .group_by(PainPoint.title_key)
+    )
+    for title_key, count in session.execute(stmt).all():
+        _adjust_title_mentions(session, title_key, -count)
+
+
+def remove_respondent(session: Session, respondent: Respondent) -> None:
+    """Subtract a respondent's pain points before the respondent is deleted."""
+    for category, count, hours in _respondent_totals(session, respondent.id):
+        _apply_delta(session, respondent.team, category, -count, -hours)
+    _subtract_title_mentions(session, Interview.respondent_id == respondent.id)
+
+
+def remove_interview(session: Session, interview: Interview) -> None:
+    """Subtract an interview's pain points before the interview is deleted."""
+    team = session.scalar(select(Respondent.team).where(Respondent.id == interview.respondent_id)) or "Unknown"
+    stmt = (
+        select(PainPoint.category, func.count(PainPoint.id), func.sum(Score.impact_hours_per_week))
+        .join(Score, Score.pain_point_id == PainPoint.id)
+        .where(PainPoint.interview_id == interview.id)
+        .group_by(PainPoint.category)
+    )
+    for category, count, hours in session.execute(stmt).all():
+        _apply_delta(session, team, category, -count, -(hours or 0.0))
+    _subtract_title_mentions(session, Interview.id == interview.id)
+
+
+def rebuild_dashboard_aggregates(session: Session) -> None:
+    """Recompute every aggregate cell from scratch.
+
+    Used after demo resets and to backfill an empty table; everyday writes apply
+    deltas instead.
+    """
+    team = func.coalesce(Respondent.team, "Unknown")
+    stmt = (
+        select(team, PainPoint.category, func.count(PainPoint.id), func.sum(Score.impact_hours_per_week))
+        .select_from(PainPoint)
+        .join(Score, Score.pain_point_id == PainPoint.id)
+        .outerjoin(Interview, Interview.id == PainPoint.interview_id)
+        .outerjoin(Respondent, Respondent.id == Interview.respondent_id)
+        .group_by(team, PainPoint.category)
+    )
+    rows = session.execute(stmt).all()
+
+    session.execute(delete(DashboardAggregate))
+    session.add_all(
+        DashboardAggregate(team=row[0], category=row[1], pain_point_count=row[2], impact_hours_per_week=row[3] or 0.0)
+        for row in rows
+    )
+    session.flush()
+
+
+def rebuild_title_mentions(session: Session) -> None:
+    stmt = (
+        select(PainPoint.title_key, func.count(PainPoint.id))
+        .join(Score, Score.pain_point_id == PainPoint.id)
+        .group_by(PainPoint.title_key)
+    )
+    rows = session.execute(stmt).all()
+
+    session.execute(delete(TitleMention))
+    session.add_all(TitleMention(title_key=title_key, mention_count=count) for title_key, count in rows)
+    session.flush()
+
+
+def ensure_dashboard_aggregates(session: Session) -> None:
+    has_scores = session.scalar(select(Score.id).limit(1)) is not None
+    if not has_scores:
+        return
+    if session.scalar(select(DashboardAggregate.id).limit(1)) is None:
+        rebuild_dashboard_aggregates(session)
+    if session.scalar(select(TitleMention.title_key).limit(1)) is None:
+        rebuild_title_mentions(session)
+    session.commit()
@@ -1,11 +1,14 @@
+import asyncio
 import json
 import re
 from typing import Any
 
-import httpx
-
 from app.config import get_settings
+from app.models.pain_point import normalize_title
 from app.schemas.intake import CanonicalPainPoint
+from app.services.extraction_cache import extraction_cache_key, get_extraction_cache
+from app.services.http_client import http_clients
+from app.services.offload import run_blocking
 
 
 EXTRACTION_PROMPT = """
@@ -15,6 +18,8 @@ title, description, category, frequency_per_week, minutes_per_occurrence, people
 systems_involved (array), current_workaround, failure_modes, success_definition, sensitive_flag.
 Use categories from: onboarding, approvals, reporting, comms, finance_ops, sales_ops, client_ops, access_mgmt, other.
 """.strip()
+# Bump when EXTRACTION_PROMPT changes so cached extractions from the old prompt are ignored.
+EXTRACTION_PROMPT_VERSION = "1"
 
 
 def _parse_json_block(content: str) -> list[dict[str, Any]]:
@@ -31,6 +36,47 @@ def _parse_json_block(content: str) -> list[dict[str, Any]]:
     return []
 
 
+def split_transcript(text: str, chunk_chars: int, overlap_chars: int) -> list[str]:
+    """Split text into windows of at most ``chunk_chars`` that overlap by ``overlap_chars``.
+
+    Windows end at the last line or sentence break inside them when there is one,
+    so a pain point is less likely to be cut in half.
+    """
+    if len(text) <= chunk_chars:
+        return [text]
+    overlap_chars = min(overlap_chars, chunk_chars // 2)
+    chunks: list[str] = []
+    start = 0
+    while start < len(text):
+        end = min(start + chunk_chars, len(text))
+        if end < len(text):
+            floor = start + chunk_chars // 2
+            boundary = max(text.rfind("\n", floor, end), text.rfind(". ", floor, end))
+            if boundary != -1:
+                end = boundary + 1
+        chunks.append(text[start:end])
+        if end >= len(text):
+            break
+        start = end - overlap_chars
+    return chunks
+
+
+def merge_chunk_results(chunk_results: list[list[dict[str, Any]]]) -> list[dict[str, Any]]:
+    """Merge per-chunk extractions, keeping the first item per normalised title and pooling systems."""
+    merged: dict[str, dict[str, Any]] = {}
+    for items in chunk_results:
+        for item in items:
+            key = normalize_title(item.get("title"))
+            existing = merged.get(key)
+            if existing is None:
+                merged[key] = dict(item)
+                continue
+            systems = list(existing.get("systems_involved") or [])
+            systems += [system for system in item.get("systems_involved") or [] if system not in systems]
+            existing["systems_involved"] = systems
+    return list(merged.values())
+
+
 class AIExtractor:
     def __init__(self) -> None:
         self.settings = get_settings()
@@ -44,16 +90,56 @@ class AIExtractor:
             "summary": summary or "",
         }
 
-        try:
-            if self.settings.ai_provider == "openai":
-                raw = await self._extract_openai(body)
-            else:
-                raw = await self._extract_ollama(body)
-
+        model = self.settings.model_name if self.settings.ai_provider == "openai" else self.settings.ollama_model
+        cache = get_extraction_cache()
+        cache_key = extraction_cache_key(
+            self.settings.ai_provider, model, EXTRACTION_PROMPT_VERSION, body["transcript"], body["summary"]
+        )
+        # The SQLite backend does file I/O, so lookups and writes stay off the event loop.
+        raw = await run_blocking(cache.get, cache_key)
+        if raw is not None:
             return [CanonicalPainPoint.model_validate(item) for item in raw]
+
+        try:
+            raw, complete = await self._extract_chunked(body)
+            pain_points = [CanonicalPainPoint.model_validate(item) for item in raw]
         except Exception:
             return None
 
+        # Empty results fall back to deterministic extraction, and a transcript with a failed chunk
+        # is extracted again next time, so only complete, non-empty extractions are kept.
+        if pain_points and complete:
+            await run_blocking(cache.set, cache_key, raw)
+        return pain_points
+
+    async def _extract_chunked(self, body: dict[str, str]) -> tuple[list[dict[str, Any]], bool]:
+        """Map-reduce long transcripts: extract overlapping chunks concurrently, then merge by title.
+
+        Chunks that fail are left out of the merge; the flag says whether every chunk succeeded.
+        """
+        chunks = split_transcript(
+            body["transcript"], self.settings.extraction_chunk_chars, self.settings.extraction_chunk_overlap_chars
+        )
+        if len(chunks) == 1:
+            return await self._extract_one(body), True
+
+        semaphore = asyncio.Semaphore(max(1, self.settings.extraction_max_concurrent_chunks))
+
+        async def extract_chunk(chunk: str) -> list[dict[str, Any]]:
+            async with semaphore:
+                return await self._extract_one({"transcript": chunk, "summary": body["summary"]})
+
+        results = await asyncio.gather(*(extract_chunk(chunk) for chunk in chunks), return_exceptions=True)
+        succeeded = [result for result in results if not isinstance(result, BaseException)]
+        if not succeeded:
+            raise next(result for result in results if isinstance(result, BaseException))
+        return merge_chunk_results(succeeded), len(succeeded) == len(chunks)
+
+    async def _extract_one(self, body: dict[str, str]) -> list[dict[str, Any]]:
+        if self.settings.ai_provider == "openai":
+            return await self._extract_openai(body)
+        return await self._extract_ollama(body)
+
     async def _extract_openai(self, body: dict[str, str]) -> list[dict[str, Any]]:
         if not self.settings.openai_api_key:
             return []
@@ -69,11 +155,10 @@ class AIExtractor:
         }
         headers = {"Authorization": f"Bearer {self.settings.openai_api_key}"}
 
-        async with httpx.AsyncClient(timeout=20) as client:
-            response = await client.post(url, json=payload, headers=headers)
-            response.raise_for_status()
-            content = response.json()["choices"][0]["message"]["content"]
-            return _parse_json_block(content)
+        response = await http_clients.client_for(url).post(url, json=payload, headers=headers)
+        response.raise_for_status()
+        content = response.json()["choices"][0]["message"]["content"]
+        return _parse_json_block(content)
 
     async def _extract_ollama(self, body: dict[str, str]) -> list[dict[str, Any]]:
         url = f"{self.settings.ollama_base_url.rstrip('/')}/api/chat"
@@ -87,8 +172,7 @@ class AIExtractor:
             ],
         }
 
-        async with httpx.AsyncClient(timeout=30) as client:
-            response = await client.post(url, json=payload)
-            response.raise_for_status()
-            content = response.json().get("message", {}).get("content", "[]")
-            return _parse_json_block(content)
+        response = await http_clients.client_for(url).post(url, json=payload)
+        response.raise_for_status()
+        content = response.json().get("message", {}).get("content", "[]")
+        return _parse_json_block(content)
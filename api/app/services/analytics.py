@@ -1,45 +1,47 @@
+import hashlib
 from collections import Counter, defaultdict
 from typing import Any
 
-from sqlalchemy import select
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session, contains_eager, joinedload
 
+from app.models.dashboard_aggregate import DashboardAggregate
 from app.models.interview import Interview
 from app.models.pain_point import PainPoint
 from app.models.respondent import Respondent
 from app.models.score import Score
 
 
-def load_pain_points_with_context(session: Session) -> list[PainPoint]:
-    stmt = select(PainPoint).options(
-        joinedload(PainPoint.score),
-        joinedload(PainPoint.interview).joinedload(Interview.respondent),
-    )
-    return session.scalars(stmt).all()
-
-
 def dashboard_metrics(session: Session) -> dict[str, Any]:
-    pain_points = load_pain_points_with_context(session)
-    total_hours = round(sum((pp.score.impact_hours_per_week if pp.score else 0.0) for pp in pain_points), 2)
-
-    category_counter = Counter(pp.category.value for pp in pain_points)
-    top_categories = [{"category": category, "count": count} for category, count in category_counter.most_common(8)]
+    # Counts and hours come from the maintained (team, category) cells, so this reads
+    # a handful of rows plus the top of the priority index regardless of table size.
+    cells = session.scalars(select(DashboardAggregate).where(DashboardAggregate.pain_point_count > 0)).all()
+    total_pain_points = sum(cell.pain_point_count for cell in cells)
+    total_hours = round(sum(cell.impact_hours_per_week for cell in cells), 2)
 
+    category_counter: Counter[str] = Counter()
     heatmap: dict[str, Counter[str]] = defaultdict(Counter)
-    for pp in pain_points:
-        team = pp.interview.respondent.team if pp.interview and pp.interview.respondent else "Unknown"
-        heatmap[team][pp.category.value] += 1
+    for cell in cells:
+        category_counter[cell.category.value] += cell.pain_point_count
+        heatmap[cell.team][cell.category.value] += cell.pain_point_count
 
+    top_categories = [{"category": category, "count": count} for category, count in category_counter.most_common(8)]
     team_heatmap = [
         {"team": team, "categories": dict(counter), "total": sum(counter.values())}
         for team, counter in sorted(heatmap.items(), key=lambda item: sum(item[1].values()), reverse=True)
     ]
 
-    backlog = sorted(
-        [pp for pp in pain_points if pp.score],
-        key=lambda pp: pp.score.priority_score,
-        reverse=True,
-    )[:10]
+    backlog_stmt = (
+        select(PainPoint)
+        .join(Score, Score.pain_point_id == PainPoint.id)
+        .options(
+            contains_eager(PainPoint.score),
+            joinedload(PainPoint.interview).joinedload(Interview.respondent),
+        )
+        .order_by(Score.priority_score.desc())
+        .limit(10)
+    )
+    backlog = session.scalars(backlog_stmt).all()
     top_backlog = [
         {
             "pain_point_id": pp.id,
@@ -70,7 +72,7 @@ def dashboard_metrics(session: Session) -> dict[str, Any]:
     ]
 
     return {
-        "total_pain_points": len(pain_points),
+        "total_pain_points": total_pain_points,
         "total_hours_per_week": total_hours,
         "top_categories": top_categories,
         "team_heatmap": team_heatmap,
@@ -79,31 +81,59 @@ def dashboard_metrics(session: Session) -> dict[str, Any]:
     }
 
 
+def report_data_version(session: Session) -> str:
+    """Cheap fingerprint of everything the report reads.
+
+    Aggregate cells change on every insert, delete, re-score or team move; the id and
+    timestamp bounds catch edits that leave the cell totals unchanged, such as an
+    interview edit that only changes its quote.
+    """
+    cells = session.execute(
+        select(
+            DashboardAggregate.team,
+            DashboardAggregate.category,
+            DashboardAggregate.pain_point_count,
+            DashboardAggregate.impact_hours_per_week,
+        ).order_by(DashboardAggregate.team, DashboardAggregate.category)
+    ).all()
+    pain_points = session.execute(select(func.count(PainPoint.id), func.max(PainPoint.id))).one()
+    interviews = session.execute(select(func.count(Interview.id), func.max(Interview.id), func.max(Interview.updated_at))).one()
+    scores_updated_at = session.scalar(select(func.max(Score.updated_at)))
+
+    fingerprint = repr((cells, tuple(pain_points), tuple(interviews), scores_updated_at))
+    return hashlib.sha256(fingerprint.encode()).hexdigest()
+
+
+MAX_QUOTES = 15
+REPORT_SCAN_BATCH_SIZE = 1000
+
+
 def report_context(session: Session) -> dict[str, Any]:
     metrics = dashboard_metrics(session)
-    pain_points = load_pain_points_with_context(session)
 
+    # One streamed pass over the narrow columns the report still needs.
+    stmt = (
+        select(PainPoint.systems_involved)
+        .order_by(PainPoint.id)
+        .execution_options(yield_per=REPORT_SCAN_BATCH_SIZE)
+    )
     systems_counter: Counter[str] = Counter()
-    for pp in pain_points:
-        for system in pp.systems_involved or []:
+    for systems in session.scalars(stmt):
+        for system in systems or []:
             systems_counter[system] += 1
 
-    non_sensitive_quotes = []
-    for pp in pain_points:
-        if pp.sensitive_flag:
-            continue
-        interview = pp.interview
-        if not interview or not interview.transcript_redacted:
-            continue
-        snippet = interview.transcript_redacted[:220].strip()
-        if snippet:
-            non_sensitive_quotes.append(
-                {
-                    "pain_point_id": pp.id,
-                    "team": interview.respondent.team if interview.respondent else "Unknown",
-                    "quote": snippet,
-                }
-            )
+    # Quotes are cut and ranked at ingestion, so only MAX_QUOTES short strings are read.
+    quote_rows = session.execute(
+        select(PainPoint.id, Respondent.team, Interview.quote_snippet)
+        .join(Interview, Interview.id == PainPoint.interview_id)
+        .outerjoin(Respondent, Respondent.id == Interview.respondent_id)
+        .where(PainPoint.sensitive_flag.is_(False), Interview.quote_snippet.is_not(None), Interview.quote_snippet != "")
+        .order_by(Interview.quote_rank.desc(), PainPoint.id)
+        .limit(MAX_QUOTES)
+    ).all()
+    non_sensitive_quotes = [
+        {"pain_point_id": row.id, "team": row.team or "Unknown", "quote": row.quote_snippet} for row in quote_rows
+    ]
 
     return {
         "generated": __import__("datetime").datetime.utcnow().strftime("%Y-%m-%d %H:%M UTC"),
@@ -113,6 +143,6 @@ def report_context(session: Session) -> dict[str, Any]:
         "team_breakdown": metrics["team_heatmap"],
         "category_breakdown": metrics["top_categories"],
         "systems_map": [{"system": name, "mentions": count} for name, count in systems_counter.most_common(12)],
-        "quotes": non_sensitive_quotes[:15],
+        "quotes": non_sensitive_quotes,
         "kpis": metrics,
     }
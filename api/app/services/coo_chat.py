@@ -3,7 +3,6 @@ import re
 from datetime import datetime, timezone
 from typing import Any
 
-import httpx
 from sqlalchemy.orm import Session
 
 from app.config import get_settings
@@ -18,7 +17,9 @@ from app.services.extraction import (
     infer_people_affected,
     infer_systems,
 )
+from app.services.http_client import http_clients
 from app.services.ingestion import IntakeIngestionService
+from app.services.offload import run_blocking
 
 
 class COOChatService:
@@ -28,7 +29,7 @@ class COOChatService:
 
     async def handle(self, session: Session, request: COOChatRequest) -> COOChatResponse:
         analysis = await self._analyze(request)
-        analysis = self._stabilize_analysis(request, analysis)
+        analysis = await run_blocking(self._stabilize_analysis, request, analysis)
 
         added_to_report = False
         interview_id = None
@@ -160,7 +161,7 @@ class COOChatService:
             ai_result = await self._analyze_with_llm(request)
             if ai_result is not None:
                 return ai_result
-        return self._analyze_deterministic(request)
+        return await run_blocking(self._analyze_deterministic, request)
 
     async def _analyze_with_llm(self, request: COOChatRequest) -> dict[str, Any] | None:
         system_prompt = (
@@ -214,10 +215,9 @@ class COOChatService:
             ],
         }
         headers = {"Authorization": f"Bearer {self.settings.openai_api_key}"}
-        async with httpx.AsyncClient(timeout=30) as client:
-            response = await client.post(url, json=body, headers=headers)
-            response.raise_for_status()
-            return response.json()["choices"][0]["message"]["content"]
+        response = await http_clients.client_for(url).post(url, json=body, headers=headers)
+        response.raise_for_status()
+        return response.json()["choices"][0]["message"]["content"]
 
     async def _call_ollama(self, system_prompt: str, payload: dict[str, Any]) -> str:
         url = f"{self.settings.ollama_base_url.rstrip('/')}/api/chat"
@@ -231,10 +231,9 @@ class COOChatService:
             ],
         }
 
-        async with httpx.AsyncClient(timeout=30) as client:
-            response = await client.post(url, json=body)
-            response.raise_for_status()
-            return response.json().get("message", {}).get("content", "{}")
+        response = await http_clients.client_for(url).post(url, json=body)
+        response.raise_for_status()
+        return response.json().get("message", {}).get("content", "{}")
 
     def _parse_json(self, content: str) -> dict[str, Any] | None:
         cleaned = content.strip()
@@ -1,5 +1,8 @@
 import re
 from collections import Counter
+from collections.abc import Iterable
+from itertools import islice
+from typing import Any, NamedTuple
 
 from app.models.enums import PainCategoryEnum
 from app.schemas.intake import CanonicalPainPoint
@@ -35,22 +38,95 @@ CATEGORY_KEYWORDS: dict[PainCategoryEnum, tuple[str, ...]] = {
     PainCategoryEnum.access_mgmt: ("access", "permission", "sso", "jira admin", "okta"),
 }
 
-SYSTEM_PATTERNS = {
-    "Jira": r"\bjira\b",
-    "Salesforce": r"\bsalesforce\b",
-    "HubSpot": r"\bhubspot\b",
-    "SAP": r"\bsap\b",
-    "NetSuite": r"\bnetsuite\b",
-    "Workday": r"\bworkday\b",
-    "Slack": r"\bslack\b",
-    "Teams": r"\bteams\b",
-    "Excel": r"\bexcel\b|\bspreadsheet\b",
-    "Google Sheets": r"\bsheets\b",
-    "ServiceNow": r"\bservicenow\b",
-    "Notion": r"\bnotion\b",
+# Matched as whole words; all other keywords are plain substrings.
+SYSTEM_KEYWORDS: dict[str, tuple[str, ...]] = {
+    "Jira": ("jira",),
+    "Salesforce": ("salesforce",),
+    "HubSpot": ("hubspot",),
+    "SAP": ("sap",),
+    "NetSuite": ("netsuite",),
+    "Workday": ("workday",),
+    "Slack": ("slack",),
+    "Teams": ("teams",),
+    "Excel": ("excel", "spreadsheet"),
+    "Google Sheets": ("sheets",),
+    "ServiceNow": ("servicenow",),
+    "Notion": ("notion",),
 }
 
 
+class KeywordMatches(NamedTuple):
+    hints: frozenset[str]
+    categories: frozenset[PainCategoryEnum]
+    systems: frozenset[str]
+
+
+class KeywordMatcher:
+    """Finds friction hints, category keywords and system names in one regex pass.
+
+    Keywords are compiled into a prefix trie inside a lookahead, so every start
+    position is tried once and overlapping matches are all seen. The trie yields
+    the longest keyword at each position; any other keyword matching there is a
+    prefix of it, so each keyword carries the labels of its keyword prefixes.
+    System names are matched as whole words by a second optional lookahead.
+    """
+
+    def __init__(
+        self,
+        hints: tuple[str, ...],
+        category_keywords: dict[PainCategoryEnum, tuple[str, ...]],
+        system_keywords: dict[str, tuple[str, ...]],
+    ) -> None:
+        labels: dict[str, set[tuple[str, Any]]] = {}
+        for hint in hints:
+            labels.setdefault(hint, set()).add(("hint", hint))
+        for category, keywords in category_keywords.items():
+            for keyword in keywords:
+                labels.setdefault(keyword, set()).add(("category", category))
+        self._systems_by_keyword = {keyword: system for system, keywords in system_keywords.items() for keyword in keywords}
+
+        self._labels_by_match = {
+            keyword: frozenset(label for prefix in labels if keyword.startswith(prefix) for label in labels[prefix])
+            for keyword in [*labels, *self._systems_by_keyword]
+        }
+        keywords = _trie_pattern(self._labels_by_match)
+        systems = _trie_pattern(self._systems_by_keyword)
+        self._pattern = re.compile(f"(?=({keywords}))(?:(?=\\b({systems})\\b))?")
+
+    def scan(self, text: str) -> KeywordMatches:
+        hints: set[str] = set()
+        categories: set[PainCategoryEnum] = set()
+        systems: set[str] = set()
+        for keyword, system_keyword in set(self._pattern.findall(text.lower())):
+            for kind, value in self._labels_by_match[keyword]:
+                (hints if kind == "hint" else categories).add(value)
+            if system_keyword:
+                systems.add(self._systems_by_keyword[system_keyword])
+        return KeywordMatches(frozenset(hints), frozenset(categories), frozenset(systems))
+
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    trie: dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+    return _trie_node_pattern(trie)
+
+
+def _trie_node_pattern(node: dict[str, dict]) -> str:
+    branches = [re.escape(char) + _trie_node_pattern(child) for char, child in sorted(node.items()) if char]
+    if not branches:
+        return ""
+    body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+    # Greedy optional tail, so the longest keyword at a position wins.
+    return f"(?:{body})?" if "" in node else body
+
+
+KEYWORD_MATCHER = KeywordMatcher(FRICTION_HINTS, CATEGORY_KEYWORDS, SYSTEM_KEYWORDS)
+
+
 FREQUENCY_PATTERNS = [
     (re.compile(r"(\d+(?:\.\d+)?)\s*(?:times?)\s*(?:per|a)?\s*week", re.IGNORECASE), lambda m: float(m.group(1))),
     (re.compile(r"(\d+(?:\.\d+)?)\s*/\s*week", re.IGNORECASE), lambda m: float(m.group(1))),
@@ -67,17 +143,23 @@ HOURS_RANGE_PATTERN = re.compile(r"(\d+(?:\.\d+)?)\s*(?:-|to)\s*(\d+(?:\.\d+)?)\
 PEOPLE_PATTERN = re.compile(r"(\d+)\s*(people|engineers|analysts|consultants|team members|staff)", re.IGNORECASE)
 
 
-def infer_category(text: str) -> PainCategoryEnum:
-    lowered = text.lower()
-    for category, keywords in CATEGORY_KEYWORDS.items():
-        if any(keyword in lowered for keyword in keywords):
+def category_from_matches(matches: KeywordMatches) -> PainCategoryEnum:
+    for category in CATEGORY_KEYWORDS:
+        if category in matches.categories:
             return category
     return PainCategoryEnum.other
 
 
+def systems_from_matches(matches: KeywordMatches) -> list[str]:
+    return [name for name in SYSTEM_KEYWORDS if name in matches.systems]
+
+
+def infer_category(text: str) -> PainCategoryEnum:
+    return category_from_matches(KEYWORD_MATCHER.scan(text))
+
+
 def infer_systems(text: str) -> list[str]:
-    systems = [name for name, pattern in SYSTEM_PATTERNS.items() if re.search(pattern, text, re.IGNORECASE)]
-    return systems
+    return systems_from_matches(KEYWORD_MATCHER.scan(text))
 
 
 def infer_frequency_per_week(text: str) -> float:
@@ -143,16 +225,18 @@ def extract_pain_points_deterministic(transcript: str | None, summary: str | Non
         return []
 
     chunks = [s.strip() for s in re.split(r"[\n\r]+|(?<=[.!?])\s+", source) if s.strip()]
-    candidates = [s for s in chunks if any(hint in s.lower() for hint in FRICTION_HINTS)]
+    # Each sentence is scanned once; only the first eight candidates are used, so stop there.
+    scanned = ((chunk, KEYWORD_MATCHER.scan(chunk)) for chunk in chunks)
+    candidates = list(islice(((chunk, matches) for chunk, matches in scanned if matches.hints), 8))
 
     if not candidates and summary:
-        candidates = [summary]
+        candidates = [(summary, KEYWORD_MATCHER.scan(summary))]
     elif not candidates and chunks:
-        candidates = chunks[:1]
+        candidates = [(chunks[0], KEYWORD_MATCHER.scan(chunks[0]))]
 
     pain_points: list[CanonicalPainPoint] = []
     seen: Counter[str] = Counter()
-    for sentence in candidates[:8]:
+    for sentence, matches in candidates:
         title = title_from_sentence(sentence)
         key = title.lower()
         seen[key] += 1
@@ -163,11 +247,11 @@ def extract_pain_points_deterministic(transcript: str | None, summary: str | Non
             CanonicalPainPoint(
                 title=title,
                 description=sentence,
-                category=infer_category(sentence),
+                category=category_from_matches(matches),
                 frequency_per_week=infer_frequency_per_week(sentence),
                 minutes_per_occurrence=infer_minutes(sentence),
                 people_affected=infer_people_affected(sentence),
-                systems_involved=infer_systems(sentence),
+                systems_involved=systems_from_matches(matches),
                 current_workaround="Manual follow-up and spreadsheet updates",
                 failure_modes="Delays, missed updates, and inconsistent data",
                 success_definition="Workflow is automated with clear ownership and visibility",
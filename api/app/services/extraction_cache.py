@@ -0,0 +1,153 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Protocol
+
+from app.config import get_settings
+
+RawPainPoints = list[dict[str, Any]]
+
+
+def extraction_cache_key(provider: str, model: str, prompt_version: str, transcript: str, summary: str) -> str:
+    """Content address for one extraction request."""
+    material = json.dumps([provider, model, prompt_version, transcript, summary], ensure_ascii=False)
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class ExtractionCacheBackend(Protocol):
+    def get(self, key: str) -> RawPainPoints | None: ...
+
+    def set(self, key: str, value: RawPainPoints) -> None: ...
+
+
+class MemoryExtractionCache:
+    """Thread-safe LRU with a per-entry TTL."""
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: float = 86400.0) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[float, RawPainPoints]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> RawPainPoints | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: RawPainPoints) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+class SQLiteExtractionCache:
+    """On-disk store so cached extractions survive restarts and are shared between workers.
+
+    Expired rows are never returned; they are deleted in one sweep every
+    ``sweep_interval_writes`` writes rather than on each write.
+    """
+
+    def __init__(self, path: str, ttl_seconds: float = 86400.0, sweep_interval_writes: int = 100) -> None:
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self.sweep_interval_writes = max(1, sweep_interval_writes)
+        self._writes = 0
+        self._writes_lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS extraction_cache (key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        connection = sqlite3.connect(self.path, timeout=5)
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    def get(self, key: str) -> RawPainPoints | None:
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT value FROM extraction_cache WHERE key = ? AND expires_at > ?", (key, time.time())
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def set(self, key: str, value: RawPainPoints) -> None:
+        now = time.time()
+        with self._writes_lock:
+            self._writes += 1
+            sweep = self._writes % self.sweep_interval_writes == 0
+        with self._connect() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO extraction_cache (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, json.dumps(value), now + self.ttl_seconds),
+            )
+            if sweep:
+                connection.execute("DELETE FROM extraction_cache WHERE expires_at <= ?", (now,))
+
+
+class ExtractionCache:
+    """Wraps a backend with hit/miss counters."""
+
+    def __init__(self, backend: ExtractionCacheBackend | None) -> None:
+        self.backend = backend
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> RawPainPoints | None:
+        if self.backend is None:
+            return None
+        value = self.backend.get(key)
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def set(self, key: str, value: RawPainPoints) -> None:
+        if self.backend is not None:
+            self.backend.set(key, value)
+
+    def stats(self) -> dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "backend": type(self.backend).__name__ if self.backend is not None else None,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+@lru_cache
+def get_extraction_cache() -> ExtractionCache:
+    settings = get_settings()
+    if settings.extraction_cache_backend == "memory":
+        return ExtractionCache(
+            MemoryExtractionCache(settings.extraction_cache_max_entries, settings.extraction_cache_ttl_seconds)
+        )
+    if settings.extraction_cache_backend == "sqlite":
+        return ExtractionCache(SQLiteExtractionCache(settings.extraction_cache_path, settings.extraction_cache_ttl_seconds))
+    return ExtractionCache(None)
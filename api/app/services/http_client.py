@@ -0,0 +1,59 @@
+import importlib.util
+import threading
+from typing import TYPE_CHECKING
+
+from app.config import Settings, get_settings
+
+if TYPE_CHECKING:
+    import httpx
+
+
+class HTTPClientPool:
+    """Shared keep-alive ``httpx.AsyncClient`` instances, one per upstream origin.
+
+    httpx only limits connections per client, so each origin (OpenAI, Ollama,
+    n8n) gets its own client and therefore its own connection limit. Clients are
+    created on first use and closed together on app shutdown.
+    """
+
+    def __init__(self, settings: Settings | None = None) -> None:
+        self.settings = settings or get_settings()
+        self._clients: dict[str, "httpx.AsyncClient"] = {}
+        self._lock = threading.Lock()
+
+    def client_for(self, url: str) -> "httpx.AsyncClient":
+        # httpx (and certifi with it) is imported on first use rather than at app import.
+        import httpx
+
+        origin = httpx.URL(url).copy_with(path="/", query=None, fragment=None)
+        key = str(origin)
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None or client.is_closed:
+                client = self._build_client()
+                self._clients[key] = client
+            return client
+
+    def _build_client(self) -> "httpx.AsyncClient":
+        import httpx
+
+        settings = self.settings
+        return httpx.AsyncClient(
+            http2=settings.http_client_http2 and importlib.util.find_spec("h2") is not None,
+            limits=httpx.Limits(
+                max_connections=settings.http_client_max_connections_per_host,
+                max_keepalive_connections=settings.http_client_max_keepalive_per_host,
+                keepalive_expiry=settings.http_client_keepalive_seconds,
+            ),
+            timeout=httpx.Timeout(settings.llm_timeout_seconds, connect=settings.http_client_connect_timeout_seconds),
+        )
+
+    async def aclose(self) -> None:
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+        for client in clients:
+            await client.aclose()
+
+
+http_clients = HTTPClientPool()
@@ -1,16 +1,44 @@
-import httpx
+import asyncio
+from typing import Any
+
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.config import get_settings
 from app.models.interview import Interview
-from app.models.pain_point import PainPoint
+from app.models.pain_point import SOURCE_AI, SOURCE_DETERMINISTIC, SOURCE_PAYLOAD, PainPoint
 from app.models.respondent import Respondent
-from app.schemas.intake import CanonicalIntake
+from app.schemas.intake import CanonicalIntake, CanonicalPainPoint
 from app.services.ai_extractor import AIExtractor
+from app.services.aggregates import move_respondent_team
 from app.services.extraction import extract_pain_points_deterministic
-from app.services.redaction import redact_text
-from app.services.scoring import upsert_score
+from app.services.n8n_outbox import enqueue_n8n_notifications, n8n_dispatcher
+from app.services.offload import run_blocking
+from app.services.quotes import sync_quote
+from app.services.redaction import redact_texts
+from app.services.scoring import score_new_pain_points
+
+# An intake's pain points and the SOURCE_* constant naming what produced them.
+Extraction = tuple[str, list[CanonicalPainPoint]]
+
+
+def build_pain_point(interview_id: int, item: CanonicalPainPoint, source: str) -> PainPoint:
+    return PainPoint(
+        interview_id=interview_id,
+        extraction_source=source,
+        title=item.title,
+        description=item.description,
+        category=item.category,
+        frequency_per_week=max(0.1, item.frequency_per_week),
+        minutes_per_occurrence=max(1.0, item.minutes_per_occurrence),
+        people_affected=max(1, item.people_affected),
+        systems_involved=item.systems_involved,
+        current_workaround=item.current_workaround,
+        failure_modes=item.failure_modes,
+        success_definition=item.success_definition,
+        sensitive_flag=item.sensitive_flag,
+        redaction_notes=item.redaction_notes,
+    )
 
 
 class IntakeIngestionService:
@@ -18,10 +46,134 @@ class IntakeIngestionService:
         self.ai_extractor = AIExtractor()
 
     async def ingest(self, session: Session, canonical: CanonicalIntake) -> tuple[int, int, list[int]]:
-        respondent = self._upsert_respondent(session, canonical)
+        return (await self.ingest_batch(session, [canonical]))[0]
+
+    async def ingest_batch(
+        self,
+        session: Session,
+        canonicals: list[CanonicalIntake],
+        extracted_batches: list[Extraction] | None = None,
+    ) -> list[tuple[int, int, list[int]]]:
+        """Ingest several intakes in one transaction.
+
+        Pain points are extracted first, before anything is written, so the
+        transaction is not held open across LLM calls; pass ``extracted_batches``
+        to reuse an earlier extraction. Respondents, interviews and pain points
+        are then each written with a single flush (one multi-row INSERT per table)
+        and scores with one executemany, so the cost per chunk is a fixed number of
+        statements. Results are returned in input order. The sync DB phases and
+        redaction run on the blocking pool, off the event loop.
+        """
+        if not canonicals:
+            return []
+
+        if extracted_batches is None:
+            extracted_batches = await self._extract_all(canonicals)
+        respondents, interviews = await run_blocking(self._write_interviews, session, canonicals)
+        results = await run_blocking(self._write_pain_points, session, canonicals, respondents, interviews, extracted_batches)
+        n8n_dispatcher.notify()
+        return results
+
+    def _write_interviews(
+        self, session: Session, canonicals: list[CanonicalIntake]
+    ) -> tuple[list[Respondent], list[Interview]]:
+        respondents = self._upsert_respondents(session, canonicals)
+        redacted = redact_texts(
+            (canonical.transcript if respondent.consent else None, respondent.name)
+            for canonical, respondent in zip(canonicals, respondents)
+        )
+        interviews = [
+            self._build_interview(canonical, respondent, transcript_redacted)
+            for canonical, respondent, transcript_redacted in zip(canonicals, respondents, redacted)
+        ]
+        session.add_all(interviews)
+        session.flush()
+        return respondents, interviews
+
+    def _write_pain_points(
+        self,
+        session: Session,
+        canonicals: list[CanonicalIntake],
+        respondents: list[Respondent],
+        interviews: list[Interview],
+        extracted_batches: list[Extraction],
+    ) -> list[tuple[int, int, list[int]]]:
+        pain_points_by_interview: list[list[PainPoint]] = []
+        for interview, (source, extracted) in zip(interviews, extracted_batches):
+            pain_points = [build_pain_point(interview.id, item, source) for item in extracted]
+            session.add_all(pain_points)
+            pain_points_by_interview.append(pain_points)
+        session.flush()
+
+        teams = {interview.id: respondent.team for interview, respondent in zip(interviews, respondents)}
+        score_new_pain_points(session, [pp for batch in pain_points_by_interview for pp in batch], teams)
+        # n8n is notified through the outbox, committed atomically with the interviews.
+        enqueue_n8n_notifications(
+            session,
+            [
+                (interview.id, respondent.id, canonical.metadata_json.get("session_id"))
+                for canonical, interview, respondent in zip(canonicals, interviews, respondents)
+            ],
+        )
+        session.commit()
+
+        return [
+            (interview.id, respondent.id, [pp.id for pp in pain_points])
+            for interview, respondent, pain_points in zip(interviews, respondents, pain_points_by_interview)
+        ]
+
+    async def ingest_chunk(
+        self, session: Session, canonicals: list[CanonicalIntake]
+    ) -> list[tuple[int, int, list[int]] | Exception]:
+        """Ingest a chunk in bulk, falling back to one-by-one so a bad item only fails itself.
+
+        Each intake is extracted once; the one-by-one fallback reuses those results.
+        """
+        extracted_batches = await self._extract_all(canonicals, return_exceptions=True)
+        if not any(isinstance(extracted, BaseException) for extracted in extracted_batches):
+            try:
+                return await self.ingest_batch(session, canonicals, extracted_batches)
+            except Exception:
+                await run_blocking(session.rollback)
+
+        results: list[tuple[int, int, list[int]] | Exception] = []
+        for canonical, extracted in zip(canonicals, extracted_batches):
+            if isinstance(extracted, Exception):
+                results.append(extracted)
+                continue
+            try:
+                results.append((await self.ingest_batch(session, [canonical], [extracted]))[0])
+            except Exception as exc:
+                await run_blocking(session.rollback)
+                results.append(exc)
+        return results
+
+    async def _extract_all(self, canonicals: list[CanonicalIntake], return_exceptions: bool = False) -> list[Any]:
+        """Extract every intake, at most INTAKE_EXTRACTION_MAX_CONCURRENCY at a time.
+
+        Each AI extraction can itself send several chunk requests, so this keeps a
+        large batch from queueing more requests than the per-host connection limit.
+        """
+        semaphore = asyncio.Semaphore(max(1, get_settings().intake_extraction_max_concurrency))
+
+        async def extract(canonical: CanonicalIntake) -> Extraction:
+            async with semaphore:
+                return await self._extract(canonical)
+
+        return await asyncio.gather(*(extract(canonical) for canonical in canonicals), return_exceptions=return_exceptions)
+
+    async def _extract(self, canonical: CanonicalIntake) -> Extraction:
+        if canonical.extracted_pain_points:
+            return SOURCE_PAYLOAD, canonical.extracted_pain_points
+        ai_pain_points = await self.ai_extractor.extract(canonical.transcript, canonical.call_summary)
+        if ai_pain_points:
+            return SOURCE_AI, ai_pain_points
+        return SOURCE_DETERMINISTIC, await run_blocking(
+            extract_pain_points_deterministic, canonical.transcript, canonical.call_summary
+        )
 
+    def _build_interview(self, canonical: CanonicalIntake, respondent: Respondent, transcript_redacted: str | None) -> Interview:
         transcript_raw = canonical.transcript if respondent.consent else None
-        transcript_redacted = redact_text(canonical.transcript, respondent.name) if canonical.transcript else None
 
         interview = Interview(
             respondent_id=respondent.id,
@@ -33,90 +185,42 @@ class IntakeIngestionService:
             summary_text=canonical.call_summary,
             metadata_json=canonical.metadata_json,
         )
-        session.add(interview)
-        session.flush()
-
-        extracted = canonical.extracted_pain_points
-        if not extracted:
-            ai_pain_points = await self.ai_extractor.extract(canonical.transcript, canonical.call_summary)
-            extracted = ai_pain_points or extract_pain_points_deterministic(canonical.transcript, canonical.call_summary)
-
-        pain_point_ids: list[int] = []
-        for item in extracted:
-            pain_point = PainPoint(
-                interview_id=interview.id,
-                title=item.title,
-                description=item.description,
-                category=item.category,
-                frequency_per_week=max(0.1, item.frequency_per_week),
-                minutes_per_occurrence=max(1.0, item.minutes_per_occurrence),
-                people_affected=max(1, item.people_affected),
-                systems_involved=item.systems_involved,
-                current_workaround=item.current_workaround,
-                failure_modes=item.failure_modes,
-                success_definition=item.success_definition,
-                sensitive_flag=item.sensitive_flag,
-                redaction_notes=item.redaction_notes,
-            )
-            session.add(pain_point)
-            session.flush()
-            upsert_score(session, pain_point)
-            pain_point_ids.append(pain_point.id)
+        sync_quote(interview)
+        return interview
+
+    def _upsert_respondents(self, session: Session, canonicals: list[CanonicalIntake]) -> list[Respondent]:
+        emails = {canonical.respondent.email for canonical in canonicals if canonical.respondent.email}
+        by_email: dict[str, Respondent] = {}
+        if emails:
+            by_email = {r.email: r for r in session.scalars(select(Respondent).where(Respondent.email.in_(emails)))}
+
+        respondents: list[Respondent] = []
+        for canonical in canonicals:
+            incoming = canonical.respondent
+            respondent = by_email.get(incoming.email) if incoming.email else None
+
+            if respondent is None:
+                respondent = Respondent(
+                    name=incoming.name,
+                    email=incoming.email,
+                    team=incoming.team,
+                    role=incoming.role,
+                    location=incoming.location,
+                    consent=incoming.consent,
+                )
+                session.add(respondent)
+                if incoming.email:
+                    by_email[incoming.email] = respondent
+            else:
+                # Respondents created earlier in this batch have no pain points to move yet.
+                if respondent.id is not None:
+                    move_respondent_team(session, respondent.id, respondent.team, incoming.team)
+                respondent.name = incoming.name or respondent.name
+                respondent.team = incoming.team
+                respondent.role = incoming.role
+                respondent.location = incoming.location or respondent.location
+                respondent.consent = incoming.consent
+            respondents.append(respondent)
 
-        session.commit()
-        session.refresh(respondent)
-        session.refresh(interview)
-
-        # Trigger n8n workflow if configured
-        await self._trigger_n8n(interview.id, canonical.metadata_json.get("session_id"), respondent.id)
-
-        return interview.id, respondent.id, pain_point_ids
-
-    def _upsert_respondent(self, session: Session, canonical: CanonicalIntake) -> Respondent:
-        incoming = canonical.respondent
-        respondent = None
-        if incoming.email:
-            respondent = session.scalar(select(Respondent).where(Respondent.email == incoming.email))
-
-        if respondent is None:
-            respondent = Respondent(
-                name=incoming.name,
-                email=incoming.email,
-                team=incoming.team,
-                role=incoming.role,
-                location=incoming.location,
-                consent=incoming.consent,
-            )
-            session.add(respondent)
-            session.flush()
-            return respondent
-
-        respondent.name = incoming.name or respondent.name
-        respondent.team = incoming.team
-        respondent.role = incoming.role
-        respondent.location = incoming.location or respondent.location
-        respondent.consent = incoming.consent
-        session.add(respondent)
         session.flush()
-        return respondent
-
-    async def _trigger_n8n(self, interview_id: int, session_id: str | None, respondent_id: int) -> None:
-        """Trigger n8n workflow after successful intake.
-
-        Sends interview_id, session_id, and respondent_id to configured n8n webhook.
-        Fails silently if n8n is not configured or unavailable.
-        """
-        settings = get_settings()
-        if not settings.n8n_webhook_url:
-            return
-
-        try:
-            async with httpx.AsyncClient(timeout=5) as client:
-                await client.post(
-                    settings.n8n_webhook_url,
-                    json={"interview_id": interview_id, "session_id": session_id, "respondent_id": respondent_id},
-                    headers={"x-webhook-secret": settings.n8n_webhook_secret or ""},
-                )
-        except Exception:
-            # Don't fail intake if n8n is down
-            pass
+        return respondents
@@ -0,0 +1,150 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import and_, or_, select, update
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.config import get_settings
+from app.db import SessionLocal
+from app.models.n8n_outbox import N8nOutboxMessage
+from app.services.http_client import http_clients
+from app.services.offload import run_blocking
+
+logger = logging.getLogger(__name__)
+
+OUTBOX_PENDING = "pending"
+OUTBOX_SENDING = "sending"
+OUTBOX_DELIVERED = "delivered"
+OUTBOX_DEAD = "dead"
+
+
+def enqueue_n8n_notifications(session: Session, notifications: list[tuple[int, int, str | None]]) -> None:
+    """Queue (interview_id, respondent_id, session_id) notifications in the caller's transaction."""
+    if not get_settings().n8n_webhook_url:
+        return
+    session.add_all(
+        N8nOutboxMessage(interview_id=interview_id, respondent_id=respondent_id, session_id=session_id)
+        for interview_id, respondent_id, session_id in notifications
+    )
+
+
+class N8nOutboxDispatcher:
+    """Delivers queued n8n notifications in the background with retry, backoff and dead-lettering.
+
+    Each pass first claims a batch by marking it ``sending`` with a lease in
+    one committed UPDATE, so concurrent dispatchers (one per API worker) never
+    pick up the same message. Delivery is at-least-once: a message is only
+    marked delivered after n8n accepts it, and a claim whose lease runs out
+    (the worker crashed mid-batch) is picked up again on a later pass.
+    """
+
+    def __init__(self, session_factory: sessionmaker[Session] = SessionLocal) -> None:
+        self.session_factory = session_factory
+        self.settings = get_settings()
+        self._task: asyncio.Task[None] | None = None
+        self._wake: asyncio.Event | None = None
+
+    def start(self) -> None:
+        if self._task is None and self.settings.n8n_webhook_url:
+            self._wake = asyncio.Event()
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    def notify(self) -> None:
+        """Wake the dispatcher early after new messages were committed."""
+        if self._wake is not None:
+            self._wake.set()
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        self._wake = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                with self.session_factory() as session:
+                    handled = await self.dispatch_pending(session)
+            except Exception:
+                logger.exception("n8n outbox dispatch failed")
+                handled = 0
+            if handled >= self.settings.n8n_outbox_batch_size:
+                continue
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.settings.n8n_outbox_poll_seconds)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+
+    async def dispatch_pending(self, session: Session) -> int:
+        """Claim one batch of due messages, send them concurrently and record each outcome. Returns the batch size."""
+        messages = await run_blocking(self._claim, session)
+        if not messages:
+            return 0
+        outcomes = await asyncio.gather(*(self._deliver(message) for message in messages), return_exceptions=True)
+        await run_blocking(self._record, session, messages, outcomes)
+        return len(messages)
+
+    def _claim(self, session: Session) -> list[N8nOutboxMessage]:
+        now = datetime.now(timezone.utc)
+        due = or_(
+            and_(N8nOutboxMessage.status == OUTBOX_PENDING, N8nOutboxMessage.next_attempt_at <= now),
+            and_(N8nOutboxMessage.status == OUTBOX_SENDING, N8nOutboxMessage.leased_until <= now),
+        )
+        batch = select(N8nOutboxMessage.id).where(due).order_by(N8nOutboxMessage.id).limit(self.settings.n8n_outbox_batch_size)
+        # The outer WHERE re-checks "due", so rows another dispatcher claimed first are skipped.
+        claimed = session.scalars(
+            update(N8nOutboxMessage)
+            .where(N8nOutboxMessage.id.in_(batch.scalar_subquery()), due)
+            .values(status=OUTBOX_SENDING, leased_until=now + timedelta(seconds=self.settings.n8n_outbox_lease_seconds))
+            .returning(N8nOutboxMessage.id)
+            .execution_options(synchronize_session=False)
+        ).all()
+        session.commit()
+        if not claimed:
+            return []
+        return list(session.scalars(select(N8nOutboxMessage).where(N8nOutboxMessage.id.in_(claimed)).order_by(N8nOutboxMessage.id)))
+
+    def _record(self, session: Session, messages: list[N8nOutboxMessage], outcomes: list[object]) -> None:
+        now = datetime.now(timezone.utc)
+        for message, outcome in zip(messages, outcomes):
+            message.attempts += 1
+            message.leased_until = None
+            if not isinstance(outcome, BaseException):
+                message.status = OUTBOX_DELIVERED
+                message.delivered_at = now
+                message.last_error = None
+                continue
+            message.last_error = str(outcome) or type(outcome).__name__
+            if message.attempts >= self.settings.n8n_outbox_max_attempts:
+                message.status = OUTBOX_DEAD
+                logger.warning("n8n notification %s dead-lettered after %s attempts", message.id, message.attempts)
+            else:
+                message.status = OUTBOX_PENDING
+                message.next_attempt_at = now + self._backoff(message.attempts)
+        session.commit()
+
+    def _backoff(self, attempts: int) -> timedelta:
+        seconds = self.settings.n8n_outbox_backoff_seconds * 2 ** (attempts - 1)
+        return timedelta(seconds=min(seconds, self.settings.n8n_outbox_max_backoff_seconds))
+
+    async def _deliver(self, message: N8nOutboxMessage) -> None:
+        url = self.settings.n8n_webhook_url
+        if not url:
+            raise RuntimeError("N8N_WEBHOOK_URL is not configured")
+        response = await http_clients.client_for(url).post(
+            url,
+            json={"interview_id": message.interview_id, "session_id": message.session_id, "respondent_id": message.respondent_id},
+            headers={"x-webhook-secret": self.settings.n8n_webhook_secret or ""},
+            timeout=self.settings.n8n_timeout_seconds,
+        )
+        response.raise_for_status()
+
+
+n8n_dispatcher = N8nOutboxDispatcher()
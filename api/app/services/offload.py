@@ -0,0 +1,31 @@
+import asyncio
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from typing import Any, TypeVar
+
+from app.config import get_settings
+
+T = TypeVar("T")
+
+
+@lru_cache
+def get_blocking_executor() -> ThreadPoolExecutor:
+    """Bounded pool for sync DB work and CPU-heavy parsing called from async endpoints."""
+    return ThreadPoolExecutor(max_workers=max(1, get_settings().blocking_max_workers), thread_name_prefix="blocking")
+
+
+async def run_blocking(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run ``func`` on the blocking pool so the event loop keeps serving other requests.
+
+    Callers must not touch the same Session from two places at once; awaiting each
+    call before the next keeps a request's Session on one thread at a time.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_blocking_executor(), partial(func, *args, **kwargs))
+
+
+def shutdown_blocking_executor() -> None:
+    if get_blocking_executor.cache_info().currsize:
+        get_blocking_executor().shutdown(wait=False, cancel_futures=True)
+        get_blocking_executor.cache_clear()
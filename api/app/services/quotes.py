@@ -0,0 +1,47 @@
+import re
+
+from app.models.interview import Interview
+from app.services.extraction import KEYWORD_MATCHER
+
+QUOTE_LENGTH = 220
+# Only the opening of a transcript is considered; quotes rarely improve further in and long calls stay cheap.
+QUOTE_SCAN_SENTENCES = 40
+
+_SENTENCE_RE = re.compile(r"[^\n\r.!?]*(?:[.!?]+|$)")
+_REDACTED_RE = re.compile(r"\[REDACTED_[A-Z]+\]")
+
+
+def quote_snippet(transcript_redacted: str | None) -> tuple[str | None, float]:
+    """Pick the report quote for a redacted transcript and rank how useful it is.
+
+    The quote starts at the opening sentence with the most friction hints,
+    systems and categories, and runs for up to ``QUOTE_LENGTH`` characters.
+    Sentences that are mostly redaction placeholders score lower. Without any
+    keyword hits the quote is the start of the transcript, ranked ``0``.
+    """
+    text = (transcript_redacted or "").strip()
+    if not text:
+        return None, 0.0
+
+    best_start, best_rank = 0, 0.0
+    sentences = 0
+    for match in _SENTENCE_RE.finditer(text):
+        sentence = match.group().strip()
+        if not sentence:
+            continue
+        sentences += 1
+        if sentences > QUOTE_SCAN_SENTENCES:
+            break
+        matches = KEYWORD_MATCHER.scan(sentence)
+        rank = 2.0 * len(matches.hints) + len(matches.systems) + len(matches.categories)
+        rank -= len(_REDACTED_RE.findall(sentence))
+        if rank > best_rank:
+            best_start = match.start() + len(match.group()) - len(match.group().lstrip())
+            best_rank = rank
+
+    return text[best_start : best_start + QUOTE_LENGTH].strip(), best_rank
+
+
+def sync_quote(interview: Interview) -> None:
+    """Recompute ``interview``'s report quote; call whenever ``transcript_redacted`` is written."""
+    interview.quote_snippet, interview.quote_rank = quote_snippet(interview.transcript_redacted)
@@ -1,22 +1,113 @@
 import re
+from collections.abc import Callable, Iterable, Iterator
+from functools import lru_cache
 
 EMAIL_RE = re.compile(r"\b[A-Z0-9._%+-]+@[A-Z0-9.-]+\.[A-Z]{2,}\b", re.IGNORECASE)
 PHONE_RE = re.compile(r"\b(?:\+?\d{1,2}[\s.-]?)?(?:\(?\d{3}\)?[\s.-]?)\d{3}[\s.-]?\d{4}\b")
+# Heuristic: redact "my name is X" snippets.
+NAME_INTRO_WORDS = r"[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?"
+
+REPLACEMENTS = {"email": "[REDACTED_EMAIL]", "phone": "[REDACTED_PHONE]", "name": "[REDACTED_NAME]"}
+
+
+@lru_cache(maxsize=512)
+def _redaction_pattern(name: str) -> re.Pattern[str]:
+    """All detectors as one alternation, so a transcript is scanned once.
+
+    Alternatives are tried in the order the old sequential passes ran, which
+    decides ties when two detectors match at the same position. After "my name
+    is" the respondent's name (plus a following surname) is tried before the
+    two-word heuristic, so names with digits or more than two words are not
+    cut short.
+    """
+    escaped = re.escape(name)
+    detectors = [f"(?P<email>{EMAIL_RE.pattern})", f"(?P<phone>{PHONE_RE.pattern})"]
+    if name:
+        detectors.append(f"(?P<name>{escaped})")
+    introduced = rf"{escaped}(?:\s+[A-Z][a-z]+)?|{NAME_INTRO_WORDS}" if name else NAME_INTRO_WORDS
+    detectors.append(rf"\b(?P<intro>my name is)\s+(?:{introduced})")
+    return re.compile("|".join(detectors), re.IGNORECASE)
+
+
+def _replace(match: re.Match[str]) -> str:
+    if match.lastgroup == "intro":
+        return f"{match.group('intro')} [REDACTED_NAME]"
+    return REPLACEMENTS[match.lastgroup]
 
 
 def redact_text(text: str | None, respondent_name: str | None = None) -> str | None:
     if not text:
         return text
+    return _redaction_pattern((respondent_name or "").strip()).sub(_replace, text)
+
+
+def redact_texts(items: Iterable[tuple[str | None, str | None]]) -> list[str | None]:
+    """Redact many (text, respondent_name) pairs, reusing compiled patterns and repeated results."""
+    done: dict[tuple[str | None, str | None], str | None] = {}
+    results: list[str | None] = []
+    for text, respondent_name in items:
+        key = (text, respondent_name)
+        if key not in done:
+            done[key] = redact_text(text, respondent_name)
+        results.append(done[key])
+    return results
+
+
+def iter_redacted(
+    chunks: Iterable[str],
+    respondent_name: str | None = None,
+    window_chars: int = 64 * 1024,
+    overlap_chars: int = 1024,
+) -> Iterator[str]:
+    """Redact text arriving in chunks, holding at most about ``window_chars + overlap_chars`` at once.
+
+    Each window is scanned with the same single pattern as ``redact_text``. Only
+    matches ending at least ``overlap_chars`` before the end of the buffer are
+    emitted; the tail is carried into the next window so a match spanning a chunk
+    boundary is seen whole. One already-emitted character is kept in front of the
+    carry so word boundaries resolve as they would in the full text. Matches
+    longer than ``overlap_chars`` may be missed.
+    """
+    pattern = _redaction_pattern((respondent_name or "").strip())
+    buffer = ""
+    lead = 0
+    for chunk in chunks:
+        buffer += chunk
+        if len(buffer) - lead >= window_chars + overlap_chars:
+            emitted, buffer, lead = _redact_window(pattern, buffer, lead, len(buffer) - overlap_chars)
+            if emitted:
+                yield emitted
+    if len(buffer) > lead:
+        emitted, _, _ = _redact_window(pattern, buffer, lead, len(buffer))
+        yield emitted
+
 
-    redacted = EMAIL_RE.sub("[REDACTED_EMAIL]", text)
-    redacted = PHONE_RE.sub("[REDACTED_PHONE]", redacted)
+def _redact_window(pattern: re.Pattern[str], buffer: str, lead: int, safe_end: int) -> tuple[str, str, int]:
+    """Redact ``buffer[lead:]`` up to ``safe_end``; return the output, the carried buffer and its lead."""
+    pieces: list[str] = []
+    pos = lead
+    cut = safe_end
+    for match in pattern.finditer(buffer, lead):
+        if match.end() > safe_end:
+            # This match might still grow with more text; leave it for the next window.
+            cut = max(pos, match.start())
+            break
+        pieces.append(buffer[pos : match.start()])
+        pieces.append(_replace(match))
+        pos = match.end()
+    cut = max(cut, pos)
+    pieces.append(buffer[pos:cut])
+    carry_from = max(cut - 1, 0)
+    return "".join(pieces), buffer[carry_from:], cut - carry_from
 
-    if respondent_name:
-        safe_name = respondent_name.strip()
-        if safe_name:
-            name_pattern = re.compile(re.escape(safe_name), re.IGNORECASE)
-            redacted = name_pattern.sub("[REDACTED_NAME]", redacted)
 
-    # Heuristic: redact "my name is X" snippets.
-    redacted = re.sub(r"\b(my name is)\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?", r"\1 [REDACTED_NAME]", redacted, flags=re.IGNORECASE)
-    return redacted
+def redact_stream(
+    chunks: Iterable[str],
+    write: Callable[[str], object],
+    respondent_name: str | None = None,
+    window_chars: int = 64 * 1024,
+    overlap_chars: int = 1024,
+) -> None:
+    """Redact chunked text into a sink such as ``file.write``."""
+    for piece in iter_redacted(chunks, respondent_name, window_chars, overlap_chars):
+        write(piece)
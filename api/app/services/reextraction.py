@@ -0,0 +1,189 @@
+import os
+from collections.abc import Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any
+
+from sqlalchemy import delete, exists, func, select, update
+from sqlalchemy.orm import Session
+
+from app.models.interview import Interview
+from app.models.pain_point import SOURCE_DETERMINISTIC, PainPoint
+from app.models.respondent import Respondent
+from app.models.score import Score
+from app.schemas.intake import CanonicalPainPoint
+from app.services.extraction import extract_pain_points_deterministic
+from app.services.ingestion import build_pain_point
+from app.services.redaction import redact_text
+from app.services.scoring import recompute_scores
+
+# Fields owned by the extractor. Titles are the match key; workaround and outcome notes may be hand-edited.
+EXTRACTED_FIELDS = ("description", "category", "frequency_per_week", "minutes_per_occurrence", "people_affected", "systems_involved")
+
+TranscriptRow = tuple[int, str | None, str]
+ExtractedRows = list[tuple[int, list[CanonicalPainPoint]]]
+
+
+def _extract_rows(rows: list[TranscriptRow]) -> ExtractedRows:
+    """Process-pool task for a slice of interviews; module level so it pickles."""
+    return [(interview_id, extract_pain_points_deterministic(transcript, summary)) for interview_id, transcript, summary in rows]
+
+
+def _reextractable() -> Any:
+    """Interviews whose pain points re-extraction can reproduce.
+
+    They need a stored transcript (it is NULL without consent, and the original
+    extraction read the unstored one) and at least one pain point from
+    deterministic extraction, with none from anywhere else: interviews holding
+    hand-added, AI, payload or pre-source rows are left alone, so extracted
+    items are never added beside pain points re-extraction does not own.
+    """
+    deterministic = exists().where(PainPoint.interview_id == Interview.id, PainPoint.extraction_source == SOURCE_DETERMINISTIC)
+    other_source = exists().where(PainPoint.interview_id == Interview.id, PainPoint.extraction_source != SOURCE_DETERMINISTIC)
+    return Interview.transcript_redacted.is_not(None) & deterministic & ~other_source
+
+
+def _iter_transcript_batches(session: Session, batch_size: int) -> Iterator[list[TranscriptRow]]:
+    last_id = 0
+    while True:
+        rows = session.execute(
+            select(Interview.id, Interview.transcript_redacted, Interview.summary_text)
+            .where(Interview.id > last_id, _reextractable())
+            .order_by(Interview.id)
+            .limit(batch_size)
+        ).all()
+        if not rows:
+            return
+        yield [(row.id, row.transcript_redacted, row.summary_text) for row in rows]
+        last_id = rows[-1].id
+
+
+class _Extractor:
+    """Fans batches out over a process pool, or runs inline when ``workers`` is 1."""
+
+    def __init__(self, workers: int, batch_size: int) -> None:
+        self.pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+        # Several slices per worker keep every core busy when slices finish unevenly.
+        self.slice_size = max(1, batch_size // (workers * 4))
+
+    def submit(self, rows: list[TranscriptRow]) -> list[Future[ExtractedRows]]:
+        if self.pool is None:
+            future: Future[ExtractedRows] = Future()
+            future.set_result(_extract_rows(rows))
+            return [future]
+        return [self.pool.submit(_extract_rows, rows[start : start + self.slice_size]) for start in range(0, len(rows), self.slice_size)]
+
+    def shutdown(self) -> None:
+        if self.pool is not None:
+            self.pool.shutdown(cancel_futures=True)
+
+
+def reextract_pain_points(
+    session: Session,
+    *,
+    dry_run: bool = True,
+    prune: bool = False,
+    batch_size: int = 500,
+    workers: int | None = None,
+) -> dict[str, int]:
+    """Re-run deterministic extraction over stored redacted transcripts and reconcile pain points.
+
+    Only interviews whose pain points all came from deterministic extraction
+    are touched; the rest are counted as ``skipped``. Interviews are read by id
+    in batches of ``batch_size``. The next batch is extracted on the process
+    pool while the current one is diffed and written. Extracted items are
+    matched to stored pain points by normalised title: matches get their
+    extracted fields updated and new titles are inserted. The original
+    extraction read the raw transcript, so an interview with PII in a stored
+    title would not match its redacted re-extraction; such interviews are
+    skipped too. With ``prune``, pain points whose title was not re-extracted
+    are removed. Scores and aggregates are recomputed once at the end. With
+    ``dry_run`` nothing is written and only the counts are returned.
+    """
+    extractor = _Extractor(max(1, workers or os.cpu_count() or 1), batch_size)
+    summary = {"interviews": 0, "skipped": 0, "added": 0, "updated": 0, "removed": 0, "unchanged": 0}
+
+    try:
+        batches = _iter_transcript_batches(session, batch_size)
+        batch = next(batches, None)
+        pending = extractor.submit(batch) if batch else []
+        while pending:
+            extracted = [row for future in pending for row in future.result()]
+            batch = next(batches, None)
+            pending = extractor.submit(batch) if batch else []
+            _apply_batch(session, extracted, summary, dry_run=dry_run, prune=prune)
+    finally:
+        extractor.shutdown()
+    summary["skipped"] = (session.scalar(select(func.count(Interview.id))) or 0) - summary["interviews"]
+
+    if not dry_run and summary["added"] + summary["updated"] + summary["removed"]:
+        recompute_scores(session)
+    return summary
+
+
+def _apply_batch(
+    session: Session,
+    extracted: ExtractedRows,
+    summary: dict[str, int],
+    *,
+    dry_run: bool,
+    prune: bool,
+) -> None:
+    interview_ids = [interview_id for interview_id, _ in extracted]
+    stored_by_interview: dict[int, dict[str, PainPoint]] = {interview_id: {} for interview_id in interview_ids}
+    stored_rows = session.execute(
+        select(PainPoint, Respondent.name)
+        .join(Interview, Interview.id == PainPoint.interview_id)
+        .join(Respondent, Respondent.id == Interview.respondent_id)
+        .where(PainPoint.interview_id.in_(interview_ids))
+    )
+    # Stored titles came from the raw transcript and re-extracted ones from the redacted copy, so
+    # an interview with PII in a title cannot be matched up: its titles would be re-added redacted.
+    unmatchable: set[int] = set()
+    for pain_point, respondent_name in stored_rows:
+        if redact_text(pain_point.title, respondent_name) != pain_point.title:
+            unmatchable.add(pain_point.interview_id)
+        stored_by_interview[pain_point.interview_id].setdefault(pain_point.title_key, pain_point)
+    extracted = [(interview_id, items) for interview_id, items in extracted if interview_id not in unmatchable]
+
+    inserts: list[PainPoint] = []
+    updates: list[dict[str, Any]] = []
+    removals: list[int] = []
+    for interview_id, items in extracted:
+        stored = stored_by_interview[interview_id]
+        seen: set[str] = set()
+        for item in items:
+            candidate = build_pain_point(interview_id, item, SOURCE_DETERMINISTIC)
+            if candidate.title_key in seen:
+                continue
+            seen.add(candidate.title_key)
+            existing = stored.get(candidate.title_key)
+            if existing is None:
+                inserts.append(candidate)
+            elif any(getattr(existing, field) != getattr(candidate, field) for field in EXTRACTED_FIELDS):
+                updates.append({"id": existing.id, **{field: getattr(candidate, field) for field in EXTRACTED_FIELDS}})
+            else:
+                summary["unchanged"] += 1
+        if prune:
+            removals.extend(
+                pain_point.id
+                for key, pain_point in stored.items()
+                if key not in seen
+            )
+
+    summary["interviews"] += len(extracted)
+    summary["added"] += len(inserts)
+    summary["updated"] += len(updates)
+    summary["removed"] += len(removals)
+
+    # Drop this batch's objects so memory stays flat across the whole corpus.
+    session.expunge_all()
+    if dry_run:
+        return
+
+    if removals:
+        session.execute(delete(Score).where(Score.pain_point_id.in_(removals)))
+        session.execute(delete(PainPoint).where(PainPoint.id.in_(removals)))
+    if updates:
+        session.execute(update(PainPoint), updates)
+    session.add_all(inserts)
+    session.commit()
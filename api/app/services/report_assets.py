@@ -0,0 +1,62 @@
+import threading
+from pathlib import Path
+from typing import Any
+
+
+class ReportAssets:
+    """Report templates and stylesheet held in memory.
+
+    Compiled templates live in the Jinja environment; the stylesheet text and its
+    parsed WeasyPrint ``CSS`` are loaded once. With ``auto_reload`` both are
+    reloaded when their file's mtime changes, which costs a ``stat`` per use;
+    without it the files are not touched again after the first load.
+    """
+
+    def __init__(self, template_dir: Path, css_path: Path, auto_reload: bool = False) -> None:
+        self.template_dir = template_dir
+        self.css_path = css_path
+        self.auto_reload = auto_reload
+        self._environment: Any = None
+        self._css_mtime: float | None = None
+        self._css_text: str | None = None
+        self._parsed_css: Any = None
+        self._lock = threading.Lock()
+
+    def template(self, name: str) -> Any:
+        with self._lock:
+            if self._environment is None:
+                # Jinja is imported on first use rather than at app import.
+                from jinja2 import Environment, FileSystemLoader
+
+                self._environment = Environment(
+                    loader=FileSystemLoader(str(self.template_dir)),
+                    autoescape=True,
+                    auto_reload=self.auto_reload,
+                )
+            environment = self._environment
+        return environment.get_template(name)
+
+    def css_text(self) -> str:
+        with self._lock:
+            return self._load_css()
+
+    def weasyprint_css(self, css_class: Any) -> Any:
+        """The stylesheet parsed once by WeasyPrint's ``CSS`` class, for ``write_pdf(stylesheets=...)``."""
+        with self._lock:
+            text = self._load_css()
+            if self._parsed_css is None:
+                self._parsed_css = css_class(string=text, base_url=str(self.template_dir))
+            return self._parsed_css
+
+    def _load_css(self) -> str:
+        if self._css_text is not None and not self.auto_reload:
+            return self._css_text
+        try:
+            mtime: float | None = self.css_path.stat().st_mtime
+        except FileNotFoundError:
+            mtime = None
+        if self._css_text is None or mtime != self._css_mtime:
+            self._css_text = self.css_path.read_text(encoding="utf-8") if mtime is not None else ""
+            self._css_mtime = mtime
+            self._parsed_css = None
+        return self._css_text
@@ -0,0 +1,45 @@
+import hashlib
+import threading
+from collections import OrderedDict
+
+
+class ReportRenderCache:
+    """Small thread-safe LRU of rendered report bodies keyed by ETag."""
+
+    def __init__(self, max_entries: int = 32) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, bytes] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            content = self._entries.get(key)
+            if content is not None:
+                self._entries.move_to_end(key)
+            return content
+
+    def put(self, key: str, content: bytes) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = content
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def build_report_etag(kind: str, data_version: str, *params: object) -> str:
+    digest = hashlib.sha256("|".join([kind, data_version, *map(str, params)]).encode()).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [value.strip() for value in if_none_match.split(",")]
+    # If-None-Match uses weak comparison, so W/ prefixed validators still match.
+    return "*" in candidates or etag in {value.removeprefix("W/") for value in candidates}
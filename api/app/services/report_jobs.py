@@ -0,0 +1,192 @@
+import logging
+import os
+import socket
+import threading
+import uuid
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from sqlalchemy import delete, or_, select, update
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.config import get_settings
+from app.db import SessionLocal
+from app.models.report_run import ReportRun
+
+logger = logging.getLogger(__name__)
+
+JOB_PENDING = "pending"
+JOB_RUNNING = "running"
+JOB_COMPLETED = "completed"
+JOB_FAILED = "failed"
+# ReportRun.source for rows created here; other sources (e.g. /report/attach) are not job outputs.
+JOB_SOURCE = "job"
+
+
+class ReportJobService:
+    """Renders report PDFs on a bounded worker pool and records them as ReportRun rows.
+
+    Finished jobs and their files are deleted by ``purge_expired`` once older
+    than REPORT_JOB_RETENTION_DAYS; the API calls it at startup. Jobs are
+    stamped with this service's ``owner`` id. While any of them is
+    pending or running, a background thread refreshes their ``heartbeat_at``
+    every REPORT_JOB_HEARTBEAT_SECONDS, so other processes can tell a job that
+    is still being rendered from one whose process died.
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        output_dir: str | None = None,
+        session_factory: sessionmaker[Session] = SessionLocal,
+        read_session_factory: Callable[[], Session] | None = None,
+    ) -> None:
+        settings = get_settings()
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.heartbeat_seconds = settings.report_job_heartbeat_seconds
+        self.stale_seconds = settings.report_job_stale_seconds
+        self.retention_days = settings.report_job_retention_days
+        self.output_dir = Path(output_dir or settings.report_output_dir)
+        self.session_factory = session_factory
+        # Renders only read, so they can run on a replica instead of competing with intake writes.
+        self.read_session_factory = read_session_factory or session_factory
+        # The pool size is the render concurrency cap; extra jobs wait in the executor queue.
+        self.executor = ThreadPoolExecutor(
+            max_workers=max(1, max_workers or settings.report_max_concurrent_renders),
+            thread_name_prefix="report-render",
+        )
+        self._heartbeat_thread: threading.Thread | None = None
+        self._stopping = threading.Event()
+        self._lock = threading.Lock()
+
+    def submit(
+        self,
+        session: Session,
+        render: Callable[[Session], bytes],
+        session_id: str | None = None,
+        interview_id: int | None = None,
+    ) -> ReportRun:
+        report_run = ReportRun(
+            source=JOB_SOURCE,
+            session_id=session_id,
+            interview_id=interview_id,
+            status=JOB_PENDING,
+            owner=self.owner,
+            heartbeat_at=datetime.now(timezone.utc),
+        )
+        session.add(report_run)
+        session.commit()
+        session.refresh(report_run)
+
+        self._start_heartbeat()
+        self.executor.submit(self._run, report_run.id, render)
+        return report_run
+
+    def _run(self, report_run_id: int, render: Callable[[Session], bytes]) -> None:
+        with self.session_factory() as session:
+            report_run = session.get(ReportRun, report_run_id)
+            if report_run is None:
+                return
+            report_run.status = JOB_RUNNING
+            session.commit()
+
+            try:
+                with self.read_session_factory() as read_session:
+                    pdf = render(read_session)
+                self.output_dir.mkdir(parents=True, exist_ok=True)
+                path = self.output_dir / f"report-{report_run_id}.pdf"
+                path.write_bytes(pdf)
+                report_run.pdf_path_or_url = str(path)
+                report_run.status = JOB_COMPLETED
+            except Exception as exc:
+                logger.exception("Report job %s failed", report_run_id)
+                session.rollback()
+                report_run = session.get(ReportRun, report_run_id)
+                report_run.status = JOB_FAILED
+                report_run.error = str(getattr(exc, "detail", None) or exc)
+            session.commit()
+
+    def output_file(self, report_run: ReportRun) -> Path | None:
+        """The PDF a job wrote, or None for rows this service did not render or paths outside ``output_dir``."""
+        if report_run.source != JOB_SOURCE or not report_run.pdf_path_or_url:
+            return None
+        path = Path(report_run.pdf_path_or_url).resolve()
+        if not path.is_relative_to(self.output_dir.resolve()):
+            return None
+        return path
+
+    def fail_interrupted(self, session: Session) -> None:
+        """Mark jobs whose owning process stopped heartbeating as failed.
+
+        Jobs that live workers are still rendering keep a fresh heartbeat and are
+        left alone. Jobs without one predate heartbeats and cannot still be running.
+        """
+        stale_before = datetime.now(timezone.utc) - timedelta(seconds=self.stale_seconds)
+        session.execute(
+            update(ReportRun)
+            .where(
+                ReportRun.status.in_([JOB_PENDING, JOB_RUNNING]),
+                or_(ReportRun.heartbeat_at.is_(None), ReportRun.heartbeat_at < stale_before),
+            )
+            .values(status=JOB_FAILED, error="Interrupted by API restart")
+        )
+        session.commit()
+
+    def purge_expired(self, session: Session) -> int:
+        """Delete finished jobs older than REPORT_JOB_RETENTION_DAYS with their PDFs. Returns the rows removed.
+
+        Stray ``report-*.pdf`` files in ``output_dir`` past the same age, such as
+        ones whose row was deleted, are removed too. A retention of 0 keeps everything.
+        """
+        if self.retention_days <= 0:
+            return 0
+        cutoff = datetime.now(timezone.utc) - timedelta(days=self.retention_days)
+        expired = session.scalars(
+            select(ReportRun).where(
+                ReportRun.source == JOB_SOURCE,
+                ReportRun.status.in_([JOB_COMPLETED, JOB_FAILED]),
+                ReportRun.created_at < cutoff,
+            )
+        ).all()
+        for report_run in expired:
+            path = self.output_file(report_run)
+            if path is not None:
+                path.unlink(missing_ok=True)
+        if expired:
+            session.execute(delete(ReportRun).where(ReportRun.id.in_([report_run.id for report_run in expired])))
+            session.commit()
+
+        if self.output_dir.is_dir():
+            for path in self.output_dir.glob("report-*.pdf"):
+                if datetime.fromtimestamp(path.stat().st_mtime, timezone.utc) < cutoff:
+                    path.unlink(missing_ok=True)
+        return len(expired)
+
+    def _start_heartbeat(self) -> None:
+        with self._lock:
+            if self._heartbeat_thread is None and not self._stopping.is_set():
+                self._heartbeat_thread = threading.Thread(target=self._heartbeat_loop, name="report-heartbeat", daemon=True)
+                self._heartbeat_thread.start()
+
+    def _heartbeat_loop(self) -> None:
+        while not self._stopping.wait(self.heartbeat_seconds):
+            try:
+                self.heartbeat()
+            except Exception:
+                logger.exception("Report job heartbeat failed")
+
+    def heartbeat(self) -> None:
+        """Refresh ``heartbeat_at`` on this service's unfinished jobs."""
+        with self.session_factory() as session:
+            session.execute(
+                update(ReportRun)
+                .where(ReportRun.owner == self.owner, ReportRun.status.in_([JOB_PENDING, JOB_RUNNING]))
+                .values(heartbeat_at=datetime.now(timezone.utc))
+            )
+            session.commit()
+
+    def shutdown(self) -> None:
+        self._stopping.set()
+        self.executor.shutdown(wait=False, cancel_futures=True)
@@ -1,12 +1,23 @@
 from datetime import datetime, timezone
+from typing import Any
 
-from sqlalchemy import func, select
+from sqlalchemy import func, insert, select, update
 from sqlalchemy.orm import Session
 
 from app.config import get_settings
 from app.models.enums import AutomationTypeEnum, PainCategoryEnum
 from app.models.pain_point import PainPoint
 from app.models.score import Score
+from app.services.aggregates import (
+    AggregateContribution,
+    add_contributions,
+    apply_contribution_change,
+    pain_point_team,
+    rebuild_dashboard_aggregates,
+    rebuild_title_mentions,
+    title_mention_count,
+    title_mention_counts,
+)
 
 
 def calculate_impact_hours_per_week(pain_point: PainPoint) -> float:
@@ -59,7 +70,7 @@ def infer_automation_type(pain_point: PainPoint, effort_score: int) -> Automatio
     return AutomationTypeEnum.api_integration
 
 
-def infer_confidence_score(session: Session, pain_point: PainPoint) -> float:
+def confidence_from_repeats(pain_point: PainPoint, repeated_mentions: int) -> float:
     fields = [
         bool(pain_point.title),
         bool(pain_point.description),
@@ -71,9 +82,7 @@ def infer_confidence_score(session: Session, pain_point: PainPoint) -> float:
     ]
     completeness = sum(fields) / len(fields)
 
-    repeats_stmt = select(func.count(PainPoint.id)).where(func.lower(PainPoint.title) == pain_point.title.lower())
-    repeated_mentions = session.scalar(repeats_stmt) or 1
-    repeat_factor = min(1.0, repeated_mentions / 3)
+    repeat_factor = min(1.0, max(1, repeated_mentions) / 3)
 
     clarity_factor = 1.0 if len((pain_point.description or "").split()) >= 10 else 0.6
 
@@ -81,6 +90,10 @@ def infer_confidence_score(session: Session, pain_point: PainPoint) -> float:
     return round(min(1.0, max(0.1, confidence)), 2)
 
 
+def infer_confidence_score(session: Session, pain_point: PainPoint) -> float:
+    return confidence_from_repeats(pain_point, title_mention_count(session, pain_point.title_key))
+
+
 def suggest_solution(pain_point: PainPoint, automation_type: AutomationTypeEnum) -> str:
     systems = ", ".join(pain_point.systems_involved) if pain_point.systems_involved else "existing systems"
     if automation_type == AutomationTypeEnum.low_code:
@@ -106,14 +119,11 @@ def suggest_owner(pain_point: PainPoint) -> str:
     return mapping.get(pain_point.category, "COO / Operations Excellence")
 
 
-def upsert_score(session: Session, pain_point: PainPoint) -> Score:
-    settings = get_settings()
+def build_score_values(pain_point: PainPoint, confidence: float, quick_win_threshold: float) -> dict[str, Any]:
     impact = calculate_impact_hours_per_week(pain_point)
     effort = infer_effort_score(pain_point)
-    confidence = infer_confidence_score(session, pain_point)
     priority = round((impact * confidence) / effort, 4)
     automation_type = infer_automation_type(pain_point, effort)
-    quick_win = effort <= 2 and impact >= settings.report_quickwin_impact_threshold_hours
 
     rationale = (
         f"Impact={impact}h/week from frequency({pain_point.frequency_per_week}) x duration({pain_point.minutes_per_occurrence}m)"
@@ -121,33 +131,144 @@ def upsert_score(session: Session, pain_point: PainPoint) -> Score:
         f" effort={effort} based on systems complexity ({len(pain_point.systems_involved)} systems)."
     )
 
+    return {
+        "impact_hours_per_week": impact,
+        "effort_score": effort,
+        "confidence_score": confidence,
+        "priority_score": priority,
+        "rationale": rationale,
+        "automation_type": automation_type,
+        "suggested_solution": suggest_solution(pain_point, automation_type),
+        "dependencies": ", ".join(pain_point.systems_involved) if pain_point.systems_involved else None,
+        "owner_suggestion": suggest_owner(pain_point),
+        "quick_win": effort <= 2 and impact >= quick_win_threshold,
+        "updated_at": datetime.now(timezone.utc),
+    }
+
+
+def upsert_score(session: Session, pain_point: PainPoint, previous: AggregateContribution | None = None) -> Score:
+    """Score a pain point and keep the dashboard aggregates in step.
+
+    ``previous`` is the pain point's aggregate contribution captured before an edit;
+    when omitted it is derived from the stored score, which is only correct if the
+    team and category have not changed since that score was written.
+    """
+    settings = get_settings()
+    team = pain_point_team(session, pain_point)
     score = session.scalar(select(Score).where(Score.pain_point_id == pain_point.id))
     if score is None:
-        score = Score(pain_point_id=pain_point.id)
-        session.add(score)
+        before = previous
+    else:
+        before = previous or AggregateContribution(team, pain_point.category, score.impact_hours_per_week, pain_point.title_key)
+
+    # Update the counters first so the title mention count includes this pain point.
+    impact = calculate_impact_hours_per_week(pain_point)
+    apply_contribution_change(session, before, AggregateContribution(team, pain_point.category, impact, pain_point.title_key))
 
-    score.impact_hours_per_week = impact
-    score.effort_score = effort
-    score.confidence_score = confidence
-    score.priority_score = priority
-    score.rationale = rationale
-    score.automation_type = automation_type
-    score.suggested_solution = suggest_solution(pain_point, automation_type)
-    score.dependencies = ", ".join(pain_point.systems_involved) if pain_point.systems_involved else None
-    score.owner_suggestion = suggest_owner(pain_point)
-    score.quick_win = quick_win
-    score.updated_at = datetime.now(timezone.utc)
+    confidence = infer_confidence_score(session, pain_point)
+    values = build_score_values(pain_point, confidence, settings.report_quickwin_impact_threshold_hours)
+    if score is None:
+        score = Score(pain_point_id=pain_point.id, **values)
+        session.add(score)
+    else:
+        for field, value in values.items():
+            setattr(score, field, value)
     return score
 
 
+def score_new_pain_points(session: Session, pain_points: list[PainPoint], teams: dict[int, str]) -> None:
+    """Score freshly flushed pain points with one counter pass and one executemany INSERT.
+
+    ``teams`` maps interview id to respondent team for the dashboard aggregates.
+    """
+    if not pain_points:
+        return
+    settings = get_settings()
+
+    add_contributions(
+        session,
+        (
+            AggregateContribution(
+                teams.get(pain_point.interview_id, "Unknown"),
+                pain_point.category,
+                calculate_impact_hours_per_week(pain_point),
+                pain_point.title_key,
+            )
+            for pain_point in pain_points
+        ),
+    )
+    mentions = title_mention_counts(session, (pain_point.title_key for pain_point in pain_points))
+
+    rows = [
+        {
+            "pain_point_id": pain_point.id,
+            **build_score_values(
+                pain_point,
+                confidence_from_repeats(pain_point, mentions.get(pain_point.title_key, 1)),
+                settings.report_quickwin_impact_threshold_hours,
+            ),
+        }
+        for pain_point in pain_points
+    ]
+    session.execute(insert(Score), rows)
+
+
 def recompute_scores(session: Session, pain_point_id: int | None = None) -> list[Score]:
-    stmt = select(PainPoint)
+    """Re-score pain points in bulk.
+
+    Repeat counts come from one GROUP BY on the indexed title_key and existing score ids from one query, so the
+    work is a fixed number of statements plus two executemany writes however many pain
+    points are recomputed.
+    """
+    settings = get_settings()
+    pain_point_stmt = select(PainPoint)
+    score_stmt = select(Score.pain_point_id, Score.id, Score.impact_hours_per_week)
     if pain_point_id is not None:
-        stmt = stmt.where(PainPoint.id == pain_point_id)
+        pain_point_stmt = pain_point_stmt.where(PainPoint.id == pain_point_id)
+        score_stmt = score_stmt.where(Score.pain_point_id == pain_point_id)
 
-    pain_points = session.scalars(stmt).all()
-    results = [upsert_score(session, pain_point) for pain_point in pain_points]
+    pain_points = session.scalars(pain_point_stmt).all()
+    if not pain_points:
+        return []
+
+    repeats_stmt = select(PainPoint.title_key, func.count(PainPoint.id)).group_by(PainPoint.title_key)
+    if pain_point_id is not None:
+        repeats_stmt = repeats_stmt.where(PainPoint.title_key == pain_points[0].title_key)
+    repeat_counts = dict(session.execute(repeats_stmt).all())
+    existing = {row.pain_point_id: row for row in session.execute(score_stmt).all()}
+
+    inserts: list[dict[str, Any]] = []
+    updates: list[dict[str, Any]] = []
+    for pain_point in pain_points:
+        confidence = confidence_from_repeats(pain_point, repeat_counts.get(pain_point.title_key, 1))
+        values = build_score_values(pain_point, confidence, settings.report_quickwin_impact_threshold_hours)
+        stored = existing.get(pain_point.id)
+        if stored is None:
+            inserts.append({"pain_point_id": pain_point.id, **values})
+        else:
+            updates.append({"id": stored.id, **values})
+
+    if inserts:
+        session.execute(insert(Score), inserts)
+    if updates:
+        session.execute(update(Score), updates)
+
+    if pain_point_id is None:
+        rebuild_dashboard_aggregates(session)
+        rebuild_title_mentions(session)
+    else:
+        pain_point = pain_points[0]
+        team = pain_point_team(session, pain_point)
+        stored = existing.get(pain_point.id)
+        before = (
+            AggregateContribution(team, pain_point.category, stored.impact_hours_per_week, pain_point.title_key) if stored else None
+        )
+        after_impact = (inserts or updates)[0]["impact_hours_per_week"]
+        after = AggregateContribution(team, pain_point.category, after_impact, pain_point.title_key)
+        apply_contribution_change(session, before, after)
     session.commit()
-    for score in results:
-        session.refresh(score)
-    return results
+
+    results_stmt = select(Score).order_by(Score.pain_point_id)
+    if pain_point_id is not None:
+        results_stmt = results_stmt.where(Score.pain_point_id == pain_point_id)
+    return session.scalars(results_stmt).all()
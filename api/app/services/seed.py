@@ -7,6 +7,9 @@ from app.models.enums import ChannelEnum, PainCategoryEnum
 from app.models.interview import Interview
 from app.models.pain_point import PainPoint
 from app.models.respondent import Respondent
+from app.models.score import Score
+from app.services.aggregates import rebuild_dashboard_aggregates, rebuild_title_mentions
+from app.services.quotes import sync_quote
 from app.services.redaction import redact_text
 from app.services.scoring import upsert_score
 
@@ -105,9 +108,13 @@ PAIN_TEMPLATES = [
 
 def seed_demo_data(session: Session, interview_count: int = 24, reset: bool = False) -> dict[str, int]:
     if reset:
+        # Bulk deletes skip ORM cascades, so clear scores explicitly.
+        session.query(Score).delete()
         session.query(PainPoint).delete()
         session.query(Interview).delete()
         session.query(Respondent).delete()
+        rebuild_dashboard_aggregates(session)
+        rebuild_title_mentions(session)
         session.commit()
 
     rng = random.Random(42)
@@ -154,6 +161,7 @@ def seed_demo_data(session: Session, interview_count: int = 24, reset: bool = Fa
             summary_text=f"Key friction in {team}: {template['title']}.",
             metadata_json={"demo_mode": True, "seed_index": idx + 1},
         )
+        sync_quote(interview)
         session.add(interview)
         session.flush()
         interviews_created += 1
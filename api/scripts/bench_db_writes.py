@@ -0,0 +1,116 @@
+import argparse
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from sqlalchemy import Engine, create_engine, func, select
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.db import Base, build_engine
+from app.models import Interview, Respondent
+from app.models.enums import ChannelEnum
+
+TRANSCRIPT = "We reconcile invoices manually in Excel every week and chase approvals on Slack. " * 40
+
+
+def default_engine(url: str) -> Engine:
+    """The engine as it was created before pooling and pragmas were configurable."""
+    return create_engine(url, future=True, connect_args={"check_same_thread": False})
+
+
+def run(engine: Engine, writers: int, readers: int, transactions: int) -> dict[str, float]:
+    Base.metadata.create_all(bind=engine)
+    committed = 0
+    failed = 0
+    reads = 0
+    lock = threading.Lock()
+    writing = threading.Event()
+    writing.set()
+
+    def write() -> None:
+        nonlocal committed, failed
+        for idx in range(transactions):
+            with Session(engine) as session:
+                try:
+                    respondent = Respondent(team="Finance", role="Analyst", consent=True)
+                    session.add(respondent)
+                    session.flush()
+                    session.add(
+                        Interview(
+                            respondent_id=respondent.id,
+                            channel=ChannelEnum.internal,
+                            transcript_redacted=TRANSCRIPT,
+                            summary_text=f"write {idx}",
+                            metadata_json={},
+                        )
+                    )
+                    session.commit()
+                    outcome = "committed"
+                except OperationalError:
+                    session.rollback()
+                    outcome = "failed"
+            with lock:
+                if outcome == "committed":
+                    committed += 1
+                else:
+                    failed += 1
+
+    def read() -> None:
+        nonlocal reads
+        while writing.is_set():
+            with Session(engine) as session:
+                try:
+                    session.execute(select(func.count(Interview.id), func.max(Interview.quote_rank))).one()
+                except OperationalError:
+                    continue
+            with lock:
+                reads += 1
+
+    reader_threads = [threading.Thread(target=read) for _ in range(readers)]
+    writer_threads = [threading.Thread(target=write) for _ in range(writers)]
+    started = time.perf_counter()
+    for thread in reader_threads + writer_threads:
+        thread.start()
+    for thread in writer_threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    writing.clear()
+    for thread in reader_threads:
+        thread.join()
+    engine.dispose()
+    return {
+        "committed": committed,
+        "failed": failed,
+        "reads": reads,
+        "seconds": round(elapsed, 2),
+        "commits_per_second": round(committed / elapsed, 1),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare concurrent SQLite write throughput with and without the tuned engine")
+    parser.add_argument("--writers", type=int, default=8, help="Concurrent writer threads")
+    parser.add_argument("--readers", type=int, default=2, help="Concurrent reader threads polling during the writes")
+    parser.add_argument("--transactions", type=int, default=200, help="Commits per writer")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        before_url = f"sqlite:///{Path(tmp) / 'before.db'}"
+        after_url = f"sqlite:///{Path(tmp) / 'after.db'}"
+        before = run(default_engine(before_url), args.writers, args.readers, args.transactions)
+        after = run(
+            build_engine(get_settings().model_copy(update={"database_url": after_url})),
+            args.writers,
+            args.readers,
+            args.transactions,
+        )
+
+    print(f"before (defaults):      {before}")
+    print(f"after (WAL + pragmas):  {after}")
+
+
+if __name__ == "__main__":
+    main()
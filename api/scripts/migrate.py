@@ -0,0 +1,24 @@
+import argparse
+
+from app.db import engine
+from app.migrations import applied_versions, load_migrations, run_migrations
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Apply pending schema migrations")
+    parser.add_argument("--status", action="store_true", help="Only list applied and pending migrations")
+    args = parser.parse_args()
+
+    if args.status:
+        applied = applied_versions(engine) or set()
+        for migration in load_migrations():
+            state = "applied" if migration.version in applied else "pending"
+            print(f"{migration.version:04d}_{migration.name}: {state}")
+        return
+
+    done = run_migrations(engine)
+    print(f"Applied migrations: {', '.join(f'{version:04d}' for version in done) or 'none pending'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+import argparse
+import re
+import subprocess
+import sys
+from collections import Counter
+
+IMPORTTIME_RE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)$")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Break down API import time by module and by top-level package")
+    parser.add_argument("--module", default="app.main", help="Module to import (default: app.main)")
+    parser.add_argument("--top", type=int, default=25, help="Number of slowest modules to list")
+    args = parser.parse_args()
+
+    # A fresh interpreter, so nothing is already imported and the numbers match a cold start.
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {args.module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    modules: list[tuple[str, int, int]] = []
+    by_package: Counter[str] = Counter()
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_RE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, name = int(match.group(1)), int(match.group(2)), match.group(4)
+        modules.append((name, self_us, cumulative_us))
+        by_package[name.split(".")[0]] += self_us
+
+    total_us = sum(self_us for _, self_us, _ in modules)
+    print(f"Importing {args.module}: {total_us / 1000:.0f} ms across {len(modules)} modules\n")
+    print("By top-level package (self time):")
+    for package, self_us in by_package.most_common(15):
+        print(f"  {self_us / 1000:8.1f} ms  {package}")
+    print(f"\nSlowest {args.top} modules (cumulative / self):")
+    for name, self_us, cumulative_us in sorted(modules, key=lambda item: item[2], reverse=True)[: args.top]:
+        print(f"  {cumulative_us / 1000:8.1f} ms  {self_us / 1000:7.1f} ms  {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,20 @@
+import argparse
+
+from app.services.redaction import redact_stream
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Redact a transcript file without loading it into memory")
+    parser.add_argument("source", help="Transcript file to read")
+    parser.add_argument("target", help="File to write the redacted transcript to")
+    parser.add_argument("--name", default=None, help="Respondent name to redact")
+    parser.add_argument("--window", type=int, default=64 * 1024, help="Characters redacted per window")
+    args = parser.parse_args()
+
+    with open(args.source, encoding="utf-8") as source, open(args.target, "w", encoding="utf-8") as target:
+        chunks = iter(lambda: source.read(args.window), "")
+        redact_stream(chunks, target.write, args.name, window_chars=args.window)
+
+
+if __name__ == "__main__":
+    main()
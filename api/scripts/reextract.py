@@ -0,0 +1,29 @@
+import argparse
+
+from app.db import SessionLocal, init_db
+from app.services.reextraction import reextract_pain_points
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Re-run deterministic extraction over stored transcripts")
+    parser.add_argument("--apply", action="store_true", help="Write changes (default is a dry run that only reports counts)")
+    parser.add_argument("--prune", action="store_true", help="Remove stored pain points that are no longer extracted")
+    parser.add_argument("--batch-size", type=int, default=500, help="Interviews read and written per batch")
+    parser.add_argument("--workers", type=int, default=None, help="Extraction processes (default: CPU count)")
+    args = parser.parse_args()
+
+    init_db()
+    with SessionLocal() as session:
+        results = reextract_pain_points(
+            session,
+            dry_run=not args.apply,
+            prune=args.prune,
+            batch_size=max(1, args.batch_size),
+            workers=args.workers,
+        )
+
+    print(f"Re-extraction {'applied' if args.apply else 'dry run'}: {results}")
+
+
+if __name__ == "__main__":
+    main()
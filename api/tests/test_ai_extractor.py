@@ -0,0 +1,80 @@
+import asyncio
+
+from app.config import get_settings
+from app.services.ai_extractor import AIExtractor, merge_chunk_results, split_transcript
+from app.services.extraction_cache import ExtractionCache, MemoryExtractionCache
+
+
+def item(title: str, systems: list[str]) -> dict:
+    return {"title": title, "description": title, "category": "other", "systems_involved": systems}
+
+
+def test_split_transcript_overlaps_and_covers_the_text() -> None:
+    text = " ".join(f"Sentence {idx} about manual work." for idx in range(200))
+    chunks = split_transcript(text, chunk_chars=500, overlap_chars=100)
+
+    assert len(chunks) > 1
+    assert all(len(chunk) <= 500 for chunk in chunks)
+    assert chunks[0] == text[: len(chunks[0])]
+    assert text.endswith(chunks[-1])
+    for previous, current in zip(chunks, chunks[1:]):
+        assert previous[-100:] == current[:100]
+    assert split_transcript("short", chunk_chars=500, overlap_chars=100) == ["short"]
+
+
+def test_merge_dedupes_by_normalised_title_and_pools_systems() -> None:
+    merged = merge_chunk_results(
+        [[item("Manual  Invoice chasing", ["Excel"])], [item("manual invoice chasing ", ["Xero", "Excel"]), item("Access", [])]]
+    )
+    assert [entry["title"] for entry in merged] == ["Manual  Invoice chasing", "Access"]
+    assert merged[0]["systems_involved"] == ["Excel", "Xero"]
+
+
+def test_long_transcripts_are_extracted_concurrently_in_chunks(monkeypatch) -> None:
+    settings = get_settings()
+    monkeypatch.setattr(settings, "ai_provider", "ollama")
+    monkeypatch.setattr(settings, "extraction_chunk_chars", 200)
+    monkeypatch.setattr(settings, "extraction_max_concurrent_chunks", 2)
+    monkeypatch.setattr("app.services.ai_extractor.get_extraction_cache", lambda: ExtractionCache(None))
+    extractor = AIExtractor()
+    in_flight = peak = 0
+
+    async def fake_ollama(body: dict) -> list[dict]:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return [item("Shared pain", ["Excel"]), item(f"Chunk {body['transcript'][:12]}", [])]
+
+    monkeypatch.setattr(extractor, "_extract_ollama", fake_ollama)
+
+    transcript = "\n".join(f"Line {idx:03d} we rekey data by hand." for idx in range(40))
+    pain_points = asyncio.run(extractor.extract(transcript, "summary"))
+
+    chunk_count = len(split_transcript(transcript, 200, settings.extraction_chunk_overlap_chars))
+    assert peak == 2
+    assert len(pain_points) == chunk_count + 1
+    assert sum(1 for pain_point in pain_points if pain_point.title == "Shared pain") == 1
+
+
+def test_extraction_with_a_failed_chunk_is_returned_but_not_cached(monkeypatch) -> None:
+    settings = get_settings()
+    monkeypatch.setattr(settings, "ai_provider", "ollama")
+    monkeypatch.setattr(settings, "extraction_chunk_chars", 200)
+    cache = ExtractionCache(MemoryExtractionCache())
+    monkeypatch.setattr("app.services.ai_extractor.get_extraction_cache", lambda: cache)
+    extractor = AIExtractor()
+    transcript = "\n".join(f"Line {idx:03d} we rekey data by hand." for idx in range(40))
+    first_chunk = split_transcript(transcript, 200, settings.extraction_chunk_overlap_chars)[0]
+
+    async def flaky_ollama(body: dict) -> list[dict]:
+        if body["transcript"] == first_chunk:
+            raise TimeoutError("chunk timed out")
+        return [item("Shared pain", ["Excel"])]
+
+    monkeypatch.setattr(extractor, "_extract_ollama", flaky_ollama)
+    pain_points = asyncio.run(extractor.extract(transcript, "summary"))
+
+    assert [pain_point.title for pain_point in pain_points] == ["Shared pain"]
+    assert cache.backend._entries == {}
@@ -0,0 +1,68 @@
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+
+from app.api.pain_points import delete_pain_point, update_pain_point
+from app.db import Base
+from app.models.dashboard_aggregate import DashboardAggregate
+from app.models.enums import PainCategoryEnum
+from app.models.pain_point import PainPoint
+from app.models.title_mention import TitleMention
+from app.schemas.pain_point import PainPointUpdate
+from app.services.aggregates import rebuild_dashboard_aggregates, rebuild_title_mentions
+from app.services.analytics import dashboard_metrics
+from app.services.seed import seed_demo_data
+
+
+def build_session() -> Session:
+    engine = create_engine("sqlite:///:memory:", future=True)
+    Base.metadata.create_all(bind=engine)
+    return Session(bind=engine)
+
+
+def aggregate_cells(session: Session) -> dict[tuple[str, str], tuple[int, float]]:
+    rows = session.scalars(select(DashboardAggregate).where(DashboardAggregate.pain_point_count > 0)).all()
+    return {(row.team, row.category.value): (row.pain_point_count, round(row.impact_hours_per_week, 2)) for row in rows}
+
+
+def title_counts(session: Session) -> dict[str, int]:
+    rows = session.scalars(select(TitleMention).where(TitleMention.mention_count > 0)).all()
+    return {row.title_key: row.mention_count for row in rows}
+
+
+def assert_matches_rebuild(session: Session) -> None:
+    incremental = aggregate_cells(session)
+    incremental_titles = title_counts(session)
+    rebuild_dashboard_aggregates(session)
+    rebuild_title_mentions(session)
+    assert incremental == aggregate_cells(session)
+    assert incremental_titles == title_counts(session)
+
+
+def test_seeding_maintains_dashboard_aggregates() -> None:
+    session = build_session()
+    seed_demo_data(session, interview_count=20)
+
+    metrics = dashboard_metrics(session)
+    pain_points = session.scalars(select(PainPoint)).all()
+    assert metrics["total_pain_points"] == len(pain_points)
+    assert metrics["total_hours_per_week"] == round(sum(pp.score.impact_hours_per_week for pp in pain_points), 2)
+    assert len(metrics["top_backlog"]) == 10
+    assert_matches_rebuild(session)
+
+
+def test_edits_and_deletes_update_dashboard_aggregates() -> None:
+    session = build_session()
+    seed_demo_data(session, interview_count=20)
+    first, second = session.scalars(select(PainPoint).limit(2)).all()
+
+    update_pain_point(first.id, PainPointUpdate(category=PainCategoryEnum.other, frequency_per_week=40), session)
+    assert_matches_rebuild(session)
+
+    update_pain_point(second.id, PainPointUpdate(title="  Brand NEW   title "), session)
+    assert session.get(PainPoint, second.id).title_key == "brand new title"
+    assert title_counts(session)["brand new title"] == 1
+    assert_matches_rebuild(session)
+
+    delete_pain_point(second.id, session)
+    assert_matches_rebuild(session)
+    assert dashboard_metrics(session)["total_pain_points"] == session.query(PainPoint).count()
@@ -1,5 +1,19 @@
+import random
+import re
+
 from app.models.enums import PainCategoryEnum
-from app.services.extraction import extract_pain_points_deterministic, infer_frequency_per_week, infer_minutes, infer_people_affected
+from app.services.extraction import (
+    CATEGORY_KEYWORDS,
+    FRICTION_HINTS,
+    KEYWORD_MATCHER,
+    SYSTEM_KEYWORDS,
+    extract_pain_points_deterministic,
+    infer_category,
+    infer_frequency_per_week,
+    infer_minutes,
+    infer_people_affected,
+    infer_systems,
+)
 
 
 def test_deterministic_extraction_reads_operational_signals() -> None:
@@ -32,3 +46,28 @@ def test_parsing_handles_ranges_and_total_team_wording() -> None:
     assert infer_frequency_per_week(text) == 1.0
     assert infer_minutes(text) == 420.0
     assert infer_people_affected(text) == 1
+
+
+def test_keyword_matcher_agrees_with_per_keyword_scans() -> None:
+    words = [*FRICTION_HINTS, *(kw for kws in CATEGORY_KEYWORDS.values() for kw in kws)]
+    words += [kw for kws in SYSTEM_KEYWORDS.values() for kw in kws]
+    words += ["project status update", "sapling", "Teamsters", "JIRA-12", "excellent", "the", "and", ",", "."]
+    rng = random.Random(7)
+
+    for _ in range(300):
+        text = rng.choice(["", " "]).join(rng.choice(words) for _ in range(rng.randint(1, 12)))
+        lowered = text.lower()
+        matches = KEYWORD_MATCHER.scan(text)
+
+        assert matches.hints == {hint for hint in FRICTION_HINTS if hint in lowered}
+        expected_category = next(
+            (category for category, keywords in CATEGORY_KEYWORDS.items() if any(kw in lowered for kw in keywords)),
+            PainCategoryEnum.other,
+        )
+        assert infer_category(text) == expected_category
+        expected_systems = [
+            name
+            for name, keywords in SYSTEM_KEYWORDS.items()
+            if any(re.search(rf"\b{re.escape(kw)}\b", text, re.IGNORECASE) for kw in keywords)
+        ]
+        assert infer_systems(text) == expected_systems
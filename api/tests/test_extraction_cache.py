@@ -0,0 +1,78 @@
+import asyncio
+import sqlite3
+
+from app.config import get_settings
+from app.services import extraction_cache
+from app.services.ai_extractor import AIExtractor
+from app.services.extraction_cache import ExtractionCache, MemoryExtractionCache, SQLiteExtractionCache
+
+RAW = [
+    {
+        "title": "Manual invoice chasing",
+        "description": "Finance chases invoice approvals by email",
+        "category": "finance_ops",
+        "frequency_per_week": 3,
+        "minutes_per_occurrence": 30,
+        "people_affected": 2,
+    }
+]
+
+
+def test_memory_cache_evicts_least_recent_and_expires(monkeypatch) -> None:
+    cache = MemoryExtractionCache(max_entries=2, ttl_seconds=60)
+    cache.set("a", RAW)
+    cache.set("b", [])
+    assert cache.get("a") == RAW
+    cache.set("c", [])
+    assert cache.get("b") is None
+    assert cache.get("a") == RAW
+
+    clock = extraction_cache.time.monotonic() + 120
+    monkeypatch.setattr(extraction_cache.time, "monotonic", lambda: clock)
+    assert cache.get("a") is None
+
+
+def test_sqlite_cache_persists_between_instances(tmp_path) -> None:
+    path = tmp_path / "cache.db"
+    SQLiteExtractionCache(str(path)).set("key", RAW)
+    assert SQLiteExtractionCache(str(path)).get("key") == RAW
+    assert SQLiteExtractionCache(str(path), ttl_seconds=-1).get("missing") is None
+
+
+def test_sqlite_cache_sweeps_expired_rows_every_n_writes(tmp_path) -> None:
+    path = tmp_path / "cache.db"
+    cache = SQLiteExtractionCache(str(path), ttl_seconds=-1, sweep_interval_writes=3)
+
+    def stored_rows() -> int:
+        with sqlite3.connect(path) as connection:
+            return connection.execute("SELECT COUNT(*) FROM extraction_cache").fetchone()[0]
+
+    cache.set("a", RAW)
+    cache.set("b", RAW)
+    assert cache.get("a") is None
+    assert stored_rows() == 2
+    cache.set("c", RAW)
+    assert stored_rows() == 0
+
+
+def test_duplicate_transcripts_skip_the_llm_call(monkeypatch) -> None:
+    settings = get_settings()
+    monkeypatch.setattr(settings, "ai_provider", "openai")
+    cache = ExtractionCache(MemoryExtractionCache())
+    monkeypatch.setattr("app.services.ai_extractor.get_extraction_cache", lambda: cache)
+    extractor = AIExtractor()
+    calls: list[dict] = []
+
+    async def fake_openai(body: dict) -> list[dict]:
+        calls.append(body)
+        return RAW
+
+    monkeypatch.setattr(extractor, "_extract_openai", fake_openai)
+
+    first = asyncio.run(extractor.extract("same transcript", "summary"))
+    second = asyncio.run(extractor.extract("same transcript", "summary"))
+    asyncio.run(extractor.extract("other transcript", "summary"))
+
+    assert first == second
+    assert len(calls) == 2
+    assert cache.stats() == {"backend": "MemoryExtractionCache", "hits": 1, "misses": 2, "hit_rate": 0.3333}
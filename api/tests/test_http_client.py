@@ -0,0 +1,15 @@
+import asyncio
+
+from app.services.http_client import HTTPClientPool
+
+
+def test_pool_reuses_one_client_per_origin_until_closed() -> None:
+    pool = HTTPClientPool()
+    openai = pool.client_for("https://api.openai.com/v1/chat/completions")
+
+    assert pool.client_for("https://api.openai.com/v1/models") is openai
+    assert pool.client_for("http://localhost:11434/api/chat") is not openai
+
+    asyncio.run(pool.aclose())
+    assert openai.is_closed
+    assert pool.client_for("https://api.openai.com/v1/chat/completions") is not openai
@@ -0,0 +1,123 @@
+import asyncio
+import json
+
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from app.api.intake import _ingest_records, _parse_batch_body, _stream_progress, _to_canonical
+from app.db import Base
+from app.models.interview import Interview
+from app.models.respondent import Respondent
+from app.models.score import Score
+from app.services.aggregates import rebuild_dashboard_aggregates
+from app.config import get_settings
+from app.services.analytics import dashboard_metrics
+from app.services.ingestion import IntakeIngestionService
+
+
+def build_session() -> Session:
+    # Ingestion runs DB work on the blocking pool, so every thread must see the same in-memory database.
+    engine = create_engine(
+        "sqlite:///:memory:", future=True, connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(bind=engine)
+    return Session(bind=engine)
+
+
+def payload(idx: int, email: str | None = None) -> dict:
+    return {
+        "respondent": {"name": f"Person {idx}", "email": email, "team": "Finance", "role": "Analyst", "consent": True},
+        "transcript": f"We manually chase invoice approvals in Excel {idx + 2} times per week, 30 minutes each.",
+        "call_summary": "Invoice approvals",
+    }
+
+
+def test_batch_intake_ingests_chunks_and_reports_per_item_results() -> None:
+    session = build_session()
+    records = [payload(0, "shared@example.com"), {"respondent": "not an object"}, payload(2, "shared@example.com"), payload(3)]
+
+    results = asyncio.run(_ingest_records(session, enumerate(records), "vapi"))
+
+    assert [result.ok for result in results] == [True, False, True, True]
+    assert results[0].respondent_id == results[2].respondent_id
+    assert all(result.pain_point_ids for result in results if result.ok)
+    assert session.scalar(select(func.count(Interview.id))) == 3
+    assert session.scalar(select(func.count(Respondent.id))) == 2
+
+    pain_point_count = sum(len(result.pain_point_ids) for result in results)
+    assert session.scalar(select(func.count(Score.id))) == pain_point_count
+    metrics = dashboard_metrics(session)
+    rebuild_dashboard_aggregates(session)
+    assert dashboard_metrics(session) == metrics
+
+
+def test_batch_body_accepts_json_array_and_ndjson() -> None:
+    records = [payload(0), payload(1)]
+    assert _parse_batch_body(json.dumps(records).encode(), "application/json") == records
+
+    ndjson = "\n".join(json.dumps(record) for record in records) + "\n{broken\n"
+    parsed = _parse_batch_body(ndjson.encode(), "application/x-ndjson")
+    assert parsed[:2] == records
+    assert isinstance(parsed[2], ValueError)
+
+
+def test_stream_intake_reads_split_lines_and_reports_progress_per_chunk(monkeypatch) -> None:
+    monkeypatch.setattr(get_settings(), "intake_batch_chunk_size", 2)
+    monkeypatch.setattr(get_settings(), "intake_stream_max_line_bytes", 4096)
+    session = build_session()
+    lines = [json.dumps(payload(idx)) for idx in range(3)] + ["{broken", "x" * 10000, json.dumps(payload(5))]
+    body = ("\n".join(lines) + "\n").encode()
+
+    async def chunks():
+        for start in range(0, len(body), 97):
+            yield body[start : start + 97]
+
+    async def collect() -> list[dict]:
+        return [json.loads(line) async for line in _stream_progress(session, chunks(), "vapi")]
+
+    messages = asyncio.run(collect())
+
+    progress, summary = messages[:-1], messages[-1]
+    assert [len(message["results"]) for message in progress] == [2, 2, 2]
+    assert summary == {"type": "summary", "received": 6, "ingested": 4, "failed": 2}
+    results = [result for message in progress for result in message["results"]]
+    assert [result["ok"] for result in results] == [True, True, True, False, False, True]
+    assert session.scalar(select(func.count(Interview.id))) == 4
+
+
+def test_chunk_extracts_before_writing_with_bounded_concurrency_and_once_per_item(monkeypatch) -> None:
+    monkeypatch.setattr(get_settings(), "intake_extraction_max_concurrency", 2)
+    session = build_session()
+    service = IntakeIngestionService()
+    canonicals = [_to_canonical(payload(idx), "vapi") for idx in range(5)]
+    events: list[str] = []
+    in_flight = peak = 0
+    extract = service._extract
+
+    async def tracked_extract(canonical):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        events.append("extract")
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return await extract(canonical)
+
+    write_interviews = service._write_interviews
+
+    def failing_bulk_write(session, canonicals):
+        events.append("write")
+        if len(canonicals) > 1:
+            raise RuntimeError("bulk insert rejected")
+        return write_interviews(session, canonicals)
+
+    monkeypatch.setattr(service, "_extract", tracked_extract)
+    monkeypatch.setattr(service, "_write_interviews", failing_bulk_write)
+
+    results = asyncio.run(service.ingest_chunk(session, canonicals))
+
+    assert all(isinstance(result, tuple) and result[2] for result in results)
+    assert peak == 2
+    assert events == ["extract"] * 5 + ["write"] * 6
+    assert session.scalar(select(func.count(Interview.id))) == 5
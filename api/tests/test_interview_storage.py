@@ -0,0 +1,68 @@
+from sqlalchemy import create_engine, inspect, select, text
+from sqlalchemy.orm import Session, joinedload
+
+from app.api.pain_points import get_pain_point
+from app.db import Base
+from app.models.enums import ChannelEnum
+from app.models.interview import Interview
+from app.models.pain_point import PainPoint
+from app.models.respondent import Respondent
+
+
+def build_session() -> Session:
+    engine = create_engine("sqlite:///:memory:", future=True)
+    Base.metadata.create_all(bind=engine)
+    return Session(bind=engine)
+
+
+def test_transcripts_are_compressed_and_loaded_only_on_access() -> None:
+    session = build_session()
+    transcript = "We rebuild the weekly invoice report by hand in Excel. " * 200
+    respondent = Respondent(team="Finance", role="Analyst", consent=True)
+    session.add(respondent)
+    session.flush()
+    interview = Interview(
+        respondent_id=respondent.id,
+        channel=ChannelEnum.internal,
+        transcript_raw=transcript,
+        transcript_redacted=transcript,
+        summary_text="summary",
+        metadata_json={},
+    )
+    session.add(interview)
+    session.flush()
+    session.add(PainPoint(interview_id=interview.id, title="Manual invoice report", description="Excel"))
+    session.commit()
+    session.expunge_all()
+
+    stored = session.execute(text("SELECT transcript_redacted FROM interviews")).scalar_one()
+    assert isinstance(stored, bytes)
+    assert len(stored) < len(transcript) // 10
+
+    pain_point = session.scalar(select(PainPoint).options(joinedload(PainPoint.interview)))
+    loaded = pain_point.interview
+    assert {"transcript_raw", "transcript_redacted"} & set(inspect(loaded).dict) == set()
+    assert loaded.transcript_redacted == transcript
+    assert "transcript_raw" not in inspect(loaded).dict
+    session.expunge_all()
+
+    detail = get_pain_point(pain_point.id, session)
+    assert detail.transcript_redacted == transcript
+    assert "transcript_raw" not in inspect(session.get(Interview, loaded.id)).dict
+
+
+def test_uncompressed_legacy_rows_still_read() -> None:
+    session = build_session()
+    respondent = Respondent(team="Finance", role="Analyst", consent=True)
+    session.add(respondent)
+    session.flush()
+    session.execute(
+        text(
+            "INSERT INTO interviews "
+            "(respondent_id, channel, transcript_redacted, quote_rank, summary_text, metadata_json, created_at, updated_at) "
+            "VALUES (:respondent_id, 'internal', 'plain text transcript', 0, 'summary', '{}', CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)"
+        ),
+        {"respondent_id": respondent.id},
+    )
+
+    assert session.scalar(select(Interview.transcript_redacted)) == "plain text transcript"
@@ -0,0 +1,125 @@
+import sqlite3
+import threading
+from pathlib import Path
+
+from sqlalchemy import create_engine, inspect, select, text
+from sqlalchemy.orm import Session
+
+from app import models  # noqa: F401
+from app.db import Base
+from app.migrations import load_migrations, run_migrations
+from app.models.interview import Interview
+from app.models.pain_point import PainPoint
+from app.models.report_run import ReportRun
+
+# The schema as created by create_all before migrations existed.
+BASELINE_SCHEMA = [
+    """CREATE TABLE respondents (
+        id INTEGER NOT NULL PRIMARY KEY, name VARCHAR(255), email VARCHAR(255), team VARCHAR(120) NOT NULL,
+        role VARCHAR(120) NOT NULL, location VARCHAR(120), consent BOOLEAN NOT NULL, created_at DATETIME NOT NULL
+    )""",
+    """CREATE TABLE report_runs (
+        id INTEGER NOT NULL PRIMARY KEY, created_at DATETIME NOT NULL, source VARCHAR(50) NOT NULL, interview_id INTEGER,
+        session_id VARCHAR(255), pdf_path_or_url VARCHAR(500), summary TEXT, recommendations_json TEXT
+    )""",
+    """CREATE TABLE interviews (
+        id INTEGER NOT NULL PRIMARY KEY, respondent_id INTEGER NOT NULL REFERENCES respondents (id) ON DELETE CASCADE,
+        channel VARCHAR(8) NOT NULL, started_at DATETIME, ended_at DATETIME, transcript_raw TEXT, transcript_redacted TEXT,
+        summary_text TEXT NOT NULL, metadata_json JSON NOT NULL, created_at DATETIME NOT NULL
+    )""",
+    """CREATE TABLE pain_points (
+        id INTEGER NOT NULL PRIMARY KEY, interview_id INTEGER NOT NULL REFERENCES interviews (id) ON DELETE CASCADE,
+        title TEXT NOT NULL, description TEXT NOT NULL, category VARCHAR(11) NOT NULL, frequency_per_week FLOAT NOT NULL,
+        minutes_per_occurrence FLOAT NOT NULL, people_affected INTEGER NOT NULL, systems_involved JSON NOT NULL,
+        current_workaround TEXT, failure_modes TEXT, success_definition TEXT, sensitive_flag BOOLEAN NOT NULL,
+        redaction_notes TEXT, created_at DATETIME NOT NULL
+    )""",
+    """CREATE TABLE scores (
+        id INTEGER NOT NULL PRIMARY KEY, pain_point_id INTEGER NOT NULL UNIQUE REFERENCES pain_points (id) ON DELETE CASCADE,
+        impact_hours_per_week FLOAT NOT NULL, effort_score INTEGER NOT NULL, confidence_score FLOAT NOT NULL,
+        priority_score FLOAT NOT NULL, rationale TEXT NOT NULL, automation_type VARCHAR(15) NOT NULL,
+        suggested_solution TEXT NOT NULL, dependencies TEXT, owner_suggestion TEXT, quick_win BOOLEAN NOT NULL,
+        updated_at DATETIME NOT NULL
+    )""",
+]
+
+HOT_INDEXES = {
+    "pain_points": {"ix_pain_points_created_at", "ix_pain_points_category_created_at", "ix_pain_points_title_key"},
+    "scores": {"ix_scores_priority_score_quick_win"},
+    "respondents": {"ix_respondents_id_team"},
+    "report_runs": {"ix_report_runs_session_id_created_at"},
+}
+
+
+def assert_hot_indexes(engine) -> None:
+    inspector = inspect(engine)
+    for table, names in HOT_INDEXES.items():
+        assert names <= {index["name"] for index in inspector.get_indexes(table)}
+
+
+def test_fresh_database_is_migrated_once(tmp_path: Path) -> None:
+    engine = create_engine(f"sqlite:///{tmp_path / 'fresh.db'}", future=True)
+
+    assert run_migrations(engine) == [migration.version for migration in load_migrations()]
+    assert run_migrations(engine) == []
+    assert_hot_indexes(engine)
+    assert {"dashboard_aggregates", "title_mentions", "n8n_outbox"} <= set(inspect(engine).get_table_names())
+
+
+def test_migrated_schema_matches_models(tmp_path: Path) -> None:
+    engine = create_engine(f"sqlite:///{tmp_path / 'fresh.db'}", future=True)
+    run_migrations(engine)
+
+    inspector = inspect(engine)
+    for table in Base.metadata.sorted_tables:
+        assert {column["name"] for column in inspector.get_columns(table.name)} == set(table.columns.keys()), table.name
+        assert {index["name"] for index in inspector.get_indexes(table.name)} == {index.name for index in table.indexes}, table.name
+
+
+def test_sqlite_migrator_waits_for_the_write_lock(tmp_path: Path) -> None:
+    path = tmp_path / "locked.db"
+    engine = create_engine(f"sqlite:///{path}", future=True, connect_args={"timeout": 0.05})
+    holder = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+    holder.execute("BEGIN IMMEDIATE")
+    # Released well after the driver's own busy timeout has expired.
+    release = threading.Timer(0.5, holder.execute, args=("ROLLBACK",))
+    release.start()
+    try:
+        assert run_migrations(engine) == [migration.version for migration in load_migrations()]
+    finally:
+        release.join()
+        holder.close()
+
+
+def test_baseline_database_is_upgraded_and_backfilled(tmp_path: Path) -> None:
+    engine = create_engine(f"sqlite:///{tmp_path / 'baseline.db'}", future=True)
+    transcript = "My name is [REDACTED_NAME]. We chase invoice approvals manually in Excel every week."
+    with engine.begin() as connection:
+        for ddl in BASELINE_SCHEMA:
+            connection.execute(text(ddl))
+        connection.execute(text("INSERT INTO respondents VALUES (1, 'Jane', NULL, 'Finance', 'Analyst', NULL, 1, CURRENT_TIMESTAMP)"))
+        connection.execute(
+            text("INSERT INTO interviews VALUES (1, 1, 'internal', NULL, NULL, :t, :t, 'summary', '{}', CURRENT_TIMESTAMP)"),
+            {"t": transcript},
+        )
+        connection.execute(
+            text(
+                "INSERT INTO pain_points VALUES (1, 1, '  Manual   Invoice Chasing ', 'd', 'finance_ops', 1, 30, 1, '[]', "
+                "NULL, NULL, NULL, 0, NULL, CURRENT_TIMESTAMP)"
+            )
+        )
+        connection.execute(text("INSERT INTO report_runs (id, created_at, source) VALUES (1, CURRENT_TIMESTAMP, 'manual')"))
+
+    run_migrations(engine)
+
+    assert_hot_indexes(engine)
+    with engine.connect() as connection:
+        stored = connection.scalar(text("SELECT transcript_redacted FROM interviews"))
+    assert isinstance(stored, bytes)
+    with Session(engine) as session:
+        interview = session.get(Interview, 1)
+        assert interview.transcript_redacted == transcript
+        assert interview.quote_snippet.startswith("We chase invoice approvals")
+        assert interview.quote_rank > 0
+        assert session.scalar(select(PainPoint.title_key)) == "manual invoice chasing"
+        assert session.scalar(select(ReportRun.status)) == "completed"
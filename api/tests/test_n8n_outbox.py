@@ -0,0 +1,100 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import create_engine, select, update
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from app.api.intake import _ingest_records
+from app.config import get_settings
+from app.db import Base
+from app.models.n8n_outbox import N8nOutboxMessage
+from app.services.n8n_outbox import OUTBOX_DEAD, OUTBOX_DELIVERED, OUTBOX_PENDING, OUTBOX_SENDING, N8nOutboxDispatcher
+
+
+def build_session() -> Session:
+    # Ingestion runs DB work on the blocking pool, so every thread must see the same in-memory database.
+    engine = create_engine(
+        "sqlite:///:memory:", future=True, connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(bind=engine)
+    return Session(bind=engine)
+
+
+def payload(idx: int) -> dict:
+    return {
+        "respondent": {"name": f"Person {idx}", "team": "Finance", "role": "Analyst", "consent": True},
+        "transcript": "We manually chase invoice approvals in Excel 3 times per week, 30 minutes each.",
+        "metadata": {"session_id": f"session-{idx}"},
+    }
+
+
+def make_due(session: Session) -> None:
+    past = datetime.now(timezone.utc) - timedelta(seconds=1)
+    session.execute(update(N8nOutboxMessage).values(next_attempt_at=past))
+    session.commit()
+
+
+def test_intake_queues_notifications_and_dispatcher_retries_then_dead_letters(monkeypatch) -> None:
+    settings = get_settings()
+    monkeypatch.setattr(settings, "n8n_webhook_url", "http://n8n.local/webhook/intake")
+    monkeypatch.setattr(settings, "n8n_outbox_max_attempts", 2)
+    session = build_session()
+
+    asyncio.run(_ingest_records(session, enumerate([payload(0), payload(1)]), "vapi"))
+    messages = session.scalars(select(N8nOutboxMessage).order_by(N8nOutboxMessage.id)).all()
+    assert [message.status for message in messages] == [OUTBOX_PENDING, OUTBOX_PENDING]
+
+    dispatcher = N8nOutboxDispatcher()
+    delivered: list[int] = []
+
+    async def deliver(message: N8nOutboxMessage) -> None:
+        if message.id == messages[1].id:
+            raise RuntimeError("n8n unavailable")
+        delivered.append(message.interview_id)
+
+    monkeypatch.setattr(dispatcher, "_deliver", deliver)
+
+    assert asyncio.run(dispatcher.dispatch_pending(session)) == 2
+    assert delivered == [messages[0].interview_id]
+    assert messages[0].status == OUTBOX_DELIVERED
+    assert messages[1].status == OUTBOX_PENDING
+    assert messages[1].next_attempt_at.replace(tzinfo=timezone.utc) > datetime.now(timezone.utc)
+    assert asyncio.run(dispatcher.dispatch_pending(session)) == 0
+
+    make_due(session)
+    assert asyncio.run(dispatcher.dispatch_pending(session)) == 1
+    assert messages[1].status == OUTBOX_DEAD
+    assert messages[1].last_error == "n8n unavailable"
+
+
+def test_claimed_messages_are_skipped_by_other_dispatchers_until_the_lease_expires(monkeypatch, tmp_path) -> None:
+    settings = get_settings()
+    monkeypatch.setattr(settings, "n8n_webhook_url", "http://n8n.local/webhook/intake")
+    engine = create_engine(f"sqlite:///{tmp_path / 'outbox.db'}", future=True)
+    Base.metadata.create_all(bind=engine)
+    with Session(engine) as session:
+        session.add_all(N8nOutboxMessage(interview_id=idx, respondent_id=1) for idx in range(3))
+        session.commit()
+
+    crashed, other = N8nOutboxDispatcher(), N8nOutboxDispatcher()
+    delivered: list[int] = []
+
+    async def deliver(message: N8nOutboxMessage) -> None:
+        delivered.append(message.interview_id)
+
+    monkeypatch.setattr(other, "_deliver", deliver)
+
+    with Session(engine) as first, Session(engine) as second:
+        claimed = crashed._claim(first)
+        assert [message.status for message in claimed] == [OUTBOX_SENDING] * 3
+        assert asyncio.run(other.dispatch_pending(second)) == 0
+
+        second.execute(update(N8nOutboxMessage).values(leased_until=datetime.now(timezone.utc) - timedelta(seconds=1)))
+        second.commit()
+        assert asyncio.run(other.dispatch_pending(second)) == 3
+
+    assert delivered == [0, 1, 2]
+    with Session(engine) as session:
+        assert set(session.scalars(select(N8nOutboxMessage.status))) == {OUTBOX_DELIVERED}
+        assert session.scalar(select(N8nOutboxMessage.leased_until)) is None
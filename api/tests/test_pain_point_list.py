@@ -0,0 +1,114 @@
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from app.api.pain_points import list_pain_points
+from app.db import Base
+from app.models.enums import ChannelEnum, PainCategoryEnum
+from app.models.interview import Interview
+from app.models.pain_point import PainPoint
+from app.models.respondent import Respondent
+from app.services.scoring import upsert_score
+
+
+def build_session() -> Session:
+    engine = create_engine("sqlite:///:memory:", future=True)
+    Base.metadata.create_all(bind=engine)
+    return Session(bind=engine)
+
+
+def seed(session: Session) -> None:
+    for idx, team in enumerate(["Finance", "Engineering", "Finance", "People", "Finance"]):
+        respondent = Respondent(team=team, role="Analyst", consent=True)
+        session.add(respondent)
+        session.flush()
+
+        interview = Interview(respondent_id=respondent.id, channel=ChannelEnum.internal, summary_text="summary", metadata_json={})
+        session.add(interview)
+        session.flush()
+
+        pain_point = PainPoint(
+            interview_id=interview.id,
+            title=f"Manual reconciliation {idx}",
+            description="Manual reconciliation of invoices in Excel",
+            category=PainCategoryEnum.finance_ops if team == "Finance" else PainCategoryEnum.other,
+            frequency_per_week=float(idx + 1),
+            minutes_per_occurrence=30,
+            people_affected=2,
+            systems_involved=["Excel"],
+        )
+        session.add(pain_point)
+        session.flush()
+        upsert_score(session, pain_point)
+    session.commit()
+
+
+def list_page(session: Session, **kwargs):
+    params = {"team": None, "category": None, "priority_min": None, "cursor": None, "limit": 50, **kwargs}
+    return list_pain_points(session=session, **params)
+
+
+def test_list_orders_by_priority_and_paginates_with_cursor() -> None:
+    session = build_session()
+    seed(session)
+
+    first = list_page(session, limit=2)
+    assert len(first.items) == 2
+    assert first.next_cursor is not None
+
+    second = list_page(session, limit=2, cursor=first.next_cursor)
+    third = list_page(session, limit=2, cursor=second.next_cursor)
+    assert third.next_cursor is None
+
+    items = first.items + second.items + third.items
+    assert len({item.id for item in items}) == 5
+    priorities = [item.priority_score for item in items]
+    assert priorities == sorted(priorities, reverse=True)
+
+
+def test_list_filters_in_query() -> None:
+    session = build_session()
+    seed(session)
+
+    page = list_page(session, team="Finance", category=PainCategoryEnum.finance_ops)
+    assert len(page.items) == 3
+    assert all(item.team == "Finance" for item in page.items)
+
+    threshold = page.items[1].priority_score
+    page = list_page(session, priority_min=threshold)
+    assert all(item.priority_score >= threshold for item in page.items)
+
+
+def test_cursor_pages_through_priority_ties_without_gaps_or_repeats() -> None:
+    session = build_session()
+    respondent = Respondent(team="Finance", role="Analyst", consent=True)
+    session.add(respondent)
+    session.flush()
+    interview = Interview(respondent_id=respondent.id, channel=ChannelEnum.internal, summary_text="summary", metadata_json={})
+    session.add(interview)
+    session.flush()
+    # Identical inputs score identically, so all five share one (non-round) priority.
+    for idx in range(5):
+        pain_point = PainPoint(
+            interview_id=interview.id,
+            title=f"Duplicate approval chase {idx}",
+            description="Approvals chased by email",
+            category=PainCategoryEnum.approvals,
+            frequency_per_week=3.3,
+            minutes_per_occurrence=17,
+            people_affected=3,
+            systems_involved=["Email"],
+        )
+        session.add(pain_point)
+        session.flush()
+        upsert_score(session, pain_point)
+    session.commit()
+
+    pages = [list_page(session, limit=2)]
+    while pages[-1].next_cursor:
+        pages.append(list_page(session, limit=2, cursor=pages[-1].next_cursor))
+
+    items = [item for page in pages for item in page.items]
+    assert len({item.priority_score for item in items}) == 1
+    assert [item.id for item in items] == sorted((item.id for item in items), reverse=True)
+    assert len(items) == len({item.id for item in items}) == 5
+    assert len(pages) == 3
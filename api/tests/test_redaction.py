@@ -0,0 +1,29 @@
+from app.services.redaction import redact_stream, redact_text, redact_texts
+
+
+def test_redaction_covers_all_detectors_in_one_pass() -> None:
+    text = "Hi, my name is Ted Jones. Mail ted@example.com or call 555-123-4567; Ted owns it."
+
+    assert redact_text(text, "Ted") == (
+        "Hi, my name is [REDACTED_NAME]. Mail [REDACTED_EMAIL] or call [REDACTED_PHONE]; [REDACTED_NAME] owns it."
+    )
+    assert redact_text("My name is Respondent 3.", "Respondent 3") == "My name is [REDACTED_NAME]."
+    assert redact_text(None, "Ted") is None
+
+
+def test_batch_redaction_matches_single_calls() -> None:
+    items = [("Call 555-123-4567", "Ana"), ("Ana said hi", "Ana"), (None, "Ana"), ("Ana said hi", "Ana")]
+    assert redact_texts(items) == [redact_text(text, name) for text, name in items]
+
+
+def test_chunked_redaction_matches_whole_text_across_chunk_boundaries() -> None:
+    text = " ".join(
+        ["My name is Ana Lopez, call 555-123-4567 or mail ana.lopez@example.com.", "Ana said the foo555-123-4567 id is fine."] * 40
+    )
+    chunks = [text[start : start + 7] for start in range(0, len(text), 7)]
+    written: list[str] = []
+
+    redact_stream(chunks, written.append, "Ana", window_chars=50, overlap_chars=64)
+
+    assert len(written) > 1
+    assert "".join(written) == redact_text(text, "Ana")
@@ -0,0 +1,164 @@
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import Session
+
+from app.db import Base
+from app.models.enums import ChannelEnum, PainCategoryEnum
+from app.models.interview import Interview
+from app.models.pain_point import SOURCE_AI, SOURCE_DETERMINISTIC, PainPoint
+from app.models.respondent import Respondent
+from app.models.score import Score
+from app.services.analytics import dashboard_metrics
+from app.services.extraction import extract_pain_points_deterministic
+from app.services.ingestion import build_pain_point
+from app.services.reextraction import reextract_pain_points
+from app.services.redaction import redact_text
+from app.services.scoring import upsert_score
+from app.services.seed import seed_demo_data
+
+TRANSCRIPTS = [
+    "We manually reconcile invoices in Excel 3 times per week, 40 minutes each. Approvals wait on email daily.",
+    "Access requests in Okta need manual approval twice a week for 4 people.",
+    "Weekly status reports are copied into Jira by hand, 2 hours each time.",
+]
+
+
+def build_session() -> Session:
+    engine = create_engine("sqlite:///:memory:", future=True)
+    Base.metadata.create_all(bind=engine)
+    return Session(bind=engine)
+
+
+def seed(session: Session) -> None:
+    respondent = Respondent(team="Finance", role="Analyst", consent=True)
+    session.add(respondent)
+    session.flush()
+    for transcript in TRANSCRIPTS:
+        interview = Interview(
+            respondent_id=respondent.id,
+            channel=ChannelEnum.internal,
+            transcript_redacted=transcript,
+            summary_text="summary",
+            metadata_json={},
+        )
+        session.add(interview)
+        session.flush()
+        for item in extract_pain_points_deterministic(transcript, "summary"):
+            pain_point = build_pain_point(interview.id, item, SOURCE_DETERMINISTIC)
+            session.add(pain_point)
+            session.flush()
+            upsert_score(session, pain_point)
+    session.commit()
+
+
+def snapshot(session: Session) -> list[tuple]:
+    rows = session.execute(
+        select(PainPoint.interview_id, PainPoint.title_key, PainPoint.category, PainPoint.frequency_per_week)
+        .order_by(PainPoint.interview_id, PainPoint.title_key)
+    ).all()
+    return [tuple(row) for row in rows]
+
+
+def test_reextraction_dry_run_reports_and_apply_restores_extracted_fields() -> None:
+    session = build_session()
+    seed(session)
+    expected = snapshot(session)
+    expected_metrics = dashboard_metrics(session)
+
+    first, second = session.scalars(select(PainPoint).order_by(PainPoint.id).limit(2)).all()
+    first.category = PainCategoryEnum.other
+    first.frequency_per_week = 99
+    session.delete(second.score)
+    session.delete(second)
+    session.add(
+        PainPoint(
+            interview_id=first.interview_id,
+            title="Stale item",
+            description="old",
+            systems_involved=[],
+            extraction_source=SOURCE_DETERMINISTIC,
+        )
+    )
+    session.commit()
+    tampered = snapshot(session)
+
+    dry_run = reextract_pain_points(session, dry_run=True, workers=1, batch_size=2)
+    assert dry_run == {"interviews": 3, "skipped": 0, "added": 1, "updated": 1, "removed": 0, "unchanged": len(expected) - 2}
+    assert snapshot(session) == tampered
+
+    pooled = reextract_pain_points(session, dry_run=True, prune=True, workers=2, batch_size=2)
+    assert pooled == {**dry_run, "removed": 1}
+
+    applied = reextract_pain_points(session, dry_run=False, prune=True, workers=1, batch_size=2)
+    assert applied == pooled
+    assert snapshot(session) == expected
+    assert session.scalar(select(func.count(Score.id))) == len(expected)
+    assert dashboard_metrics(session)["total_pain_points"] == expected_metrics["total_pain_points"]
+
+
+def test_reextraction_leaves_curated_pain_points_and_untranscribed_interviews_alone() -> None:
+    session = build_session()
+    seed(session)
+    respondent_id = session.scalar(select(Respondent.id))
+    first_interview_id, *untouched_ids = session.scalars(select(Interview.id).order_by(Interview.id)).all()
+    ai_interview = Interview(
+        respondent_id=respondent_id, channel=ChannelEnum.internal, transcript_redacted=TRANSCRIPTS[0], summary_text="s", metadata_json={}
+    )
+    # No consent: nothing stored to re-extract from, only the summary.
+    silent_interview = Interview(
+        respondent_id=respondent_id, channel=ChannelEnum.internal, transcript_redacted=None, summary_text=TRANSCRIPTS[2], metadata_json={}
+    )
+    session.add_all([ai_interview, silent_interview])
+    session.flush()
+    session.add_all(
+        [
+            PainPoint(interview_id=ai_interview.id, title="Approvals stall", description="ai", extraction_source=SOURCE_AI),
+            PainPoint(interview_id=silent_interview.id, title="Status", description="x", extraction_source=SOURCE_DETERMINISTIC),
+            PainPoint(interview_id=first_interview_id, title="Added by hand", description="curated"),
+        ]
+    )
+    session.commit()
+    before = snapshot(session)
+
+    applied = reextract_pain_points(session, dry_run=False, prune=True, workers=1)
+
+    # The first interview now holds a hand-added row, so only the other two seeded ones are reconciled.
+    reconciled = [row for row in before if row[0] in untouched_ids]
+    assert applied == {"interviews": 2, "skipped": 3, "added": 0, "updated": 0, "removed": 0, "unchanged": len(reconciled)}
+    assert snapshot(session) == before
+
+
+def test_reextraction_skips_interviews_with_pii_in_stored_titles() -> None:
+    session = build_session()
+    respondent = Respondent(name="Dana Smith", team="Finance", role="Analyst", consent=True)
+    session.add(respondent)
+    session.flush()
+    raw = "Dana Smith manually reconciles invoices in Excel 3 times per week, 40 minutes each."
+    interview = Interview(
+        respondent_id=respondent.id,
+        channel=ChannelEnum.internal,
+        transcript_redacted=redact_text(raw, respondent.name),
+        summary_text="summary",
+        metadata_json={},
+    )
+    session.add(interview)
+    session.flush()
+    session.add_all(build_pain_point(interview.id, item, SOURCE_DETERMINISTIC) for item in extract_pain_points_deterministic(raw, "summary"))
+    session.commit()
+    before = snapshot(session)
+
+    applied = reextract_pain_points(session, dry_run=False, prune=True, workers=1)
+
+    assert applied == {"interviews": 0, "skipped": 1, "added": 0, "updated": 0, "removed": 0, "unchanged": 0}
+    assert snapshot(session) == before
+
+
+def test_reextraction_leaves_seeded_demo_data_unchanged() -> None:
+    session = build_session()
+    seed_demo_data(session, interview_count=24)
+    before = snapshot(session)
+
+    dry_run = reextract_pain_points(session, dry_run=True, prune=True, workers=1)
+    applied = reextract_pain_points(session, dry_run=False, prune=True, workers=1)
+
+    assert dry_run == applied == {"interviews": 0, "skipped": 24, "added": 0, "updated": 0, "removed": 0, "unchanged": 0}
+    assert snapshot(session) == before
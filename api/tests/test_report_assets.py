@@ -0,0 +1,48 @@
+import os
+from pathlib import Path
+
+from app.services.report_assets import ReportAssets
+
+
+class FakeCSS:
+    parsed = 0
+
+    def __init__(self, string: str, base_url: str) -> None:
+        FakeCSS.parsed += 1
+        self.string = string
+
+
+def write_assets(tmp_path: Path) -> Path:
+    (tmp_path / "report.html").write_text("<style>{{ report_css | safe }}</style>{{ title }}", encoding="utf-8")
+    css_path = tmp_path / "report.css"
+    css_path.write_text("body { color: black; }", encoding="utf-8")
+    return css_path
+
+
+def test_assets_are_loaded_once_without_auto_reload(tmp_path: Path) -> None:
+    css_path = write_assets(tmp_path)
+    assets = ReportAssets(tmp_path, css_path)
+    FakeCSS.parsed = 0
+
+    assert assets.template("report.html") is assets.template("report.html")
+    assert assets.template("report.html").render(report_css="", title="<b>") == "<style></style>&lt;b&gt;"
+    assert assets.weasyprint_css(FakeCSS) is assets.weasyprint_css(FakeCSS)
+
+    css_path.write_text("body { color: red; }", encoding="utf-8")
+    os.utime(css_path, (1, 1))
+    assert assets.css_text() == "body { color: black; }"
+    assert FakeCSS.parsed == 1
+
+
+def test_auto_reload_picks_up_stylesheet_changes(tmp_path: Path) -> None:
+    css_path = write_assets(tmp_path)
+    assets = ReportAssets(tmp_path, css_path, auto_reload=True)
+    FakeCSS.parsed = 0
+    assets.weasyprint_css(FakeCSS)
+
+    css_path.write_text("body { color: red; }", encoding="utf-8")
+    os.utime(css_path, (1, 1))
+
+    assert assets.css_text() == "body { color: red; }"
+    assert assets.weasyprint_css(FakeCSS).string == "body { color: red; }"
+    assert FakeCSS.parsed == 2
@@ -0,0 +1,65 @@
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+
+from app.api.interviews import update_interview
+from app.api.pain_points import update_pain_point
+from app.db import Base
+from app.models.interview import Interview
+from app.models.pain_point import PainPoint
+from app.schemas.interview import InterviewUpdate
+from app.schemas.pain_point import PainPointUpdate
+from app.services.analytics import report_data_version
+from app.services.report_cache import ReportRenderCache, build_report_etag, etag_matches
+from app.services.seed import seed_demo_data
+
+
+def build_session() -> Session:
+    engine = create_engine("sqlite:///:memory:", future=True)
+    Base.metadata.create_all(bind=engine)
+    return Session(bind=engine)
+
+
+def test_etag_depends_on_render_parameters() -> None:
+    base = build_report_etag("pdf", "v1", 30.0, "GBP")
+    assert base == build_report_etag("pdf", "v1", 30.0, "GBP")
+    assert base != build_report_etag("pdf", "v1", 40.0, "GBP")
+    assert base != build_report_etag("pdf", "v1", 30.0, "USD")
+    assert base != build_report_etag("html", "v1", 30.0, "GBP")
+
+    assert etag_matches(base, base)
+    assert etag_matches(f'"other", W/{base}', base)
+    assert etag_matches("*", base)
+    assert not etag_matches('"other"', base)
+    assert not etag_matches(None, base)
+
+
+def test_render_cache_evicts_least_recently_used() -> None:
+    cache = ReportRenderCache(max_entries=2)
+    cache.put("a", b"1")
+    cache.put("b", b"2")
+    assert cache.get("a") == b"1"
+    cache.put("c", b"3")
+    assert cache.get("b") is None
+    assert cache.get("a") == b"1"
+
+
+def test_data_version_changes_when_report_inputs_change() -> None:
+    session = build_session()
+    seed_demo_data(session, interview_count=20)
+    before = report_data_version(session)
+    assert before == report_data_version(session)
+
+    pain_point = session.scalars(select(PainPoint).limit(1)).one()
+    update_pain_point(pain_point.id, PainPointUpdate(frequency_per_week=pain_point.frequency_per_week + 5), session)
+    assert report_data_version(session) != before
+
+
+def test_data_version_changes_when_an_interview_quote_is_edited() -> None:
+    session = build_session()
+    seed_demo_data(session, interview_count=5)
+    before = report_data_version(session)
+
+    interview = session.scalars(select(Interview).order_by(Interview.id).limit(1)).one()
+    update_interview(interview.id, InterviewUpdate(transcript_redacted="Approvals now stall in email for a week."), session)
+    assert interview.quote_snippet == "Approvals now stall in email for a week."
+    assert report_data_version(session) != before
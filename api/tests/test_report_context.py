@@ -0,0 +1,56 @@
+from collections import Counter
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+
+from app.db import Base
+from app.models.interview import Interview
+from app.models.pain_point import PainPoint
+from app.services.analytics import MAX_QUOTES, report_context
+from app.services.quotes import QUOTE_LENGTH, quote_snippet
+from app.services.seed import seed_demo_data
+
+
+def build_session() -> Session:
+    engine = create_engine("sqlite:///:memory:", future=True)
+    Base.metadata.create_all(bind=engine)
+    return Session(bind=engine)
+
+
+def test_report_context_counts_systems_and_caps_quotes_in_one_scan() -> None:
+    session = build_session()
+    seed_demo_data(session, interview_count=40)
+
+    context = report_context(session)
+    pain_points = session.scalars(select(PainPoint)).all()
+    expected = Counter(system for pp in pain_points for system in pp.systems_involved)
+
+    assert {row["system"]: row["mentions"] for row in context["systems_map"]} == dict(expected.most_common(12))
+    assert 0 < len(context["quotes"]) <= MAX_QUOTES
+    sensitive_ids = {pp.id for pp in pain_points if pp.sensitive_flag}
+    for quote in context["quotes"]:
+        assert quote["pain_point_id"] not in sensitive_ids
+        assert len(quote["quote"]) <= QUOTE_LENGTH
+
+
+def test_quote_snippet_skips_intro_and_ranks_friction() -> None:
+    snippet, rank = quote_snippet(
+        "My name is [REDACTED_NAME]. Thanks for having me. "
+        "Every invoice is reconciled manually in Excel before approval."
+    )
+
+    assert snippet == "Every invoice is reconciled manually in Excel before approval."
+    assert rank > 0
+    assert quote_snippet("Nothing much else to add today.")[1] == 0
+    assert quote_snippet(None) == (None, 0.0)
+
+
+def test_report_quotes_are_ordered_by_rank() -> None:
+    session = build_session()
+    seed_demo_data(session, interview_count=40)
+
+    context = report_context(session)
+    ranks = dict(session.execute(select(PainPoint.id, Interview.quote_rank).join(Interview)).all())
+
+    quoted = [ranks[quote["pain_point_id"]] for quote in context["quotes"]]
+    assert quoted == sorted(quoted, reverse=True)
@@ -0,0 +1,137 @@
+import os
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.db import Base
+from app.models.report_run import ReportRun
+from app.api import report
+from app.config import get_settings
+from app.services.report_jobs import JOB_COMPLETED, JOB_FAILED, JOB_PENDING, JOB_RUNNING, JOB_SOURCE, ReportJobService
+
+
+def build_session_factory(tmp_path: Path) -> sessionmaker[Session]:
+    engine = create_engine(f"sqlite:///{tmp_path / 'jobs.db'}", future=True, connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(bind=engine, autoflush=False)
+
+
+def test_report_job_renders_pdf_in_background(tmp_path: Path) -> None:
+    session_factory = build_session_factory(tmp_path)
+    service = ReportJobService(max_workers=1, output_dir=str(tmp_path / "reports"), session_factory=session_factory)
+
+    with session_factory() as session:
+        job = service.submit(session, lambda _: b"%PDF-1.4 test", session_id="abc")
+    service.executor.shutdown(wait=True)
+
+    with session_factory() as session:
+        report_run = session.get(ReportRun, job.id)
+        assert report_run.status == JOB_COMPLETED
+        assert Path(report_run.pdf_path_or_url).read_bytes() == b"%PDF-1.4 test"
+
+
+def test_report_job_records_render_failures(tmp_path: Path) -> None:
+    session_factory = build_session_factory(tmp_path)
+    service = ReportJobService(max_workers=1, output_dir=str(tmp_path / "reports"), session_factory=session_factory)
+
+    def broken_render(_: Session) -> bytes:
+        raise RuntimeError("renderer unavailable")
+
+    with session_factory() as session:
+        job = service.submit(session, broken_render)
+    service.executor.shutdown(wait=True)
+
+    with session_factory() as session:
+        report_run = session.get(ReportRun, job.id)
+        assert report_run.status == JOB_FAILED
+        assert report_run.error == "renderer unavailable"
+
+
+def test_running_jobs_heartbeat_and_only_stale_jobs_are_failed_on_startup(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(get_settings(), "report_job_heartbeat_seconds", 0.05)
+    session_factory = build_session_factory(tmp_path)
+    live = ReportJobService(max_workers=1, output_dir=str(tmp_path / "reports"), session_factory=session_factory)
+    release = threading.Event()
+
+    def slow_render(_: Session) -> bytes:
+        release.wait(5)
+        return b"%PDF-1.4 test"
+
+    with session_factory() as session:
+        job = live.submit(session, slow_render)
+        job_id, started_heartbeat = job.id, job.heartbeat_at
+        session.add_all(
+            [
+                ReportRun(source="job", status=JOB_RUNNING, owner="dead", heartbeat_at=datetime.now(timezone.utc) - timedelta(hours=1)),
+                ReportRun(source="job", status=JOB_PENDING),
+            ]
+        )
+        session.commit()
+    time.sleep(0.3)
+
+    restarted = ReportJobService(max_workers=1, output_dir=str(tmp_path / "reports"), session_factory=session_factory)
+    with session_factory() as session:
+        restarted.fail_interrupted(session)
+        runs = session.scalars(select(ReportRun).order_by(ReportRun.id)).all()
+        assert [run.status for run in runs] == [JOB_RUNNING, JOB_FAILED, JOB_FAILED]
+        assert runs[0].heartbeat_at > started_heartbeat
+
+    release.set()
+    live.executor.shutdown(wait=True)
+    live.shutdown()
+    with session_factory() as session:
+        assert session.get(ReportRun, job_id).status == JOB_COMPLETED
+
+
+def test_job_download_serves_only_files_the_job_service_wrote(tmp_path: Path, monkeypatch) -> None:
+    session_factory = build_session_factory(tmp_path)
+    service = ReportJobService(max_workers=1, output_dir=str(tmp_path / "reports"), session_factory=session_factory)
+    monkeypatch.setattr(report, "report_jobs", service)
+    with session_factory() as session:
+        job = service.submit(session, lambda _: b"%PDF-1.4 test")
+    service.executor.shutdown(wait=True)
+
+    with session_factory() as session:
+        # /report/attach rows default to "completed" and carry a caller-supplied path.
+        attached = ReportRun(source="n8n", pdf_path_or_url="/etc/passwd")
+        escaped = ReportRun(source=JOB_SOURCE, status=JOB_COMPLETED, pdf_path_or_url=str(tmp_path / "reports" / ".." / "jobs.db"))
+        session.add_all([attached, escaped])
+        session.commit()
+
+        assert Path(report.get_report_job_pdf(job.id, session).path).read_bytes() == b"%PDF-1.4 test"
+        for report_run in (attached, escaped):
+            with pytest.raises(HTTPException) as error:
+                report.get_report_job_pdf(report_run.id, session)
+            assert error.value.status_code == 404
+
+
+def test_purge_deletes_finished_jobs_and_files_past_retention(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(get_settings(), "report_job_retention_days", 7)
+    session_factory = build_session_factory(tmp_path)
+    output_dir = tmp_path / "reports"
+    service = ReportJobService(max_workers=1, output_dir=str(output_dir), session_factory=session_factory)
+    with session_factory() as session:
+        old, recent = (service.submit(session, lambda _: b"%PDF-1.4 test") for _ in range(2))
+        old_id, recent_id = old.id, recent.id
+    service.executor.shutdown(wait=True)
+
+    long_ago = datetime.now(timezone.utc) - timedelta(days=30)
+    stray = output_dir / "report-999.pdf"
+    stray.write_bytes(b"%PDF-1.4 orphan")
+    os.utime(stray, (long_ago.timestamp(), long_ago.timestamp()))
+    with session_factory() as session:
+        session.get(ReportRun, old_id).created_at = long_ago
+        session.add(ReportRun(source="n8n", pdf_path_or_url="/etc/passwd", created_at=long_ago))
+        session.commit()
+
+        assert service.purge_expired(session) == 1
+        assert session.get(ReportRun, old_id) is None
+        assert session.get(ReportRun, recent_id) is not None
+        assert session.scalar(select(ReportRun).where(ReportRun.source == "n8n")) is not None
+    assert sorted(path.name for path in output_dir.iterdir()) == [f"report-{recent_id}.pdf"]
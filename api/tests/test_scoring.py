@@ -1,6 +1,6 @@
 from datetime import datetime, timezone
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, delete, select
 from sqlalchemy.orm import Session
 
 from app.db import Base
@@ -8,7 +8,9 @@ from app.models.enums import ChannelEnum, PainCategoryEnum
 from app.models.interview import Interview
 from app.models.pain_point import PainPoint
 from app.models.respondent import Respondent
-from app.services.scoring import calculate_impact_hours_per_week, upsert_score
+from app.models.score import Score
+from app.services.scoring import calculate_impact_hours_per_week, recompute_scores, upsert_score
+from app.services.seed import seed_demo_data
 
 
 def build_session() -> Session:
@@ -88,3 +90,21 @@ def test_upsert_score_sets_priority_and_quick_win() -> None:
     assert score.priority_score > 0
     assert score.impact_hours_per_week == 20.0
     assert score.quick_win is False
+
+
+def test_recompute_scores_matches_per_item_scoring() -> None:
+    session = build_session()
+    seed_demo_data(session, interview_count=20)
+    # Seeding scores each row before later repeats exist, so re-score per item first.
+    per_item = [upsert_score(session, pain_point) for pain_point in session.scalars(select(PainPoint)).all()]
+    session.commit()
+    expected = {score.pain_point_id: (score.priority_score, score.confidence_score, score.quick_win) for score in per_item}
+
+    session.execute(delete(Score).where(Score.pain_point_id.in_(list(expected)[:3])))
+    session.commit()
+
+    results = recompute_scores(session)
+    assert {score.pain_point_id: (score.priority_score, score.confidence_score, score.quick_win) for score in results} == expected
+
+    single = recompute_scores(session, pain_point_id=results[0].pain_point_id)
+    assert [score.pain_point_id for score in single] == [results[0].pain_point_id]
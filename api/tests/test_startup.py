@@ -0,0 +1,12 @@
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def test_app_import_defers_heavy_optional_modules() -> None:
+    script = "import sys, app.main; print(sorted(m for m in ('httpx', 'jinja2', 'weasyprint', 'reportlab') if m in sys.modules))"
+    result = subprocess.run([sys.executable, "-c", script], cwd=ROOT, capture_output=True, text=True, check=True)
+
+    assert result.stdout.strip() == "[]"
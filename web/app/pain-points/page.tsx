@@ -5,7 +5,7 @@ import { useEffect, useMemo, useState } from "react";
 
 import { AppShell } from "@/components/AppShell";
 import { apiFetch } from "@/lib/api";
-import type { PainPointListItem } from "@/lib/types";
+import type { PainPointListItem, PainPointListPage } from "@/lib/types";
 
 const categories = [
   "all",
@@ -22,6 +22,7 @@ const categories = [
 
 export default function PainPointsPage() {
   const [items, setItems] = useState<PainPointListItem[]>([]);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
   const [team, setTeam] = useState("all");
   const [category, setCategory] = useState("all");
   const [priorityMin, setPriorityMin] = useState("");
@@ -31,7 +32,7 @@ export default function PainPointsPage() {
     return ["all", ...Array.from(new Set(items.map((item) => item.team)))];
   }, [items]);
 
-  useEffect(() => {
+  const filterParams = useMemo(() => {
     const params = new URLSearchParams();
     if (team !== "all") {
       params.set("team", team);
@@ -42,11 +43,29 @@ export default function PainPointsPage() {
     if (priorityMin) {
       params.set("priority_min", priorityMin);
     }
+    return params;
+  }, [team, category, priorityMin]);
 
-    apiFetch<PainPointListItem[]>(`/pain-points?${params.toString()}`)
-      .then(setItems)
+  useEffect(() => {
+    apiFetch<PainPointListPage>(`/pain-points?${filterParams.toString()}`)
+      .then((page) => {
+        setItems(page.items);
+        setNextCursor(page.next_cursor);
+      })
       .catch((err) => setError(err.message));
-  }, [team, category, priorityMin]);
+  }, [filterParams]);
+
+  const loadMore = () => {
+    if (!nextCursor) return;
+    const params = new URLSearchParams(filterParams);
+    params.set("cursor", nextCursor);
+    apiFetch<PainPointListPage>(`/pain-points?${params.toString()}`)
+      .then((page) => {
+        setItems((current) => [...current, ...page.items]);
+        setNextCursor(page.next_cursor);
+      })
+      .catch((err) => setError(err.message));
+  };
 
   return (
     <AppShell>
@@ -126,6 +145,13 @@ export default function PainPointsPage() {
             ))}
           </tbody>
         </table>
+        {nextCursor ? (
+          <div className="p-3 text-center">
+            <button className="btn-secondary" onClick={loadMore}>
+              Load more
+            </button>
+          </div>
+        ) : null}
       </section>
     </AppShell>
   );
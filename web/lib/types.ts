@@ -39,6 +39,11 @@ export type PainPointListItem = {
   sensitive_flag: boolean;
 };
 
+export type PainPointListPage = {
+  items: PainPointListItem[];
+  next_cursor: string | null;
+};
+
 export type PainPointDetail = {
   id: number;
   interview_id: number;